@@ -4,13 +4,15 @@ Django Admin Configuration for the Tech Pulse Articles Application.
 This module customizes the Django admin interface:
 - SourceAdmin: Manages news sources with fetch tracking
 - CategoryAdmin: Manages article categories
+- CategoryRuleAdmin: Manages keyword rules used for auto-categorization
 - ArticleAdmin: Manages aggregated articles with filters
 
 Includes custom filters, search fields, and list displays.
 Applies the duplicate button fix pattern.
 """
 from django.contrib import admin
-from .models import Source, Category, Article
+from .counts import with_article_counts
+from .models import Source, Category, CategoryRule, Article
 
 
 @admin.register(Source)
@@ -29,14 +31,38 @@ class SourceAdmin(admin.ModelAdmin):
     ]
     list_filter = ['source_type', 'is_active', 'created_at']
     search_fields = ['name', 'url']
-    readonly_fields = ['created_at', 'updated_at', 'last_fetched']
+    readonly_fields = [
+        'created_at',
+        'updated_at',
+        'last_fetched',
+        'next_fetch_at',
+        'consecutive_failures',
+        'last_fetch_seconds',
+        'idle_fetches',
+        'etag',
+        'last_modified',
+        'content_hash',
+    ]
     
     fieldsets = (
         ('Basic Information', {
             'fields': ('name', 'url', 'source_type')
         }),
         ('Fetch Settings', {
-            'fields': ('is_active', 'fetch_interval', 'last_fetched')
+            'fields': (
+                'is_active',
+                'fetch_interval',
+                'last_fetched',
+                'next_fetch_at',
+                'consecutive_failures',
+                'last_fetch_seconds',
+                'idle_fetches',
+                'retention_days',
+            )
+        }),
+        ('Feed Validators', {
+            'fields': ('etag', 'last_modified', 'content_hash'),
+            'classes': ('collapse',)
         }),
         ('Timestamps', {
             'fields': ('created_at', 'updated_at'),
@@ -50,10 +76,24 @@ class SourceAdmin(admin.ModelAdmin):
         extra_context['has_add_permission'] = False
         return super().changelist_view(request, extra_context)
     
+    def get_queryset(self, request):
+        """Count articles for the whole changelist in one query"""
+        return with_article_counts(super().get_queryset(request))
+    
     def get_article_count(self, obj):
         """Return count of articles from this source"""
-        return obj.articles.count()
+        return obj.num_articles
     get_article_count.short_description = 'Articles'
+    get_article_count.admin_order_field = 'num_articles'
+
+
+class CategoryRuleInline(admin.TabularInline):
+    """
+    Inline editor for a category's auto-categorization rules.
+    """
+    model = CategoryRule
+    extra = 0
+    fields = ['pattern', 'match_type', 'weight', 'is_active']
 
 
 @admin.register(Category)
@@ -62,6 +102,7 @@ class CategoryAdmin(admin.ModelAdmin):
     Admin interface for Category model.
     Shows category details and article counts.
     """
+    inlines = [CategoryRuleInline]
     list_display = ['name', 'slug', 'get_article_count', 'created_at']
     search_fields = ['name', 'description']
     prepopulated_fields = {'slug': ('name',)}
@@ -73,10 +114,34 @@ class CategoryAdmin(admin.ModelAdmin):
         extra_context['has_add_permission'] = False
         return super().changelist_view(request, extra_context)
     
+    def get_queryset(self, request):
+        """Count articles for the whole changelist in one query"""
+        return with_article_counts(super().get_queryset(request))
+    
     def get_article_count(self, obj):
         """Return count of articles in this category"""
-        return obj.articles.count()
+        return obj.num_articles
     get_article_count.short_description = 'Articles'
+    get_article_count.admin_order_field = 'num_articles'
+
+
+@admin.register(CategoryRule)
+class CategoryRuleAdmin(admin.ModelAdmin):
+    """
+    Admin interface for CategoryRule model.
+    Changes are picked up by the next fetch without a deploy.
+    """
+    list_display = ['pattern', 'category', 'match_type', 'weight', 'is_active', 'updated_at']
+    list_editable = ['weight', 'is_active']
+    list_filter = ['category', 'match_type', 'is_active']
+    search_fields = ['pattern']
+    readonly_fields = ['created_at', 'updated_at']
+    
+    def changelist_view(self, request, extra_context=None):
+        """Remove the duplicate ADD CATEGORY RULE + button from the changelist page"""
+        extra_context = extra_context or {}
+        extra_context['has_add_permission'] = False
+        return super().changelist_view(request, extra_context)
 
 
 @admin.register(Article)
@@ -94,7 +159,8 @@ class ArticleAdmin(admin.ModelAdmin):
         'fetched_at'
     ]
     list_filter = ['source', 'category', 'published_at', 'fetched_at']
-    search_fields = ['title', 'content', 'summary', 'author']
+    # content is stored compressed, so it cannot be searched with icontains
+    search_fields = ['title', 'summary', 'author']
     prepopulated_fields = {'slug': ('title',)}
     readonly_fields = ['fetched_at', 'updated_at']
     date_hierarchy = 'published_at'
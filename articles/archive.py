@@ -0,0 +1,185 @@
+"""
+Cold storage for old articles.
+
+This module keeps the articles table (and its indexes) sized to what
+readers actually browse:
+- retention_cutoff: Publication time before which a source's articles are archived
+- ArchiveWriter: Append serialized articles to monthly gzip segments
+- archive_chunk: Archive one chunk of articles and delete it from the database
+- read_archive: Stream archived articles back, by publication date range
+
+Segments are ``articles-YYYY-MM.jsonl.gz`` files in
+``ARTICLE_ARCHIVE_DIR``, one JSON article per line in the same shape as
+``/api/articles/<id>/``, grouped by the UTC month of ``published_at``.
+Every chunk is appended as a separate gzip member, so segments can grow
+without being rewritten and ``gzip`` tools still read them whole.
+
+A chunk is written (and fsynced) before it is deleted, so a crash can
+only archive a chunk twice, never lose it; readers skip the repeated
+ids. Run one archiver at a time.
+"""
+import gzip
+import json
+import os
+from collections import Counter
+from datetime import datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import invalidate_api_cache
+from .conditional import CATALOG_GENERATION
+from .counts import apply_count_deltas
+from .fastpath import FastJSONRenderer
+from .models import Source, Category, Article, ArticleTombstone, Generation
+from .signals import batched_article_deletes
+
+
+SEGMENT_PATTERN = 'articles-*.jsonl.gz'
+
+
+def archive_dir():
+    return Path(getattr(settings, 'ARTICLE_ARCHIVE_DIR', Path(settings.BASE_DIR) / 'archive'))
+
+
+def segment_month(moment):
+    """``YYYY-MM`` of the segment holding articles published at ``moment``."""
+    return moment.astimezone(dt_timezone.utc).strftime('%Y-%m')
+
+
+def segment_path(month):
+    return archive_dir() / f'articles-{month}.jsonl.gz'
+
+
+def retention_cutoff(source, now=None):
+    """
+    Return the publication time before which articles of ``source`` are cold.
+
+    ``fetch_articles`` skips entries older than the same cutoff, so
+    archived articles are never stored again.
+
+    Args:
+        source: Source (its ``retention_days`` wins over ARTICLE_RETENTION_DAYS)
+        now: reference time (defaults to the current time)
+
+    Returns:
+        datetime: cutoff, or None if the source keeps everything
+    """
+    days = source.retention_days or getattr(settings, 'ARTICLE_RETENTION_DAYS', None)
+    if not days:
+        return None
+    return (now or timezone.now()) - timedelta(days=days)
+
+
+class ArchiveWriter:
+    """Append article representations to their monthly segments."""
+
+    def __init__(self):
+        self.renderer = FastJSONRenderer()
+        self.segments = set()
+
+    def write(self, records):
+        """
+        Append ``records`` (dicts with a ``published_at`` datetime kept
+        alongside) and flush them to disk.
+
+        Args:
+            records: list of ``(published_at, representation)`` pairs
+        """
+        by_month = {}
+        for published_at, data in records:
+            by_month.setdefault(segment_month(published_at), []).append(data)
+
+        archive_dir().mkdir(parents=True, exist_ok=True)
+        for month, rows in sorted(by_month.items()):
+            path = segment_path(month)
+            with open(path, 'ab') as raw:
+                with gzip.GzipFile(fileobj=raw, mode='wb') as member:
+                    member.write(b''.join(self.renderer.render(row) + b'\n' for row in rows))
+                raw.flush()
+                os.fsync(raw.fileno())
+            self.segments.add(path.name)
+
+
+def archive_chunk(rows, records, writer):
+    """
+    Archive one chunk of articles, then delete it from the database.
+
+    The per-article delete signals are batched: tombstones are bulk
+    inserted and the cache generations bumped once for the chunk.
+
+    Args:
+        rows: ``values()`` rows with ``id``, ``url``, ``source_id``,
+            ``category_id`` and ``published_at``
+        records: their serialized representations, in the same order
+        writer: ArchiveWriter
+    """
+    writer.write([(row['published_at'], data) for row, data in zip(rows, records)])
+
+    ids = [row['id'] for row in rows]
+    source_deltas = Counter(row['source_id'] for row in rows)
+    category_deltas = Counter(row['category_id'] for row in rows)
+    now = timezone.now()
+
+    with transaction.atomic():
+        ArticleTombstone.objects.bulk_create([
+            ArticleTombstone(article_id=row['id'], url=row['url'], deleted_at=now) for row in rows
+        ])
+        with batched_article_deletes():
+            Article.objects.filter(pk__in=ids).delete()
+        apply_count_deltas(Source, {pk: -count for pk, count in source_deltas.items()})
+        apply_count_deltas(Category, {pk: -count for pk, count in category_deltas.items()})
+        Generation.bump(CATALOG_GENERATION)
+        invalidate_api_cache()
+
+
+def parse_published(value):
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def segment_months(start=None, end=None):
+    """Yield the archive segments overlapping ``[start, end)``, oldest first."""
+    first = segment_month(start) if start else None
+    last = segment_month(end) if end else None
+    for path in sorted(archive_dir().glob(SEGMENT_PATTERN)):
+        month = path.name[len('articles-'):-len('.jsonl.gz')]
+        if (first is None or month >= first) and (last is None or month <= last):
+            yield path
+
+
+def read_archive(start=None, end=None, source=None, category=None):
+    """
+    Stream archived articles published in ``[start, end)``.
+
+    Only the segments overlapping the range are opened. Articles come
+    month by month, oldest month first, and in archive order within a
+    month.
+
+    Args:
+        start: earliest ``published_at`` (inclusive), or None
+        end: latest ``published_at`` (exclusive), or None
+        source: only articles of this source ID
+        category: only articles of this category ID
+
+    Yields:
+        tuple: ``(line, article)``; the encoded JSON line and its parsed form
+    """
+    for path in segment_months(start, end):
+        seen = set()
+        with gzip.open(path, 'rb') as segment:
+            for line in segment:
+                article = json.loads(line)
+                if article['id'] in seen:
+                    continue
+                seen.add(article['id'])
+                if source is not None and article.get('source') != source:
+                    continue
+                if category is not None and article.get('category') != category:
+                    continue
+                if start or end:
+                    published_at = parse_published(article['published_at'])
+                    if (start and published_at < start) or (end and published_at >= end):
+                        continue
+                yield line, article
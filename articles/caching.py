@@ -0,0 +1,118 @@
+"""
+Response caching for the Tech Pulse Articles API.
+
+This module caches read-only API responses:
+- API_GENERATION: Generation key bumped whenever API-visible data changes
+- invalidate_api_cache: Bump it (called by signals and the fetch commands)
+- CachedResponseMixin: Serve list/retrieve responses from the cache
+
+Cache keys include the ``api`` generation, so every write makes all
+previously cached responses unreachable immediately, whichever process
+served them; stale entries simply age out. Checking the generation is
+one primary key lookup per request, instead of the list queries plus
+serialization.
+
+The ``ETag`` and ``Last-Modified`` of a response (see conditional.py)
+are cached with it, so a hit answers conditional requests without
+recomputing them. List this mixin before ``ConditionalResponseMixin``.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe, urlencode
+from rest_framework.response import Response
+
+from .models import Generation
+
+
+API_GENERATION = 'api'
+
+# Response headers cached along with the data
+CACHED_HEADERS = ('ETag', 'Last-Modified')
+
+
+def invalidate_api_cache():
+    """Make every cached API response stale."""
+    Generation.bump(API_GENERATION)
+
+
+class CachedResponseMixin:
+    """
+    Cache ``list`` and ``retrieve`` responses of a viewset.
+
+    Only JSON responses are cached (the browsable API renders
+    per-user forms). The key is built from the view, the URL kwargs,
+    the host and the sorted query parameters, so ``?a=1&b=2`` and
+    ``?b=2&a=1`` share an entry.
+    """
+    cached_renderer_formats = ('json',)
+
+    def get_response_cache(self):
+        return caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+
+    def get_cache_key(self, request, generation):
+        params = sorted(
+            (key, value)
+            for key, values in request.query_params.lists()
+            for value in values
+        )
+        raw = '|'.join([
+            self.basename,
+            self.action,
+            urlencode(sorted(self.kwargs.items())),
+            request.build_absolute_uri(request.path),
+            request.accepted_renderer.format,
+            urlencode(params),
+        ])
+        return f'api-response:{generation}:{hashlib.md5(raw.encode("utf-8")).hexdigest()}'
+
+    def is_cacheable(self, request):
+        return (
+            request.method == 'GET'
+            and request.accepted_renderer.format in self.cached_renderer_formats
+        )
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        """
+        Return the cached response for ``request``, or call ``handler``
+        and cache its data and validators if it succeeded.
+        """
+        if not self.is_cacheable(request):
+            return handler(request, *args, **kwargs)
+
+        cache = self.get_response_cache()
+        key = self.get_cache_key(request, Generation.current(API_GENERATION))
+
+        # Set on the underlying HttpRequest so middleware can see it too
+        entry = cache.get(key)
+        if entry is not None:
+            request._request.api_cache_hit = True
+            return self.cached_hit(request, *entry)
+
+        request._request.api_cache_hit = False
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            headers = {name: response[name] for name in CACHED_HEADERS if response.has_header(name)}
+            cache.set(key, (response.data, headers), getattr(settings, 'API_CACHE_TIMEOUT', 600))
+        return response
+
+    def cached_hit(self, request, data, headers):
+        """Answer from a cache entry: 304 if the client's copy matches it."""
+        response = get_conditional_response(
+            request._request,
+            etag=headers.get('ETag'),
+            last_modified=parse_http_date_safe(headers.get('Last-Modified')),
+        )
+        if response is None:
+            response = Response(data)
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
@@ -0,0 +1,125 @@
+"""
+URL canonicalization for the Tech Pulse Articles Application.
+
+Feeds link to the same article in many spellings: with ``utm_*`` and
+other known tracking parameters, with a ``#fragment``, over http or https,
+with an upper-case host or an explicit default port. This module maps
+them onto one form:
+- canonicalize_url: The URL stored on the article (tracking removed)
+- url_key: Its identity, which also ignores the scheme
+- url_hash: A signed 64-bit hash of the key, for a narrow index
+- URLHashField: Column that keeps ``url_hash`` in step with a URL field
+
+Articles are looked up by ``url_hash`` instead of probing the unique
+index on the (up to 500 character) ``url`` column; the key is compared
+after the lookup, so a hash collision can never merge two articles.
+"""
+import hashlib
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+
+from django.db import models
+
+
+# Query parameters known to only track where a click came from. Generic
+# names such as ``ref`` or ``source`` can select content, so they are kept.
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'gbraid', 'wbraid', 'msclkid', 'yclid', 'twclid',
+    'igshid', 'mc_cid', 'mc_eid', '_hsenc', '_hsmi', 'mkt_tok',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url):
+    """
+    Return the canonical spelling of an article URL.
+
+    The scheme and host are lower-cased, default ports, the fragment and
+    tracking parameters are removed, and the remaining query parameters
+    are sorted. The path is kept as is. Anything that does not parse as
+    an http(s) URL is returned stripped but otherwise unchanged.
+
+    Args:
+        url: URL as found in the feed
+
+    Returns:
+        str: canonical URL
+    """
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    netloc = parts.hostname
+    if ':' in netloc:
+        netloc = f'[{netloc}]'  # IPv6 literal
+    if parts.username or parts.password:
+        netloc = f'{parts.netloc.rpartition("@")[0]}@{netloc}'
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc = f'{netloc}:{port}'
+
+    # Parameters are filtered and sorted as written, without re-encoding
+    query = sorted(
+        param for param in parts.query.split('&')
+        if param and not is_tracking_param(unquote_plus(param.partition('=')[0]))
+    )
+    return urlunsplit((scheme, netloc, parts.path or '/', '&'.join(query), ''))
+
+
+def url_key(url):
+    """The canonical URL without its scheme: http and https links are the same article."""
+    canonical = canonicalize_url(url)
+    scheme, sep, rest = canonical.partition('://')
+    return rest if sep and scheme in DEFAULT_PORTS else canonical
+
+
+def url_hash(url):
+    """
+    Hash an article URL for the ``url_hash`` index.
+
+    Args:
+        url: article URL, canonical or not
+
+    Returns:
+        int: signed 64-bit hash of ``url_key(url)``
+    """
+    digest = hashlib.blake2b(url_key(url).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+class URLHashField(models.BigIntegerField):
+    """
+    ``url_hash`` of another field of the model, computed on every save.
+
+    Like ``auto_now``, the value is set in ``pre_save``, which ``save()``
+    and ``bulk_create()`` both call, so it never needs to be set by hand.
+    """
+
+    def __init__(self, *args, url_field='url', **kwargs):
+        self.url_field = url_field
+        kwargs.setdefault('editable', False)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.url_field != 'url':
+            kwargs['url_field'] = self.url_field
+        if kwargs.get('editable') is False:
+            del kwargs['editable']
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        value = url_hash(getattr(model_instance, self.url_field))
+        setattr(model_instance, self.attname, value)
+        return value
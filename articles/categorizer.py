@@ -0,0 +1,199 @@
+"""
+Keyword based article categorization for the Tech Pulse Articles Application.
+
+This module assigns categories to articles from keywords in their text:
+- CATEGORY_KEYWORDS: Built-in keyword lists, used until CategoryRule rows exist
+- KeywordCategorizer: Compiled matcher with an in-memory category cache
+- get_categorizer: Process-wide categorizer, rebuilt when the rules change
+
+All keywords are compiled into one word-bounded regular expression, so
+classifying an entry is a single scan of its text, and categories are
+loaded with one query per categorizer instead of one per entry.
+Build a categorizer once per run and reuse it.
+"""
+import re
+
+from .models import Category, CategoryRule, Generation
+
+
+# Keyword mappings for categories (matching DB category names).
+# Order matters: on equal scores the earlier category wins.
+CATEGORY_KEYWORDS = {
+    'Artificial Intelligence': ['artificial intelligence', 'machine learning', 'deep learning',
+                                'neural network', 'ai', 'gpt', 'chatgpt', 'llm', 'openai',
+                                'generative', 'cognitive computing', 'ml', 'ai model'],
+    'Startups': ['startup', 'startups', 'funding', 'venture capital', 'vc', 'seed round',
+                 'series a', 'series b', 'entrepreneur', 'entrepreneurship', 'founder',
+                 'unicorn', 'investment', 'investors'],
+    'Mobile': ['mobile', 'android', 'ios', 'swift', 'kotlin', 'flutter', 'react native',
+               'mobile app', 'smartphone', 'iphone', 'samsung', 'app store', 'play store'],
+    'Security': ['security', 'cybersecurity', 'hack', 'breach', 'vulnerability',
+                 'encryption', 'malware', 'ransomware', 'firewall', 'privacy',
+                 'data breach', 'cyber attack', 'phishing'],
+    'Business': ['business', 'corporate', 'economics', 'finance', 'strategy', 'merger',
+                 'acquisition', 'ceo', 'revenue', 'profit', 'market', 'commerce',
+                 'enterprise', 'management'],
+    'Science': ['science', 'scientific', 'research', 'space', 'physics', 'biology',
+                'chemistry', 'astronomy', 'nasa', 'laboratory', 'study', 'experiment',
+                'discovery', 'quantum'],
+    'Software': ['software', 'programming', 'developer', 'coding', 'code', 'framework',
+                 'library', 'api', 'web development', 'frontend', 'backend', 'javascript',
+                 'python', 'java', 'devops', 'ci/cd', 'github', 'open source'],
+    'Technology': ['technology', 'tech', 'innovation', 'digital', 'gadget', 'device',
+                   'electronics', 'hardware', 'computing', 'internet', 'web', 'online',
+                   'platform', 'service', 'product', 'launch', 'release', 'announcement'],
+}
+
+
+RULES_GENERATION = 'category_rules'
+
+
+class KeywordCategorizer:
+    """
+    Scores text against weighted rules and returns the best category.
+
+    Each distinct keyword found adds its weight to the category that
+    lists it, each matching regular expression rule adds its weight,
+    and the highest scoring category wins.
+    """
+
+    def __init__(self, keywords=None, rules=None, version=None):
+        """
+        Args:
+            keywords: dict of category name -> keyword list (weight 1 each);
+                defaults to ``CATEGORY_KEYWORDS`` when no rules are given
+            rules: iterable of ``(category name, pattern, match type, weight)``
+            version: rules generation this categorizer was built from
+        """
+        if rules is None:
+            keywords = CATEGORY_KEYWORDS if keywords is None else keywords
+            rules = [
+                (name, word, 'KEYWORD', 1)
+                for name, words in keywords.items()
+                for word in words
+            ]
+        self.version = version
+
+        # Category order, used to break ties in favour of the first listed
+        self.category_names = []
+
+        self.keyword_weights = {}
+        self.regex_rules = []
+        for name, pattern, match_type, weight in rules:
+            if name not in self.category_names:
+                self.category_names.append(name)
+            if match_type == 'REGEX':
+                self.regex_rules.append((re.compile(pattern, re.IGNORECASE), name, weight))
+            else:
+                self.keyword_weights.setdefault(pattern.lower(), []).append((name, weight))
+
+        # Longest first so multi-word keywords win over their prefixes
+        words = sorted(self.keyword_weights, key=len, reverse=True)
+        self.pattern = re.compile(
+            r'\b(?:' + '|'.join(re.escape(word) for word in words) + r')\b'
+        ) if words else None
+
+        # A match on "data breach" also counts "breach"
+        self.implied = {
+            word: {other for other in words if f' {other} ' in f' {word} '}
+            for word in words
+        }
+
+        self._categories = None
+
+    @classmethod
+    def from_database(cls):
+        """
+        Build a categorizer from the active ``CategoryRule`` rows.
+        Falls back to ``CATEGORY_KEYWORDS`` while no rules exist.
+        """
+        version = Generation.current(RULES_GENERATION)
+        rules = list(
+            CategoryRule.objects.filter(is_active=True)
+            .order_by('id')
+            .values_list('category__name', 'pattern', 'match_type', 'weight')
+        )
+        return cls(rules=rules or None, version=version)
+
+    @property
+    def categories(self):
+        """Category instances by name, loaded once."""
+        if self._categories is None:
+            self._categories = {category.name: category for category in Category.objects.all()}
+        return self._categories
+
+    def scores(self, text):
+        """
+        Score ``text`` against every category.
+
+        Args:
+            text: text to classify (case insensitive)
+
+        Returns:
+            dict: category name -> score, for categories with a score above 0
+        """
+        scores = {}
+
+        if self.pattern is not None:
+            found = set()
+            for match in set(self.pattern.findall(text.lower())):
+                found |= self.implied[match]
+            for word in found:
+                for name, weight in self.keyword_weights[word]:
+                    scores[name] = scores.get(name, 0) + weight
+
+        for regex, name, weight in self.regex_rules:
+            if regex.search(text):
+                scores[name] = scores.get(name, 0) + weight
+
+        return {name: score for name, score in scores.items() if score > 0}
+
+    def classify_name(self, text):
+        """
+        Return the name of the best matching category, or None.
+        """
+        scores = self.scores(text)
+        if not scores:
+            return None
+        best = max(scores.values())
+        return next(name for name in self.category_names if scores.get(name) == best)
+
+    def classify(self, text):
+        """
+        Return the best matching Category, or None.
+
+        Categories that are not in the database are treated as no match.
+        """
+        name = self.classify_name(text)
+        if name is None:
+            return None
+        return self.categories.get(name)
+
+    def classify_many(self, texts):
+        """
+        Classify a batch of texts.
+
+        Args:
+            texts: iterable of strings
+
+        Returns:
+            list: Category or None per text, in the same order
+        """
+        return [self.classify(text) for text in texts]
+
+
+_cached = None
+
+
+def get_categorizer():
+    """
+    Return a categorizer for the current rules.
+
+    The compiled categorizer is kept in memory and rebuilt only when
+    the ``category_rules`` generation has moved on, which costs one
+    small query per call.
+    """
+    global _cached
+    if _cached is None or _cached.version != Generation.current(RULES_GENERATION):
+        _cached = KeywordCategorizer.from_database()
+    return _cached
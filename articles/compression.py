@@ -0,0 +1,343 @@
+"""
+Compressed storage for article text.
+
+``Article.content`` holds the full text or HTML of every article and is
+most of the database. This module stores it compressed:
+- compress / decompress: Encode text with the configured codec and dictionary
+- train_dictionary: Build a dictionary of the substrings feed content repeats
+- CompressedTextField: TextField stored compressed, decompressed when first read
+- register_sqlite_functions: Expose ``tp_decompress()`` to SQL on SQLite
+
+Stored values start with a one byte codec tag (plus a four byte
+dictionary id for dictionary codecs), so rows written with an older
+codec or dictionary stay readable. ``ARTICLE_CONTENT_COMPRESSION``
+picks ``zlib`` (standard library) or ``zstd`` (needs the ``zstandard``
+package); ``ARTICLE_CONTENT_DICTIONARY`` points to a dictionary made by
+``compress_content --train``. Older dictionaries are found by id among
+the ``*.dict`` files next to it.
+
+PostgreSQL already compresses large text values itself (TOAST), and its
+full-text index reads the column directly, so there the field is a
+plain ``text`` column.
+"""
+import re
+import zlib
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from django.db.backends.signals import connection_created
+from django.db.models.query_utils import DeferredAttribute
+from django.dispatch import receiver
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+
+RAW = 0
+ZLIB = 1
+ZLIB_DICT = 2
+ZSTD = 3
+ZSTD_DICT = 4
+DICTIONARY_CODECS = {ZLIB_DICT, ZSTD_DICT}
+
+# Shorter values are stored as they are; compression would only add overhead
+MIN_COMPRESS_SIZE = 64
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+_dictionaries = {}
+_zstd = {}
+
+
+def stores_compressed(connection):
+    """Whether ``CompressedTextField`` columns are compressed on this database."""
+    return connection.vendor != 'postgresql'
+
+
+def dictionary_id(data):
+    """Id a dictionary is recorded under in the values it compressed."""
+    return zlib.crc32(data) or 1
+
+
+def load_dictionary(path):
+    """Read a dictionary file once; returns ``(id, bytes)``."""
+    path = Path(path)
+    if path not in _dictionaries:
+        data = path.read_bytes()
+        _dictionaries[path] = (dictionary_id(data), data)
+    return _dictionaries[path]
+
+
+def current_dictionary():
+    """The ``(id, bytes)`` of ``ARTICLE_CONTENT_DICTIONARY``, or None."""
+    path = getattr(settings, 'ARTICLE_CONTENT_DICTIONARY', None)
+    return load_dictionary(path) if path else None
+
+
+def find_dictionary(dict_id):
+    """
+    Return the dictionary bytes recorded as ``dict_id``.
+
+    Raises:
+        ValueError: if no dictionary file with that id is available
+    """
+    current = current_dictionary()
+    if current and current[0] == dict_id:
+        return current[1]
+    path = getattr(settings, 'ARTICLE_CONTENT_DICTIONARY', None)
+    if path:
+        for candidate in sorted(Path(path).parent.glob('*.dict')):
+            found_id, data = load_dictionary(candidate)
+            if found_id == dict_id:
+                return data
+    raise ValueError(f'Content was compressed with dictionary {dict_id:08x}, which is not available')
+
+
+def current_codec():
+    """The ``(codec, dictionary)`` new values are compressed with."""
+    name = getattr(settings, 'ARTICLE_CONTENT_COMPRESSION', 'zlib')
+    if name not in ('zlib', 'zstd'):
+        raise ImproperlyConfigured(f"ARTICLE_CONTENT_COMPRESSION must be 'zlib' or 'zstd', not {name!r}.")
+    if name == 'zstd' and zstandard is None:
+        raise ImproperlyConfigured("ARTICLE_CONTENT_COMPRESSION = 'zstd' needs the zstandard package.")
+    dictionary = current_dictionary()
+    if name == 'zstd':
+        return (ZSTD_DICT if dictionary else ZSTD), dictionary
+    return (ZLIB_DICT if dictionary else ZLIB), dictionary
+
+
+def zstd_codec(dict_id, data):
+    """Cached ``(compressor, decompressor)`` pair for a dictionary (or none)."""
+    if dict_id not in _zstd:
+        dict_data = zstandard.ZstdCompressionDict(data) if data else None
+        _zstd[dict_id] = (
+            zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dict_data),
+            zstandard.ZstdDecompressor(dict_data=dict_data),
+        )
+    return _zstd[dict_id]
+
+
+def compress(text):
+    """
+    Compress ``text`` with the configured codec and dictionary.
+
+    Args:
+        text: str to store
+
+    Returns:
+        bytes: tagged value for the database
+    """
+    raw = text.encode('utf-8')
+    if len(raw) < MIN_COMPRESS_SIZE:
+        return bytes([RAW]) + raw
+
+    codec, dictionary = current_codec()
+    header = bytes([codec])
+    if dictionary:
+        header += dictionary[0].to_bytes(4, 'big')
+
+    if codec in (ZSTD, ZSTD_DICT):
+        compressor = zstd_codec(dictionary[0] if dictionary else 0, dictionary and dictionary[1])[0]
+        body = compressor.compress(raw)
+    elif dictionary:
+        compressor = zlib.compressobj(ZLIB_LEVEL, zdict=dictionary[1])
+        body = compressor.compress(raw) + compressor.flush()
+    else:
+        body = zlib.compress(raw, ZLIB_LEVEL)
+
+    if len(header) + len(body) >= 1 + len(raw):
+        return bytes([RAW]) + raw
+    return header + body
+
+
+def decompress(value):
+    """
+    Return the text stored in ``value``.
+
+    Text that was never compressed (a ``str``, or bytes without a codec
+    tag, as left by older rows) is returned decoded as it is.
+
+    Args:
+        value: bytes as stored, str, or None
+
+    Returns:
+        str or None
+    """
+    if value is None or isinstance(value, str):
+        return value
+    value = bytes(value)
+    if not value:
+        return ''
+    codec = value[0]
+    if codec == RAW:
+        return value[1:].decode('utf-8')
+    if codec == ZLIB:
+        return zlib.decompress(value[1:]).decode('utf-8')
+    if codec in DICTIONARY_CODECS:
+        dict_id = int.from_bytes(value[1:5], 'big')
+        data = find_dictionary(dict_id)
+        if codec == ZLIB_DICT:
+            decompressor = zlib.decompressobj(zdict=data)
+            return (decompressor.decompress(value[5:]) + decompressor.flush()).decode('utf-8')
+        return zstd_decompress(dict_id, data, value[5:])
+    if codec == ZSTD:
+        return zstd_decompress(0, None, value[1:])
+    return value.decode('utf-8')
+
+
+def zstd_decompress(dict_id, data, body):
+    if zstandard is None:
+        raise ImproperlyConfigured('Content compressed with zstd needs the zstandard package to be read.')
+    return zstd_codec(dict_id, data)[1].decompress(body).decode('utf-8')
+
+
+def is_current(value):
+    """Whether a stored value already uses the configured codec and dictionary."""
+    if value is None or isinstance(value, str):
+        return False
+    value = bytes(value)
+    if not value or value[0] == RAW:
+        return bool(value)
+    codec, dictionary = current_codec()
+    if value[0] != codec:
+        return False
+    return not dictionary or int.from_bytes(value[1:5], 'big') == dictionary[0]
+
+
+# Feed text splits into HTML tags and words (with their trailing space)
+TOKEN_PATTERN = re.compile(r'<[^<>]{1,120}>|[^\s<]+\s?')
+
+
+def train_dictionary(samples, size=32 * 1024):
+    """
+    Build a compression dictionary from sample article texts.
+
+    With zstd the ``zstandard`` trainer is used. For zlib, runs of up
+    to four tokens (HTML tags and words) found in many samples are
+    collected, best first, and laid out with the most useful at the
+    end, where zlib reaches them with the shortest distances.
+
+    Args:
+        samples: list of article texts
+        size: dictionary size in bytes (zlib only looks back 32 KiB)
+
+    Returns:
+        bytes: the dictionary
+    """
+    if current_codec()[0] in (ZSTD, ZSTD_DICT):
+        return zstandard.train_dictionary(size, [text.encode('utf-8') for text in samples]).as_bytes()
+
+    frequency = Counter()
+    for text in samples:
+        tokens = TOKEN_PATTERN.findall(text)
+        # Count each run once per sample: shared boilerplate beats repetition
+        frequency.update({
+            ''.join(tokens[i:i + n])
+            for n in range(1, 5)
+            for i in range(len(tokens) - n + 1)
+        })
+
+    minimum = max(2, len(samples) // 50)
+    candidates = sorted(
+        (run for run, count in frequency.items() if count >= minimum and len(run) > 3),
+        key=lambda run: frequency[run] * len(run.encode('utf-8')),
+        reverse=True,
+    )
+
+    chosen = []
+    total = 0
+    for run in candidates:
+        encoded = run.encode('utf-8')
+        if total + len(encoded) > size:
+            continue
+        if any(run in other for other in chosen):
+            continue
+        chosen.append(run)
+        total += len(encoded)
+    return ''.join(reversed(chosen)).encode('utf-8')
+
+
+class CompressedText(bytes):
+    """A value as read from the database, not decompressed yet."""
+
+
+class CompressedTextDescriptor(DeferredAttribute):
+    """Decompress the loaded value the first time the attribute is read."""
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if isinstance(value, CompressedText):
+            value = decompress(value)
+            instance.__dict__[self.field.attname] = value
+        return value
+
+    def __set__(self, instance, value):
+        # A data descriptor, so reads go through __get__ even once loaded
+        instance.__dict__[self.field.attname] = value
+
+
+class CompressedTextField(models.TextField):
+    """
+    TextField stored compressed (see the module docstring).
+
+    Model instances keep the stored bytes until the attribute is read,
+    so loading a row whose text is never used costs no decompression,
+    and saving it again does not recompress. ``values()`` and
+    ``values_list()`` return the stored ``CompressedText``; pass it to
+    ``decompress()``. Only exact lookups make sense on the column.
+    """
+    descriptor_class = CompressedTextDescriptor
+
+    def db_type(self, connection):
+        if stores_compressed(connection):
+            return models.BinaryField().db_type(connection)
+        return super().db_type(connection)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None or isinstance(value, str):
+            return value
+        return CompressedText(value)
+
+    def get_prep_value(self, value):
+        if isinstance(value, CompressedText):
+            return value
+        return super().get_prep_value(value)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        if value is None:
+            return None
+        if not stores_compressed(connection):
+            return decompress(value)
+        if isinstance(value, CompressedText):
+            return bytes(value)
+        return compress(value)
+
+    def pre_save(self, model_instance, add):
+        # The value as loaded: untouched content is written back as it is
+        if self.attname in model_instance.__dict__:
+            return model_instance.__dict__[self.attname]
+        return super().pre_save(model_instance, add)
+
+
+def sqlite_decompress(value):
+    return decompress(value)
+
+
+def register_sqlite_functions(connection):
+    """Make ``tp_decompress(value)`` available to SQL (the full-text triggers use it)."""
+    connection.connection.create_function('tp_decompress', 1, sqlite_decompress, deterministic=True)
+
+
+@receiver(connection_created)
+def setup_sqlite_connection(sender, connection, **kwargs):
+    if connection.vendor == 'sqlite':
+        register_sqlite_functions(connection)
@@ -0,0 +1,126 @@
+"""
+Conditional GET support for the Tech Pulse Articles API.
+
+This module lets polling clients skip unchanged responses:
+- CATALOG_GENERATION: Generation key bumped when articles change without
+  their own ``updated_at`` moving (renamed sources/categories, deletes)
+- ConditionalResponseMixin: ``ETag``/``Last-Modified`` on list and detail
+  responses, and ``304 Not Modified`` for matching conditional requests
+
+Validators come from one aggregate query (``MAX(updated_at)`` and
+``COUNT(*)`` over the filtered queryset) plus the generations the
+response depends on. They are checked before anything is serialized.
+Keyset (cursor) pages skip the ``COUNT(*)``, which is what keeps them
+cheap; article deletes bump the catalog generation instead. Behind
+``CachedResponseMixin`` they are only computed on cache misses.
+"""
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, urlencode
+
+from .models import Generation
+
+
+CATALOG_GENERATION = 'catalog'
+
+
+class ConditionalResponseMixin:
+    """
+    Answer ``If-None-Match``/``If-Modified-Since`` on ``list`` and
+    ``retrieve`` without serializing anything.
+
+    Every row change moves ``MAX(updated_at)`` and every delete moves
+    ``COUNT(*)``. Data the rows do not stamp themselves (related names,
+    annotated counts) is covered by ``conditional_generations``.
+    """
+    conditional_generations = []
+
+    def count_rows(self):
+        """Whether validators include the row count (not for cursor pages)."""
+        use_cursor = getattr(self.paginator, 'use_cursor', None)
+        return not (self.action == 'list' and use_cursor and use_cursor(self.request))
+
+    def get_conditional_state(self, queryset):
+        """
+        Return ``(last_modified, fingerprint)`` for ``queryset``.
+
+        Args:
+            queryset: the filtered queryset behind the response
+
+        Returns:
+            tuple: latest change (datetime or None) and a list of values
+            that change whenever the response could
+        """
+        aggregates = {}
+        if self.count_rows():
+            aggregates['rows'] = Count('pk')
+        if any(field.name == 'updated_at' for field in queryset.model._meta.fields):
+            aggregates['last_modified'] = Max('updated_at')
+        state = queryset.order_by().aggregate(**aggregates) if aggregates else {}
+
+        generations = Generation.objects.filter(
+            key__in=self.conditional_generations
+        ).values_list('key', 'value', 'updated_at')
+
+        last_modified = state.get('last_modified')
+        fingerprint = [state.get('rows'), last_modified and last_modified.isoformat()]
+        for key, value, updated_at in sorted(generations):
+            fingerprint.append(f'{key}={value}')
+            if last_modified is None or updated_at > last_modified:
+                last_modified = updated_at
+        return last_modified, fingerprint
+
+    def get_etag(self, request, fingerprint):
+        """Build a strong ETag for this view, its parameters and ``fingerprint``."""
+        params = sorted(
+            (key, value)
+            for key, values in request.query_params.lists()
+            for value in values
+        )
+        raw = '|'.join([
+            self.basename,
+            self.action,
+            urlencode(sorted(self.kwargs.items())),
+            request.accepted_renderer.format,
+            urlencode(params),
+            *map(str, fingerprint),
+        ])
+        return '"{}"'.format(hashlib.sha1(raw.encode('utf-8')).hexdigest())
+
+    def conditional_response(self, handler, queryset, request, *args, **kwargs):
+        """
+        Return 304 if the client's copy is current, otherwise call
+        ``handler`` and add the validators to its response.
+        """
+        try:
+            last_modified, fingerprint = self.get_conditional_state(queryset)
+        except (TypeError, ValueError, ValidationError):
+            # Malformed lookup value: let the handler answer 404
+            return handler(request, *args, **kwargs)
+        etag = self.get_etag(request, fingerprint)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request._request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            if timestamp is not None:
+                response['Last-Modified'] = http_date(timestamp)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.conditional_response(super().list, queryset, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (TypeError, ValueError, ValidationError):
+            return super().retrieve(request, *args, **kwargs)
+        return self.conditional_response(super().retrieve, queryset, request, *args, **kwargs)
@@ -0,0 +1,78 @@
+"""
+Article counts for sources and categories.
+
+This module avoids one ``COUNT(*)`` query per listed source/category:
+- with_article_counts: Annotate a queryset with ``num_articles``
+- apply_count_deltas: Incrementally adjust the denormalized counters
+- recount_articles: Recompute the denormalized counters from scratch
+
+By default counts are aggregated in the same query as the list. With
+``ARTICLE_COUNTS_DENORMALIZED = True`` the stored ``article_count``
+columns are read instead, which the ingest path keeps up to date.
+"""
+from django.conf import settings
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from .models import Article
+
+
+def use_denormalized_counts():
+    """Whether list views read the stored ``article_count`` columns."""
+    return getattr(settings, 'ARTICLE_COUNTS_DENORMALIZED', False)
+
+
+def with_article_counts(queryset):
+    """
+    Annotate a Source or Category queryset with ``num_articles``.
+
+    Args:
+        queryset: Source or Category queryset
+
+    Returns:
+        QuerySet: the same queryset, with ``num_articles`` on every row
+    """
+    if use_denormalized_counts():
+        return queryset.annotate(num_articles=F('article_count'))
+    return queryset.annotate(num_articles=Count('articles'))
+
+
+def apply_count_deltas(model, deltas):
+    """
+    Add per-row deltas to ``article_count``, never going below zero.
+
+    Articles created or edited outside the ingest path are not counted,
+    so moving one away could otherwise take a counter negative (and
+    fail the column's CHECK constraint). ``recount_articles`` restores
+    exact values.
+
+    Args:
+        model: Source or Category
+        deltas: dict of primary key -> change (None keys are ignored)
+    """
+    for pk, delta in deltas.items():
+        if pk is not None and delta:
+            model.objects.filter(pk=pk).update(
+                article_count=Greatest(F('article_count') + delta, Value(0))
+            )
+
+
+def recount_articles(model):
+    """
+    Recompute ``article_count`` for every row of ``model`` in one UPDATE.
+
+    Args:
+        model: Source or Category
+
+    Returns:
+        int: number of rows updated
+    """
+    field = model._meta.model_name
+    counts = (
+        Article.objects.filter(**{field: OuterRef('pk')})
+        .order_by()
+        .values(field)
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    return model.objects.update(article_count=Coalesce(Subquery(counts), Value(0)))
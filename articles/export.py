@@ -0,0 +1,56 @@
+"""
+Streaming article exports for the Tech Pulse Articles API.
+
+This module turns article rows into NDJSON or CSV, one line at a time:
+- EXPORT_FORMATS: Supported ``?output=`` values and their content types
+- export_lines: Yield the encoded lines of an export
+
+Rows come from ``ArticleRows`` over ``queryset.iterator()``, so an
+export of any size holds one chunk of rows in memory at a time.
+"""
+import csv
+
+from .fastpath import FastJSONRenderer
+
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+class Echo:
+    """File-like object whose ``write`` returns the written line."""
+
+    def write(self, value):
+        return value
+
+
+def ndjson_lines(rows):
+    renderer = FastJSONRenderer()
+    for row in rows:
+        yield renderer.render(row) + b'\n'
+
+
+def csv_lines(rows, field_names):
+    writer = csv.DictWriter(Echo(), fieldnames=field_names)
+    yield writer.writeheader().encode('utf-8')
+    for row in rows:
+        yield writer.writerow(row).encode('utf-8')
+
+
+def export_lines(rows, field_names, output):
+    """
+    Encode serialized article rows as an export.
+
+    Args:
+        rows: iterable of article representations (dicts)
+        field_names: fields in output order (CSV header)
+        output: a key of EXPORT_FORMATS
+
+    Returns:
+        generator: encoded lines (bytes)
+    """
+    if output == 'csv':
+        return csv_lines(rows, field_names)
+    return ndjson_lines(rows)
@@ -0,0 +1,163 @@
+"""
+Fast-path serialization for high-volume article reads.
+
+This module skips DRF's per-field serialization on article lists:
+- fast_serialization_enabled: Whether ``ARTICLE_FAST_SERIALIZATION`` is on
+- ArticleRows: Builds article representations from ``queryset.values()``
+- FastJSONRenderer: JSONRenderer that encodes with ``orjson`` when installed
+- FastListMixin: Serves ``list`` through ArticleRows when enabled
+
+Rows are read with a single ``values()`` query, joined to the source and
+category names, so no model instances are created. The output is byte
+for byte what ``ArticleSerializer`` plus ``JSONRenderer`` produce: the
+same fields in the same order, datetimes formatted by DRF's own
+``DateTimeField``, compressed text decompressed, and the same JSON
+escaping.
+"""
+from django.conf import settings
+from django.db import models
+from django.db.models import F
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from .compression import CompressedTextField, decompress
+from .models import Article
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def fast_serialization_enabled():
+    """Whether article lists use the fast serialization path."""
+    return getattr(settings, 'ARTICLE_FAST_SERIALIZATION', False)
+
+
+class ArticleRows:
+    """
+    Serialize articles from ``values()`` rows instead of model instances.
+
+    Args:
+        field_names: serializer field names to output, in order
+        extra_columns: more raw columns to read into each row
+    """
+    # Serializer fields backed by a differently named column
+    columns = {
+        'source': 'source_id',
+        'category': 'category_id',
+    }
+    # Serializer fields read through a join: (foreign key column, lookup).
+    # Like DRF's ReadOnlyField, they are left out when the key is null.
+    related = {
+        'source_name': ('source_id', 'source__name'),
+        'category_name': ('category_id', 'category__name'),
+    }
+    # Always read, for cursor pagination
+    required = ('id', 'published_at')
+
+    def __init__(self, field_names, extra_columns=()):
+        self.field_names = list(field_names)
+        self.required = self.required + tuple(extra_columns)
+        self.datetime_fields = {
+            field.name for field in Article._meta.concrete_fields
+            if isinstance(field, models.DateTimeField) and field.name in self.field_names
+        }
+        self.compressed_fields = {
+            field.name for field in Article._meta.concrete_fields
+            if isinstance(field, CompressedTextField) and field.name in self.field_names
+        }
+        # Resolve the active timezone once rather than once per value
+        self.datetime_field = serializers.DateTimeField(
+            default_timezone=serializers.DateTimeField().default_timezone()
+        )
+
+    def queryset(self, queryset):
+        """Turn an article queryset into one returning the needed rows as dicts."""
+        columns = list(self.required)
+        annotations = {}
+        for name in self.field_names:
+            if name in self.related:
+                column, lookup = self.related[name]
+                annotations[name] = F(lookup)
+            else:
+                column = self.columns.get(name, name)
+            if column not in columns:
+                columns.append(column)
+        return queryset.values(*columns, **annotations)
+
+    def to_representation(self, row):
+        """Return the serialized form of one ``values()`` row."""
+        data = {}
+        for name in self.field_names:
+            if name in self.related:
+                if row[self.related[name][0]] is None:
+                    continue
+                value = row[name]
+            else:
+                value = row[self.columns.get(name, name)]
+            if name in self.datetime_fields:
+                value = self.datetime_field.to_representation(value)
+            elif name in self.compressed_fields:
+                value = decompress(value)
+            data[name] = value
+        return data
+
+    def data(self, rows):
+        """Return the serialized form of every row."""
+        return [self.to_representation(row) for row in rows]
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer producing identical bytes with ``orjson``, when it is
+    installed and the fast path is enabled.
+
+    Falls back to ``JSONRenderer`` for indented output, non-default DRF
+    JSON settings, and anything ``orjson`` cannot encode natively.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or not fast_serialization_enabled()
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                # Format these the way DRF's encoder does
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same JavaScript-safe escaping as JSONRenderer
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+
+class FastListMixin:
+    """
+    Serve ``list`` from ``values()`` rows when the fast path is enabled.
+
+    The fields are those the regular serializer would output, so sparse
+    fieldsets and expansions behave the same on both paths.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if not fast_serialization_enabled():
+            return super().list(request, *args, **kwargs)
+
+        rows = ArticleRows(self.get_serializer().fields)
+        queryset = rows.queryset(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(rows.data(page))
+        return Response(rows.data(queryset))
@@ -0,0 +1,200 @@
+"""
+Feed downloading for the Tech Pulse Articles Application.
+
+This module contains the network side of article ingestion:
+- FeedResult: Outcome of downloading and parsing a single source
+- FeedFetcher: Downloads and parses feeds, optionally in parallel
+
+Fetching never touches the database, so it is safe to run on worker
+threads. Callers consume the results on a single thread and do all
+database writes there (which keeps SQLite happy).
+"""
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+
+
+USER_AGENT = 'TechPulse/1.0 (RSS Reader; +https://github.com/matandasoftware/tech-pulse)'
+
+
+@dataclass
+class FeedResult:
+    """
+    Result of fetching a single source.
+
+    ``feed`` is set when new content was parsed, ``error`` when the
+    fetch failed, and ``not_modified`` when the server answered 304 or
+    the body hash matched the previous fetch (nothing was parsed).
+    The validators are what should be stored on the source once the
+    result has been processed successfully. The last three fields
+    measure the download and parse, for run statistics.
+    """
+    source: Any
+    feed: Any = None
+    error: Optional[str] = None
+    not_modified: bool = False
+    etag: str = ''
+    last_modified: str = ''
+    content_hash: str = ''
+    bytes_downloaded: int = 0
+    download_seconds: float = 0.0
+    parse_seconds: float = 0.0
+
+
+class FeedFetcher:
+    """
+    Downloads and parses RSS feeds.
+
+    A single keep-alive session is shared by all workers, and a
+    per-host semaphore caps how many requests hit the same server
+    at once so a large pool does not hammer one publisher.
+    """
+
+    def __init__(self, workers=1, per_host=2, timeout=30, conditional=True):
+        self.workers = max(1, workers)
+        self.per_host = max(1, per_host)
+        self.timeout = timeout
+        self.conditional = conditional
+
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._host_limits = {}
+        self._host_limits_lock = threading.Lock()
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _host_limit(self, url):
+        """Return the semaphore guarding requests to the host of ``url``."""
+        host = urlsplit(url).netloc.lower()
+        with self._host_limits_lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_limits[host]
+
+    def conditional_headers(self, source):
+        """Build If-None-Match / If-Modified-Since headers from stored validators."""
+        headers = {}
+        if not self.conditional:
+            return headers
+        if source.etag:
+            headers['If-None-Match'] = source.etag
+        if source.last_modified:
+            headers['If-Modified-Since'] = source.last_modified
+        return headers
+
+    def fetch(self, source):
+        """
+        Download and parse a single source.
+
+        Sends the validators stored on the source so unchanged feeds
+        come back as 304 Not Modified. Feeds that ignore validators are
+        caught by comparing a hash of the body before parsing.
+
+        Args:
+            source: Source model instance
+
+        Returns:
+            FeedResult: parsed feed, not-modified marker, or a human readable error message
+        """
+        metrics = {}
+        try:
+            try:
+                with self._host_limit(source.url):
+                    started = time.perf_counter()
+                    try:
+                        response = self.session.get(
+                            source.url,
+                            timeout=self.timeout,
+                            headers=self.conditional_headers(source),
+                        )
+                        metrics['bytes_downloaded'] = len(response.content)
+                    finally:
+                        metrics['download_seconds'] = time.perf_counter() - started
+                response.raise_for_status()
+
+            except requests.exceptions.Timeout:
+                return FeedResult(source, error='Timeout: Feed took too long to respond', **metrics)
+
+            except requests.exceptions.ConnectionError:
+                return FeedResult(source, error='Connection Error: Could not reach feed', **metrics)
+
+            except requests.exceptions.HTTPError as e:
+                return FeedResult(source, error=f'HTTP Error: {e.response.status_code}', **metrics)
+
+            except requests.exceptions.RequestException as e:
+                return FeedResult(source, error=f'Request Error: {str(e)}', **metrics)
+
+            if response.status_code == 304:
+                return FeedResult(
+                    source,
+                    not_modified=True,
+                    etag=response.headers.get('ETag', source.etag),
+                    last_modified=response.headers.get('Last-Modified', source.last_modified),
+                    content_hash=source.content_hash,
+                    **metrics,
+                )
+
+            validators = {
+                'etag': response.headers.get('ETag', ''),
+                'last_modified': response.headers.get('Last-Modified', ''),
+                'content_hash': hashlib.sha256(response.content).hexdigest(),
+            }
+
+            if self.conditional and source.content_hash and validators['content_hash'] == source.content_hash:
+                return FeedResult(source, not_modified=True, **validators, **metrics)
+
+            # Parse the feed (feedparser handles encoding detection)
+            started = time.perf_counter()
+            feed = feedparser.parse(response.content)
+            metrics['parse_seconds'] = time.perf_counter() - started
+
+        except Exception as e:
+            return FeedResult(source, error=f'Unexpected error: {str(e)}', **metrics)
+
+        return FeedResult(source, feed=feed, **validators, **metrics)
+
+    def fetch_all(self, sources):
+        """
+        Fetch every source, yielding results in the order given.
+
+        With more than one worker, downloads run concurrently on a
+        thread pool while results are still handed back in order, so
+        console output matches a serial run.
+
+        Args:
+            sources: iterable of Source model instances
+
+        Yields:
+            FeedResult: one per source
+        """
+        sources = list(sources)
+
+        if self.workers == 1:
+            for source in sources:
+                yield self.fetch(source)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='fetch') as executor:
+            futures = [executor.submit(self.fetch, source) for source in sources]
+            for future in futures:
+                yield future.result()
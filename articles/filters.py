@@ -0,0 +1,44 @@
+"""
+Filters for the Tech Pulse Articles API.
+
+This module contains:
+- ArticleFilter: Source, category and date filters for article lists
+  and exports, an ``id`` cursor for incremental mirroring, and
+  near-duplicate clusters
+"""
+import django_filters
+from django.db.models import Q
+
+from .models import Article
+from .similarity import collapse_clusters
+
+
+class ArticleFilter(django_filters.FilterSet):
+    """
+    Filter articles by source, category and publication date.
+
+    ``published_after``/``published_before`` take ISO 8601 datetimes
+    (``published_before`` is exclusive). ``since`` keeps articles with an
+    ``id`` greater than the given one, so an export can resume where the
+    previous one stopped.
+
+    ``cluster`` lists the articles of one near-duplicate cluster, named
+    by its first article's id (the ``cluster_id`` of the others).
+    ``collapse=cluster`` keeps only the earliest matching article of
+    each cluster; it is applied after the other filters.
+    """
+    published_after = django_filters.IsoDateTimeFilter(field_name='published_at', lookup_expr='gte')
+    published_before = django_filters.IsoDateTimeFilter(field_name='published_at', lookup_expr='lt')
+    since = django_filters.NumberFilter(field_name='id', lookup_expr='gt')
+    cluster = django_filters.NumberFilter(method='filter_cluster')
+    collapse = django_filters.ChoiceFilter(choices=[('cluster', 'cluster')], method='filter_collapse')
+
+    class Meta:
+        model = Article
+        fields = ['source', 'category', 'published_at']
+
+    def filter_cluster(self, queryset, name, value):
+        return queryset.filter(Q(pk=value) | Q(cluster_id=value))
+
+    def filter_collapse(self, queryset, name, value):
+        return collapse_clusters(queryset)
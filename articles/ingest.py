@@ -0,0 +1,235 @@
+"""
+Batched article ingestion for the Tech Pulse Articles Application.
+
+This module turns the article data extracted from a feed into rows:
+- IngestResult: What happened to each entry of a batch
+- ingest_articles: Upserts one source's entries in a single transaction
+
+Instead of one ``update_or_create`` per entry, existing articles are
+loaded with a single query on the hashed canonical URL (see
+canonical.py), new rows are written with ``bulk_create``
+and changed rows with ``bulk_update``. The stored article counts of the
+affected sources and categories are adjusted in the same transaction.
+
+Each article stores a fingerprint of its feed content. Entries whose
+fingerprint matches the stored one are not written at all, so their
+``updated_at`` (and every cache and feed keyed on it) stays put.
+
+New articles are also fingerprinted with a SimHash of their title and
+summary and grouped with near-duplicates from other sources (see
+similarity.py).
+"""
+import hashlib
+from collections import Counter
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import invalidate_api_cache
+from .canonical import canonicalize_url, url_hash, url_key
+from .counts import apply_count_deltas
+from .models import Source, Category, Article
+from .similarity import article_simhash, assign_clusters, index_articles
+from .slugs import unique_slugs
+
+
+# Fields refreshed on changed articles (fetched_at keeps the first fetch time)
+UPDATE_FIELDS = [
+    'title',
+    'content',
+    'summary',
+    'author',
+    'source',
+    'category',
+    'published_at',
+    'image_url',
+    'content_hash',
+    'simhash',
+    'updated_at',
+]
+
+# Feed fields covered by the fingerprint. published_at is left out on
+# purpose: entries without a date get the fetch time, which differs on
+# every run.
+FINGERPRINT_FIELDS = ['title', 'summary', 'content', 'author', 'image_url']
+
+CREATED = 'created'
+CHANGED = 'changed'
+UNCHANGED = 'unchanged'
+
+
+def article_fingerprint(data):
+    """
+    Hash the feed content of an article.
+
+    Args:
+        data: mapping with the FINGERPRINT_FIELDS (missing or None count as empty)
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for name in FINGERPRINT_FIELDS:
+        digest.update((data.get(name) or '').encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+@dataclass
+class IngestResult:
+    """
+    Outcome of ingesting a batch of entries.
+    ``rows`` holds ``(article, status)`` pairs in feed order, where the
+    status is CREATED, CHANGED or UNCHANGED.
+    """
+    rows: list = field(default_factory=list)
+
+    def count(self, status):
+        return sum(1 for _, row_status in self.rows if row_status == status)
+
+    @property
+    def created(self):
+        return self.count(CREATED)
+
+    @property
+    def changed(self):
+        return self.count(CHANGED)
+
+    @property
+    def unchanged(self):
+        return self.count(UNCHANGED)
+
+
+def assign_slugs(articles):
+    """
+    Give each new article a unique slug before it is bulk inserted.
+
+    Args:
+        articles: unsaved Article instances without a slug
+    """
+    slugs = unique_slugs(Article, [(article.title, article.url) for article in articles])
+    for article, slug in zip(articles, slugs):
+        article.slug = slug
+
+
+def update_article_counts(created, updated, original):
+    """
+    Keep the denormalized source/category article counts in step.
+
+    Args:
+        created: newly inserted articles
+        updated: updated articles
+        original: primary key -> (source_id, category_id) before the update
+    """
+    source_deltas = Counter()
+    category_deltas = Counter()
+
+    for article in created:
+        source_deltas[article.source_id] += 1
+        category_deltas[article.category_id] += 1
+
+    for article in updated:
+        old_source_id, old_category_id = original[article.pk]
+        if article.source_id != old_source_id:
+            source_deltas[old_source_id] -= 1
+            source_deltas[article.source_id] += 1
+        if article.category_id != old_category_id:
+            category_deltas[old_category_id] -= 1
+            category_deltas[article.category_id] += 1
+
+    apply_count_deltas(Source, source_deltas)
+    apply_count_deltas(Category, category_deltas)
+
+
+def ingest_articles(articles_data):
+    """
+    Create or update a batch of articles.
+
+    Entries are matched on their canonical URL, so tracking parameters,
+    fragments and http/https differences do not create new articles.
+    New articles store the canonical URL; existing ones keep theirs.
+    Existing articles are only rewritten when their fingerprint or
+    source changed. When a URL appears twice in the same batch the
+    later entry wins, as it would when saved one by one.
+
+    Args:
+        articles_data: list of dicts from ``extract_article_data``
+
+    Returns:
+        IngestResult: created / changed / unchanged articles in input order
+    """
+    result = IngestResult()
+    if not articles_data:
+        return result
+
+    now = timezone.now()
+    articles_data = [{**data, 'url': canonicalize_url(data['url'])} for data in articles_data]
+
+    with transaction.atomic():
+        # Probe the narrow url_hash index, then compare the keys themselves
+        # so a hash collision cannot match the wrong article. Only what is
+        # needed to compare is loaded; changed rows are written whole.
+        existing = {}
+        for article in Article.objects.only(
+            'id', 'url', 'content_hash', 'simhash', 'source_id', 'category_id'
+        ).filter(
+            url_hash__in={url_hash(data['url']) for data in articles_data}
+        ).order_by('pk'):
+            existing.setdefault(url_key(article.url), article)
+
+        pending = {}
+        to_create = []
+        to_update = {}
+        original = {}
+        rehashed = {}
+
+        for data in articles_data:
+            key = url_key(data['url'])
+            data = {**data, 'content_hash': article_fingerprint(data)}
+            article = existing.get(key) or pending.get(key)
+
+            if article is None:
+                article = Article(**data, simhash=article_simhash(data))
+                pending[key] = article
+                to_create.append(article)
+                result.rows.append((article, CREATED))
+                continue
+
+            if article.content_hash == data['content_hash'] and article.source_id == data['source'].pk:
+                result.rows.append((article, UNCHANGED))
+                continue
+
+            if article.pk is not None and article.pk not in original:
+                original[article.pk] = (article.source_id, article.category_id)
+            simhash = article_simhash(data)
+            if article.pk is not None and simhash != article.simhash:
+                rehashed[article.pk] = article
+            for name, value in data.items():
+                if name != 'url':
+                    setattr(article, name, value)
+            article.simhash = simhash
+            article.updated_at = now
+            if article.pk is not None:
+                to_update[article.pk] = article
+            result.rows.append((article, CHANGED))
+
+        if to_create:
+            assign_slugs(to_create)
+            Article.objects.bulk_create(to_create)
+            clustered = assign_clusters(to_create)
+            if clustered:
+                Article.objects.bulk_update(clustered, ['cluster_id'])
+        if to_update:
+            Article.objects.bulk_update(list(to_update.values()), UPDATE_FIELDS)
+        if rehashed:
+            # Edited stories keep their cluster; only their lookup rows move
+            index_articles(rehashed.values(), replace=True)
+
+        update_article_counts(to_create, to_update.values(), original)
+
+        # Bulk writes send no model signals, so invalidate cached responses here
+        if to_create or to_update:
+            invalidate_api_cache()
+
+    return result
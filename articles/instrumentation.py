@@ -0,0 +1,152 @@
+"""
+Run statistics for the fetch commands.
+
+This module measures where a fetch run spends its time:
+- SourceStats: Bytes, entries, outcomes, queries and per-stage wall
+  time for one source
+- RunStats: Totals over every source of a run
+
+Stages are ``download`` and ``parse`` (measured by the fetcher, possibly
+on worker threads) and ``extract``, ``categorize``, ``ingest`` and
+``save`` (measured on the main thread). Nested stages are exclusive:
+time spent categorizing is not also counted as extracting.
+"""
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from django.db import connection
+from django.utils import timezone
+
+
+@dataclass
+class SourceStats:
+    """
+    Statistics for processing one source.
+    ``status`` is one of ``ok``, ``not_modified`` or ``error``.
+    """
+    source_id: int
+    source: str
+    status: str = 'ok'
+    bytes: int = 0
+    entries: int = 0
+    created: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    queries: int = 0
+    query_seconds: float = 0.0
+    stages: dict = field(default_factory=dict)
+    _open_stages: list = field(default_factory=list, repr=False)
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    @classmethod
+    def for_result(cls, result):
+        """Start statistics from a FeedResult, with its download and parse timings."""
+        stats = cls(source_id=result.source.pk, source=result.source.name, bytes=result.bytes_downloaded)
+        stats.stages['download'] = result.download_seconds
+        if result.parse_seconds:
+            stats.stages['parse'] = result.parse_seconds
+        return stats
+
+    def elapsed(self):
+        """Seconds spent on the source so far: download and parse, plus processing."""
+        fetched = self.stages.get('download', 0.0) + self.stages.get('parse', 0.0)
+        return fetched + time.perf_counter() - self._started
+
+    @contextmanager
+    def stage(self, name):
+        """Add the wall time of the block to stage ``name``."""
+        started = time.perf_counter()
+        self._open_stages.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            nested = self._open_stages.pop()
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed - nested
+            if self._open_stages:
+                self._open_stages[-1] += elapsed
+
+    @contextmanager
+    def track_queries(self):
+        """Count the queries (and their time) run on the default connection."""
+        def count_query(execute, sql, params, many, context):
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                self.queries += 1
+                self.query_seconds += time.perf_counter() - started
+
+        with connection.execute_wrapper(count_query):
+            yield
+
+    def record_counts(self, counts):
+        """Copy entry counts from ``fetch_articles``' per-source counts dict."""
+        self.entries = counts['fetched']
+        for name in ('created', 'changed', 'unchanged', 'skipped'):
+            setattr(self, name, counts[name])
+
+    def as_dict(self):
+        return {
+            'event': 'source',
+            'source_id': self.source_id,
+            'source': self.source,
+            'status': self.status,
+            'bytes': self.bytes,
+            'entries': self.entries,
+            'created': self.created,
+            'changed': self.changed,
+            'unchanged': self.unchanged,
+            'skipped': self.skipped,
+            'queries': self.queries,
+            'query_seconds': round(self.query_seconds, 6),
+            'stages': {name: round(seconds, 6) for name, seconds in self.stages.items()},
+        }
+
+
+class RunStats:
+    """
+    Totals over all sources of a run.
+
+    Stage times are summed across sources; with parallel downloads the
+    ``download`` and ``parse`` totals can exceed the run's wall time.
+    """
+
+    def __init__(self):
+        self.started_at = timezone.now()
+        self.started = time.perf_counter()
+        self.sources = []
+
+    def add(self, stats):
+        self.sources.append(stats)
+
+    @property
+    def wall_seconds(self):
+        return time.perf_counter() - self.started
+
+    def as_dict(self, include_sources=False):
+        totals = Counter()
+        stages = Counter()
+        statuses = Counter()
+        for stats in self.sources:
+            statuses[stats.status] += 1
+            stages.update(stats.stages)
+            for name in ('bytes', 'entries', 'created', 'changed', 'unchanged', 'skipped', 'queries', 'query_seconds'):
+                totals[name] += getattr(stats, name)
+
+        data = {
+            'event': 'run',
+            'started_at': self.started_at.isoformat(),
+            'wall_seconds': round(self.wall_seconds, 6),
+            'sources': len(self.sources),
+            'statuses': dict(statuses),
+            **{name: totals[name] for name in ('bytes', 'entries', 'created', 'changed', 'unchanged', 'skipped', 'queries')},
+            'query_seconds': round(totals['query_seconds'], 6),
+            'stages': {name: round(seconds, 6) for name, seconds in stages.items()},
+        }
+        if include_sources:
+            data['per_source'] = [stats.as_dict() for stats in self.sources]
+        return data
@@ -0,0 +1,112 @@
+"""
+Django management command to move old articles into the compressed archive.
+
+Usage:
+    python manage.py archive_articles
+    python manage.py archive_articles --source 1 --dry-run
+    python manage.py archive_articles --chunk-size 200
+
+This command:
+- Works out each source's retention window (Source.retention_days,
+  else ARTICLE_RETENTION_DAYS), the same one fetch_articles applies
+- Streams the articles published before it in primary key order, one
+  chunk at a time
+- Appends each chunk to monthly gzip JSON lines segments in
+  ARTICLE_ARCHIVE_DIR, then deletes it in its own short transaction,
+  leaving tombstones for the changes feed
+
+Archived articles stay readable through /api/articles/archive/.
+"""
+from django.core.management.base import BaseCommand
+
+from articles.archive import ArchiveWriter, archive_chunk, retention_cutoff
+from articles.fastpath import ArticleRows
+from articles.models import Source, Article
+from articles.serializers import ArticleSerializer
+
+
+class Command(BaseCommand):
+    """
+    Archive articles older than their source's retention window.
+    """
+    help = 'Move articles past their retention window into compressed archive files'
+
+    def add_arguments(self, parser):
+        """
+        Add optional command-line arguments.
+        """
+        parser.add_argument(
+            '--source',
+            type=int,
+            help='Only archive articles from this source ID',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Articles archived and deleted per transaction (default: 500)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report how many articles would be archived without changing anything',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Archive each source's cold articles in chunks.
+        """
+        chunk_size = max(1, options['chunk_size'])
+
+        sources = Source.objects.order_by('pk')
+        if options['source']:
+            sources = sources.filter(pk=options['source'])
+
+        rows = ArticleRows(ArticleSerializer().fields)
+        writer = ArchiveWriter()
+
+        self.stdout.write(self.style.SUCCESS('Archiving articles...'))
+
+        total_archived = 0
+        for source in sources:
+            cutoff = retention_cutoff(source)
+            if cutoff is None:
+                continue
+
+            cold = Article.objects.filter(source=source, published_at__lt=cutoff)
+            self.stdout.write(f'\n{source.name}: published before {cutoff:%Y-%m-%d %H:%M}')
+
+            if options['dry_run']:
+                count = cold.count()
+                total_archived += count
+                self.stdout.write(f'  Would archive {count} articles')
+                continue
+
+            archived = 0
+            last_pk = 0
+            queryset = rows.queryset(cold).order_by('pk')
+            while True:
+                # Keyset pagination: constant memory, and safe to delete while iterating
+                chunk = list(queryset.filter(pk__gt=last_pk)[:chunk_size])
+                if not chunk:
+                    break
+                last_pk = chunk[-1]['id']
+
+                archive_chunk(chunk, rows.data(chunk), writer)
+                archived += len(chunk)
+                self.stdout.write(f'  Archived {archived} articles')
+
+            total_archived += archived
+            if not archived:
+                self.stdout.write('  = Nothing to archive')
+
+        # Print overall summary
+        self.stdout.write('\n' + '='*70)
+        self.stdout.write(self.style.SUCCESS('Archiving complete!'))
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'  ↻ Would archive: {total_archived} (dry run, nothing changed)'))
+        else:
+            self.stdout.write(self.style.WARNING(f'  ↻ Articles archived: {total_archived}'))
+            for name in sorted(writer.segments):
+                self.stdout.write(f'  Segment: {name}')
+        self.stdout.write('='*70)
@@ -0,0 +1,474 @@
+"""
+Django management command to run performance benchmarks.
+
+Usage:
+    python manage.py benchmark slugs
+    python manage.py benchmark slugs --sizes 10 100 1000
+    python manage.py benchmark categorizer
+    python manage.py benchmark search --sizes 1000 10000 50000
+    python manage.py benchmark serializer --sizes 20 100 500
+    python manage.py benchmark urls --sizes 10000 100000
+    python manage.py benchmark content --sizes 1000 5000
+
+This command:
+- Runs a named benchmark suite against the configured database
+- Writes all benchmark data inside a transaction that is rolled back,
+  so the database is left exactly as it was
+- Prints timings and query counts per input size
+
+Use it to check that hot paths keep a flat cost as the data grows.
+"""
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+from django.utils.text import slugify
+from rest_framework import filters
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from articles.canonical import url_hash
+from articles.categorizer import CATEGORY_KEYWORDS, KeywordCategorizer
+from articles.compression import compress, decompress, stores_compressed, train_dictionary
+from articles.fastpath import ArticleRows, FastJSONRenderer, orjson
+from articles.models import Source, Category, Article
+from articles.search import FullTextSearchFilter
+from articles.serializers import ArticleSerializer, ArticleListSerializer
+from articles.slugs import unique_slug
+from articles.views import ArticleViewSet
+
+
+class Rollback(Exception):
+    """Raised to discard everything a benchmark wrote."""
+
+
+class Command(BaseCommand):
+    """
+    Run a benchmark suite and print the results.
+    """
+    help = 'Run performance benchmarks (data is rolled back afterwards)'
+
+    suites = ['slugs', 'categorizer', 'search', 'serializer', 'urls', 'content']
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments.
+        """
+        parser.add_argument(
+            'suite',
+            choices=self.suites,
+            help='Benchmark suite to run',
+        )
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            help='Input sizes to benchmark (suite specific defaults)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Repetitions per measurement; the best run is reported (default: 5)',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Run the selected suite inside a rolled back transaction.
+        """
+        runner = getattr(self, f'bench_{options["suite"]}')
+        self.stdout.write(self.style.SUCCESS(f'Running benchmark: {options["suite"]}'))
+        try:
+            with transaction.atomic():
+                runner(options)
+                raise Rollback
+        except Rollback:
+            pass
+        self.stdout.write(self.style.SUCCESS('Benchmark complete (all data rolled back).'))
+
+    def measure(self, func, repeat):
+        """
+        Time ``func`` and count its queries.
+
+        Returns:
+            tuple: (best wall time in ms, queries per run)
+        """
+        queries = []
+
+        def count_queries(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        best = None
+        with connection.execute_wrapper(count_queries):
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func()
+                elapsed = (time.perf_counter() - start) * 1000
+                best = elapsed if best is None else min(best, elapsed)
+        return best, len(queries) // repeat
+
+    def benchmark_source(self):
+        """Create a throwaway source for benchmark articles."""
+        return Source.objects.create(
+            name='Benchmark Source',
+            url='https://benchmark.invalid/feed/',
+            is_active=False,
+        )
+
+    def bench_slugs(self, options):
+        """
+        Cost of allocating one more slug for a title that already has
+        N duplicates, comparing the old ``-1, -2, ...`` probing loop
+        with the hash-suffix allocator.
+        """
+        sizes = options['sizes'] or [10, 100, 1000]
+        source = self.benchmark_source()
+        title = 'Weekly roundup'
+        base = slugify(title)
+        created = 0
+
+        def legacy():
+            slug = base
+            counter = 1
+            while Article.objects.filter(slug=slug).exists():
+                slug = f"{base}-{counter}"
+                counter += 1
+
+        def allocator():
+            unique_slug(Article, title, 'https://benchmark.invalid/new-article')
+
+        self.stdout.write(f'\n  {"duplicates":>10}  {"legacy ms":>10}  {"queries":>7}  {"allocator ms":>12}  {"queries":>7}')
+        for size in sorted(sizes):
+            # Duplicates as the old loop would have named them
+            Article.objects.bulk_create([
+                Article(
+                    title=title,
+                    slug=base if i == 0 else f"{base}-{i}",
+                    url=f'https://benchmark.invalid/articles/{i}',
+                    source=source,
+                    published_at=timezone.now(),
+                )
+                for i in range(created, size)
+            ])
+            created = max(created, size)
+
+            legacy_ms, legacy_queries = self.measure(legacy, options['repeat'])
+            alloc_ms, alloc_queries = self.measure(allocator, options['repeat'])
+            self.stdout.write(
+                f'  {size:>10}  {legacy_ms:>10.2f}  {legacy_queries:>7}  {alloc_ms:>12.2f}  {alloc_queries:>7}'
+            )
+
+    def bench_categorizer(self, options):
+        """
+        Classify N real feed entries (articles already in the database)
+        with the old per-call keyword scan plus ``Category`` lookup, and
+        with a compiled ``KeywordCategorizer`` via ``classify_many``.
+        The categorizer is built once, as ``fetch_articles`` does per run.
+        """
+        sizes = options['sizes'] or [100, 1000, 5000]
+        corpus = [
+            f"{title} {decompress(content)} {summary}"
+            for title, content, summary in Article.objects.values_list(
+                'title', 'content', 'summary'
+            )[:max(sizes)]
+        ]
+        if not corpus:
+            raise CommandError('No articles in the database; run fetch_articles first.')
+        self.stdout.write(f'  Corpus: {len(corpus)} stored articles (repeated to reach each size)')
+
+        def legacy(texts):
+            for text in texts:
+                text = text.lower()
+                scores = {}
+                for name, keywords in CATEGORY_KEYWORDS.items():
+                    score = sum(1 for keyword in keywords if keyword in text)
+                    if score > 0:
+                        scores[name] = score
+                if scores:
+                    try:
+                        Category.objects.get(name=max(scores, key=scores.get))
+                    except Category.DoesNotExist:
+                        pass
+
+        categorizer = KeywordCategorizer()
+
+        def compiled(texts):
+            categorizer.classify_many(texts)
+
+        self.stdout.write(f'\n  {"entries":>8}  {"legacy ms":>10}  {"queries":>7}  {"compiled ms":>11}  {"queries":>7}')
+        for size in sorted(sizes):
+            texts = (corpus * (size // len(corpus) + 1))[:size]
+            legacy_ms, legacy_queries = self.measure(lambda: legacy(texts), options['repeat'])
+            compiled_ms, compiled_queries = self.measure(lambda: compiled(texts), options['repeat'])
+            self.stdout.write(
+                f'  {size:>8}  {legacy_ms:>10.2f}  {legacy_queries:>7}  {compiled_ms:>11.2f}  {compiled_queries:>7}'
+            )
+
+    def bench_search(self, options):
+        """
+        Latency of one page of ``?search=`` results as the table grows,
+        comparing DRF's ``icontains`` SearchFilter with the full-text
+        index used by ``FullTextSearchFilter``. The searched phrase
+        appears in the summary of one article out of 500, like a typical
+        news query. ``icontains`` cannot look inside compressed content,
+        so the baseline scans the plain text fields the API's fallback
+        search uses (title, summary and author).
+        """
+        sizes = options['sizes'] or [1000, 10000]
+        source = self.benchmark_source()
+        words = [f'word{i}' for i in range(2000)]
+        rng = random.Random(42)
+        created = 0
+
+        view = ArticleViewSet()
+        request = Request(APIRequestFactory().get('/api/articles/', {'search': 'quantum satellite'}))
+        view.search_fields = FullTextSearchFilter().get_search_fields(view, request)
+        queryset = Article.objects.select_related('source', 'category')
+
+        def page(backend):
+            # What the list endpoint runs: a COUNT(*) and the first page
+            def run():
+                results = backend().filter_queryset(request, queryset, view)
+                results.count()
+                list(results[:20])
+            return run
+
+        self.stdout.write(f'\n  {"articles":>8}  {"icontains ms":>12}  {"full-text ms":>12}')
+        for size in sorted(sizes):
+            Article.objects.bulk_create([
+                Article(
+                    title=' '.join(rng.choices(words, k=8)),
+                    slug=f'benchmark-search-{i}',
+                    url=f'https://benchmark.invalid/search/{i}',
+                    summary=' '.join(rng.choices(words, k=40)) + (' quantum satellite' if i % 500 == 0 else ''),
+                    content=' '.join(rng.choices(words, k=400)),
+                    author='Benchmark',
+                    source=source,
+                    published_at=timezone.now(),
+                )
+                for i in range(created, size)
+            ], batch_size=1000)
+            created = max(created, size)
+
+            like_ms, _ = self.measure(page(filters.SearchFilter), options['repeat'])
+            fts_ms, _ = self.measure(page(FullTextSearchFilter), options['repeat'])
+            self.stdout.write(f'  {size:>8}  {like_ms:>12.2f}  {fts_ms:>12.2f}')
+
+    def bench_serializer(self, options):
+        """
+        Time to turn one page of N articles into JSON bytes, comparing
+        ``ArticleListSerializer`` plus ``JSONRenderer`` with the fast
+        path (``values()`` rows plus ``FastJSONRenderer``). Both start
+        from the queryset, so the database read is part of the timing.
+        """
+        sizes = options['sizes'] or [20, 100, 500]
+        source = self.benchmark_source()
+        category = Category.objects.create(name='Benchmark Category')
+        words = [f'word{i}' for i in range(2000)]
+        rng = random.Random(42)
+        Article.objects.bulk_create([
+            Article(
+                title=' '.join(rng.choices(words, k=8)),
+                slug=f'benchmark-serializer-{i}',
+                url=f'https://benchmark.invalid/serializer/{i}',
+                summary=' '.join(rng.choices(words, k=40)),
+                content=' '.join(rng.choices(words, k=400)),
+                image_url=f'https://benchmark.invalid/images/{i}.jpg',
+                author='Benchmark',
+                source=source,
+                category=category,
+                published_at=timezone.now() - timezone.timedelta(minutes=i),
+            )
+            for i in range(max(sizes))
+        ], batch_size=1000)
+
+        queryset = Article.objects.filter(source=source).order_by('-published_at')
+        fields = ArticleListSerializer.Meta.fields
+        rows = ArticleRows(fields)
+        defer = [
+            field.name for field in Article._meta.concrete_fields
+            if field.name not in fields and field.name not in ('source', 'category')
+        ]
+
+        def drf(size):
+            page = list(queryset.select_related('source', 'category').defer(*defer)[:size])
+            return JSONRenderer().render(ArticleListSerializer(page, many=True).data)
+
+        def fast(size):
+            return FastJSONRenderer().render(rows.data(rows.queryset(queryset)[:size]))
+
+        encoder = 'orjson' if orjson else 'json (orjson not installed)'
+        self.stdout.write(f'  Fast path encoder: {encoder}')
+        self.stdout.write(f'\n  {"page size":>9}  {"serializer ms":>13}  {"fast path ms":>12}  {"speedup":>7}  identical')
+        with override_settings(ARTICLE_FAST_SERIALIZATION=True):
+            for size in sorted(sizes):
+                identical = drf(size) == fast(size)
+                drf_ms, _ = self.measure(lambda: drf(size), options['repeat'])
+                fast_ms, _ = self.measure(lambda: fast(size), options['repeat'])
+                mark = self.style.SUCCESS('✓') if identical else self.style.ERROR('✗')
+                self.stdout.write(
+                    f'  {size:>9}  {drf_ms:>13.2f}  {fast_ms:>12.2f}  {drf_ms / fast_ms:>6.1f}x  {mark}'
+                )
+
+    def bench_urls(self, options):
+        """
+        Existence check for one feed batch (100 URLs, half of them
+        stored) as the table grows, comparing a lookup on the ``url``
+        column with the ``url_hash`` lookup used by ``ingest_articles``,
+        plus the cost of canonicalizing and hashing the batch.
+        Stored URLs are long, like real article links.
+        """
+        sizes = options['sizes'] or [10000, 50000]
+        source = self.benchmark_source()
+        path = 'technology/2026/10/17/a-fairly-long-article-slug-as-news-sites-use-them'
+
+        def link(i):
+            return f'https://benchmark.invalid/{path}-{i}?id={i}'
+
+        def by_url(urls):
+            list(Article.objects.only('id', 'url').filter(url__in=urls))
+
+        def by_hash(hashes):
+            list(Article.objects.only('id', 'url').filter(url_hash__in=hashes))
+
+        def hash_batch(urls):
+            return {url_hash(url) for url in urls}
+
+        created = 0
+        self.stdout.write(f'\n  {"articles":>8}  {"url ms":>8}  {"url_hash ms":>11}  {"hashing ms":>10}')
+        for size in sorted(sizes):
+            Article.objects.bulk_create([
+                Article(
+                    title=f'Benchmark article {i}',
+                    slug=f'benchmark-url-{i}',
+                    url=link(i),
+                    source=source,
+                    published_at=timezone.now(),
+                )
+                for i in range(created, size)
+            ], batch_size=1000)
+            created = max(created, size)
+
+            batch = [link(i) for i in range(size - 50, size)] + [link(size + i) for i in range(50)]
+            hashes = hash_batch(batch)
+            url_ms, _ = self.measure(lambda: by_url(batch), options['repeat'])
+            hash_ms, _ = self.measure(lambda: by_hash(hashes), options['repeat'])
+            hashing_ms, _ = self.measure(lambda: hash_batch(batch), options['repeat'])
+            self.stdout.write(f'  {size:>8}  {url_ms:>8.2f}  {hash_ms:>11.2f}  {hashing_ms:>10.2f}')
+
+    def bench_content(self, options):
+        """
+        Stored size of ``Article.content`` and read latency, for articles
+        written compressed and for the same articles stored as plain text
+        (as before compression, and as rows the data migration has not
+        reached yet). Reads are a list page (content deferred), a detail
+        (content decompressed) and a page of 20 with ``?expand=content``.
+        The last column is the size a dictionary trained on the
+        benchmark articles would reach.
+        """
+        sizes = options['sizes'] or [1000, 5000]
+        words = (
+            'the of and to in a is that for on with as was by at from it an be this are has '
+            'have new said will its more after which their been about would also into than '
+            'company data model users open software cloud security release update research '
+            'million market chip startup developer apple google microsoft amazon meta ai'
+        ).split()
+        rng = random.Random(42)
+        sources = {
+            label: Source.objects.create(
+                name=f'Benchmark {label}', url=f'https://benchmark.invalid/{label}/feed/', is_active=False,
+            )
+            for label in ('compressed', 'plain')
+        }
+
+        def html(i):
+            # Feed HTML: boilerplate markup around paragraphs of prose
+            paragraphs = ''.join(
+                f'<p class="article-body__paragraph">{" ".join(rng.choices(words, k=60))}.</p>'
+                for _ in range(6)
+            )
+            return (
+                f'<div class="article-body"><figure><img src="https://benchmark.invalid/images/{i}.jpg" '
+                f'alt="" loading="lazy"></figure>{paragraphs}<p>The post <a href="https://benchmark.invalid/'
+                f'posts/{i}" rel="nofollow">appeared first</a> on Benchmark News.</p></div>'
+            )
+
+        def stored_bytes(source):
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT content FROM articles_article WHERE source_id = %s', [source.pk])
+                return sum(len(value.encode() if isinstance(value, str) else value) for (value,) in cursor.fetchall())
+
+        def reads(source):
+            queryset = Article.objects.select_related('source', 'category').filter(source=source).order_by('-published_at')
+            first = queryset.first().pk
+
+            def list_page():
+                page = list(queryset.defer('content')[:20])
+                JSONRenderer().render(ArticleListSerializer(page, many=True).data)
+
+            def detail():
+                JSONRenderer().render(ArticleSerializer(queryset.get(pk=first)).data)
+
+            def expanded_page():
+                JSONRenderer().render(ArticleSerializer(list(queryset[:20]), many=True).data)
+
+            return [self.measure(run, options['repeat'])[0] for run in (list_page, detail, expanded_page)]
+
+        if not stores_compressed(connection):
+            self.stdout.write(self.style.WARNING(
+                f'  ⚠ {connection.vendor} keeps content as text (compressed by the database itself)'
+            ))
+
+        created = 0
+        self.stdout.write(
+            f'\n  {"articles":>8}  {"storage":>10}  {"content MB":>10}  {"list ms":>7}  {"detail ms":>9}'
+            f'  {"expand ms":>9}  {"dict MB":>7}'
+        )
+        for size in sorted(sizes):
+            texts = [html(i) for i in range(created, size)]
+            for label, source in sources.items():
+                Article.objects.bulk_create([
+                    Article(
+                        title=f'Benchmark article {i}',
+                        slug=f'benchmark-content-{label}-{i}',
+                        url=f'https://benchmark.invalid/{label}/{i}',
+                        summary=text[:200],
+                        content=text,
+                        source=source,
+                        published_at=timezone.now() - timezone.timedelta(minutes=i),
+                    )
+                    for i, text in enumerate(texts, start=created)
+                ], batch_size=1000)
+            # Plain rows hold the text itself, exactly as before compression
+            with connection.cursor() as cursor:
+                cursor.executemany(
+                    'UPDATE articles_article SET content = %s WHERE url = %s',
+                    [(text, f'https://benchmark.invalid/plain/{i}') for i, text in enumerate(texts, start=created)],
+                )
+            created = max(created, size)
+
+            sample = [decompress(value) for value in Article.objects.filter(
+                source=sources['compressed']).values_list('content', flat=True)[:2000]]
+            sample_bytes = sum(len(text.encode()) for text in sample)
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / 'benchmark.dict'
+                with override_settings(ARTICLE_CONTENT_DICTIONARY=None):
+                    path.write_bytes(train_dictionary(sample))
+                with override_settings(ARTICLE_CONTENT_DICTIONARY=path):
+                    dict_ratio = sum(len(compress(text)) for text in sample) / sample_bytes
+            dict_total = stored_bytes(sources['plain']) * dict_ratio
+
+            for label, source in sources.items():
+                list_ms, detail_ms, expand_ms = reads(source)
+                dict_column = f'{dict_total / 1e6:>7.2f}' if label == 'compressed' else f'{"":>7}'
+                self.stdout.write(
+                    f'  {size:>8}  {label:>10}  {stored_bytes(source) / 1e6:>10.2f}  {list_ms:>7.2f}'
+                    f'  {detail_ms:>9.2f}  {expand_ms:>9.2f}  {dict_column}'
+                )
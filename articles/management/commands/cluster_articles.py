@@ -0,0 +1,103 @@
+"""
+Django management command to group stored articles into near-duplicate clusters.
+
+Usage:
+    python manage.py cluster_articles
+    python manage.py cluster_articles --rebuild
+    python manage.py cluster_articles --chunk-size 500
+
+This command:
+- Fingerprints articles that have no SimHash yet (all of them with --rebuild)
+- Streams them in primary key order, one chunk at a time
+- Matches each chunk against the banded SimHash index and the articles
+  before it, and stores the cluster of every duplicate found
+- Adds the chunk to the index
+
+fetch_articles clusters new articles as they arrive; run this once to
+cover articles stored before clustering existed, or with --rebuild after
+changing the thresholds in articles/similarity.py.
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from articles.caching import invalidate_api_cache
+from articles.models import Article, ArticleSimhashBand
+from articles.similarity import article_simhash, assign_clusters
+
+
+class Command(BaseCommand):
+    """
+    Fingerprint and cluster stored articles.
+    """
+    help = 'Group stored articles into near-duplicate clusters'
+
+    def add_arguments(self, parser):
+        """
+        Add optional command-line arguments.
+        """
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Articles loaded and updated per batch (default: 1000)',
+        )
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Discard all fingerprints and clusters and start over',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Walk the articles table in chunks, fingerprinting and clustering.
+        """
+        chunk_size = max(1, options['chunk_size'])
+        articles = Article.objects.only(
+            'id', 'title', 'summary', 'published_at', 'simhash', 'cluster_id'
+        ).order_by('pk')
+
+        if options['rebuild']:
+            with transaction.atomic():
+                ArticleSimhashBand.objects.all().delete()
+                Article.objects.filter(cluster_id__isnull=False).update(cluster_id=None, updated_at=timezone.now())
+                invalidate_api_cache()
+        else:
+            articles = articles.filter(simhash__isnull=True)
+
+        self.stdout.write(self.style.SUCCESS('Clustering articles...'))
+
+        total_scanned = 0
+        total_clustered = 0
+        last_pk = 0
+
+        while True:
+            # Keyset pagination: constant memory, and safe to write while iterating
+            chunk = list(articles.filter(pk__gt=last_pk)[:chunk_size])
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+
+            for article in chunk:
+                article.simhash = article_simhash({'title': article.title, 'summary': article.summary})
+
+            with transaction.atomic():
+                Article.objects.bulk_update(chunk, ['simhash'])
+                clustered = assign_clusters(chunk)
+                if clustered:
+                    now = timezone.now()
+                    for article in clustered:
+                        article.updated_at = now
+                    Article.objects.bulk_update(clustered, ['cluster_id', 'updated_at'])
+                    invalidate_api_cache()
+
+            total_scanned += len(chunk)
+            total_clustered += len(clustered)
+            self.stdout.write(f'  Scanned {total_scanned} articles, {total_clustered} duplicates')
+
+        # Print overall summary
+        self.stdout.write('\n' + '='*70)
+        self.stdout.write(self.style.SUCCESS('Clustering complete!'))
+        self.stdout.write(f'  Articles scanned: {total_scanned}')
+        self.stdout.write(self.style.WARNING(f'  ↻ Duplicates clustered: {total_clustered}'))
+        self.stdout.write('='*70)
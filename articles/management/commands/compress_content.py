@@ -0,0 +1,145 @@
+"""
+Django management command to train a content dictionary and recompress articles.
+
+Usage:
+    python manage.py compress_content
+    python manage.py compress_content --train dictionaries/content-2026-10.dict
+    python manage.py compress_content --train dictionaries/content.dict --samples 5000
+
+This command:
+- With --train, builds a compression dictionary from a sample of recent
+  articles and writes it to the given file; point
+  ARTICLE_CONTENT_DICTIONARY at it to use it for new articles
+- Otherwise, rewrites the content of every article not yet stored with
+  the configured codec and dictionary, one chunk per transaction
+
+Run it after changing ARTICLE_CONTENT_COMPRESSION or the dictionary;
+until then older rows stay readable, as long as their dictionary file
+is kept next to the current one.
+"""
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from articles.compression import (
+    current_codec,
+    decompress,
+    dictionary_id,
+    is_current,
+    stores_compressed,
+    train_dictionary,
+)
+from articles.models import Article
+
+
+class Command(BaseCommand):
+    """
+    Train a content dictionary, or recompress stored article content.
+    """
+    help = 'Train a content compression dictionary or recompress stored articles'
+
+    def add_arguments(self, parser):
+        """
+        Add optional command-line arguments.
+        """
+        parser.add_argument(
+            '--train',
+            metavar='PATH',
+            help='Write a dictionary trained on recent articles to PATH',
+        )
+        parser.add_argument(
+            '--samples',
+            type=int,
+            default=2000,
+            help='Articles sampled with --train (default: 2000)',
+        )
+        parser.add_argument(
+            '--size',
+            type=int,
+            default=32 * 1024,
+            help='Dictionary size in bytes with --train (default: 32768)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Articles rewritten per transaction (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Train a dictionary with --train, otherwise recompress.
+        """
+        if options['train']:
+            self.train(Path(options['train']), options['samples'], options['size'])
+        else:
+            self.recompress(max(1, options['chunk_size']))
+
+    def train(self, path, samples, size):
+        """
+        Build a dictionary from the newest articles with content.
+        """
+        values = (
+            Article.objects.exclude(content='')
+            .order_by('-published_at')
+            .values_list('content', flat=True)[:samples]
+        )
+        texts = [decompress(value) for value in values]
+        if len(texts) < 10:
+            raise CommandError('Need at least 10 articles with content to train a dictionary.')
+
+        self.stdout.write(self.style.SUCCESS(f'Training dictionary on {len(texts)} articles...'))
+        dictionary = train_dictionary(texts, size)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(dictionary)
+
+        self.stdout.write('\n' + '='*70)
+        self.stdout.write(self.style.SUCCESS('Training complete!'))
+        self.stdout.write(f'  ✓ Dictionary: {path} ({len(dictionary)} bytes, id {dictionary_id(dictionary):08x})')
+        self.stdout.write(f'  Set ARTICLE_CONTENT_DICTIONARY = {str(path)!r}, then run compress_content')
+        self.stdout.write('='*70)
+
+    def recompress(self, chunk_size):
+        """
+        Rewrite stored content that uses another codec or dictionary.
+        """
+        if not stores_compressed(connection):
+            self.stdout.write(self.style.WARNING(
+                f'  ⚠ {connection.vendor} stores content as text; nothing to recompress'
+            ))
+            return
+        current_codec()  # fail early on a bad ARTICLE_CONTENT_COMPRESSION
+
+        self.stdout.write(self.style.SUCCESS('Recompressing article content...'))
+
+        articles = Article.objects.only('id', 'content').order_by('pk')
+        total_scanned = 0
+        total_rewritten = 0
+        last_pk = 0
+
+        while True:
+            # Keyset pagination: constant memory, and safe to write while iterating
+            chunk = list(articles.filter(pk__gt=last_pk)[:chunk_size])
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+
+            stale = [article for article in chunk if not is_current(article.__dict__['content'])]
+            for article in stale:
+                # Replace the stored bytes with the text, which is compressed on save
+                article.content = decompress(article.__dict__['content'])
+            if stale:
+                with transaction.atomic():
+                    Article.objects.bulk_update(stale, ['content'])
+
+            total_scanned += len(chunk)
+            total_rewritten += len(stale)
+            self.stdout.write(f'  Scanned {total_scanned} articles, {total_rewritten} rewritten')
+
+        # Print overall summary
+        self.stdout.write('\n' + '='*70)
+        self.stdout.write(self.style.SUCCESS('Recompression complete!'))
+        self.stdout.write(f'  Articles scanned: {total_scanned}')
+        self.stdout.write(self.style.WARNING(f'  ↻ Articles rewritten: {total_rewritten}'))
+        self.stdout.write('='*70)
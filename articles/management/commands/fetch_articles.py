@@ -4,22 +4,42 @@ Django management command to fetch articles from RSS feeds.
 Usage:
     python manage.py fetch_articles
     python manage.py fetch_articles --source 1
+    python manage.py fetch_articles --workers 8
+    python manage.py fetch_articles --force
+    python manage.py fetch_articles --stats fetch.jsonl --summary run.json
+    python manage.py fetch_articles --profile fetch.prof
 
 This command:
 - Fetches all active RSS sources from the database
+- Downloads feeds in parallel when --workers is greater than 1
+- Skips feeds that are unchanged (ETag / Last-Modified / body hash)
 - Parses their RSS feeds using feedparser
-- Creates or updates articles in the database
-- Prevents duplicates based on article URL
+- Creates new articles and rewrites only those whose content changed,
+  one batched transaction per source
+- Prevents duplicates based on the canonical article URL (tracking
+  parameters, fragments and http/https differences are ignored)
 - Handles encoding issues gracefully
-- Logs results to console
+- Logs results to console, and optionally per-source timing statistics
+  as JSON lines (--stats) and a JSON run summary (--summary)
 
 Run this command manually or schedule it with cron/celery.
 """
-import feedparser
-import requests
+import cProfile
+import io
+import json
+import pstats
+from contextlib import nullcontext
+
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from articles.models import Source, Article
+from articles.archive import retention_cutoff
+from articles.canonical import canonicalize_url
+from articles.categorizer import get_categorizer
+from articles.feeds import FeedFetcher
+from articles.ingest import CREATED, CHANGED, ingest_articles
+from articles.instrumentation import RunStats, SourceStats
+from articles.models import Source
+from articles.scheduling import next_fetch_time
 
 
 class Command(BaseCommand):
@@ -28,6 +48,12 @@ class Command(BaseCommand):
     """
     help = 'Fetch articles from active RSS feed sources'
 
+    categorizer = None
+    # Statistics of the run and of the source being processed
+    run_stats = None
+    source_stats = None
+    stats_file = None
+
     def add_arguments(self, parser):
         """
         Add optional command-line arguments.
@@ -37,8 +63,57 @@ class Command(BaseCommand):
             type=int,
             help='Fetch from specific source ID only',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of feeds to download and parse in parallel (default: 1)',
+        )
+        parser.add_argument(
+            '--per-host',
+            type=int,
+            default=2,
+            help='Maximum concurrent requests to the same host (default: 2)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Ignore stored ETag/Last-Modified/body hash and re-process every feed',
+        )
+        parser.add_argument(
+            '--stats',
+            metavar='FILE',
+            help='Append per-source timing statistics as JSON lines to FILE ("-" for stdout)',
+        )
+        parser.add_argument(
+            '--summary',
+            metavar='FILE',
+            help='Write a JSON summary of the run to FILE',
+        )
+        parser.add_argument(
+            '--profile',
+            metavar='FILE',
+            help='Run under cProfile, save the stats to FILE and print the hottest functions',
+        )
 
     def handle(self, *args, **options):
+        """
+        Run the fetch, optionally under cProfile.
+        """
+        if not options['profile']:
+            return self.fetch(options)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(self.fetch, options)
+        finally:
+            profiler.dump_stats(options['profile'])
+            self.stdout.write(self.style.SUCCESS(f'\nProfile saved to {options["profile"]}'))
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats('cumulative').print_stats(25)
+            self.stdout.write(report.getvalue())
+
+    def fetch(self, options):
         """
         Main command logic - fetch and process RSS feeds.
         """
@@ -54,140 +129,257 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING('No active RSS sources found.'))
             return
         
-        total_fetched = 0
-        total_created = 0
-        total_updated = 0
-        total_skipped = 0
+        totals = {'fetched': 0, 'created': 0, 'changed': 0, 'unchanged': 0, 'skipped': 0, 'not_modified': 0}
+        self.categorizer = get_categorizer()
+        self.run_stats = RunStats()
+        
+        # Downloads may run on worker threads; every result is handled
+        # here on the main thread, so all DB writes stay serialized.
+        fetcher = FeedFetcher(
+            workers=options['workers'],
+            per_host=options['per_host'],
+            conditional=not options['force'],
+        )
+        with self.open_stats_file(options['stats']), fetcher:
+            for result in fetcher.fetch_all(sources):
+                counts = self.process_result(result)
+                for key, value in counts.items():
+                    totals[key] += value
+            self.write_stats(self.run_stats.as_dict())
+        
+        if options['summary']:
+            with open(options['summary'], 'w', encoding='utf-8') as summary:
+                json.dump(self.run_stats.as_dict(include_sources=True), summary, indent=2)
         
-        # Process each source
-        for source in sources:
-            self.stdout.write(f'\nFetching from: {source.name}')
-            self.stdout.write(f'  URL: {source.url}')
+        # Print overall summary
+        self.stdout.write('\n' + '='*70)
+        self.stdout.write(self.style.SUCCESS('Fetch complete!'))
+        self.stdout.write(f'  Total entries processed: {totals["fetched"]}')
+        self.stdout.write(self.style.SUCCESS(f'  ✓ New articles created: {totals["created"]}'))
+        self.stdout.write(self.style.WARNING(f'  ↻ Existing articles changed: {totals["changed"]}'))
+        self.stdout.write(f'  = Existing articles unchanged: {totals["unchanged"]}')
+        if totals['skipped'] > 0:
+            self.stdout.write(self.style.ERROR(f'  ✗ Entries skipped: {totals["skipped"]}'))
+        if totals['not_modified'] > 0:
+            self.stdout.write(f'  = Sources not modified: {totals["not_modified"]}')
+        self.stdout.write(f'  Time: {self.run_stats.wall_seconds:.2f}s')
+        self.stdout.write('='*70)
+
+    def open_stats_file(self, path):
+        """
+        Open the --stats destination for the run (a no-op without one).
+
+        Args:
+            path: file path, "-" for stdout, or None
+        """
+        if not path:
+            return nullcontext()
+        if path == '-':
+            self.stats_file = self.stdout
+            return nullcontext()
+        self.stats_file = open(path, 'a', encoding='utf-8')
+        return self.stats_file
+
+    def write_stats(self, record):
+        """Write one JSON statistics record, if --stats was given."""
+        if self.stats_file is not None:
+            self.stats_file.write(json.dumps(record) + '\n')
+
+    def stage(self, name):
+        """Time a stage of the current source (no-op outside process_result)."""
+        if self.source_stats is None:
+            return nullcontext()
+        return self.source_stats.stage(name)
+
+    def fetch_seconds(self):
+        """Time spent on the current source so far (None outside process_result)."""
+        if self.source_stats is None:
+            return None
+        return round(self.source_stats.elapsed(), 3)
+
+    def process_result(self, result):
+        """
+        Save the entries of a fetched feed and record statistics on it.
+
+        Args:
+            result: FeedResult from the fetcher
+
+        Returns:
+            dict: counts from ``save_result``
+        """
+        self.source_stats = stats = SourceStats.for_result(result)
+        if result.not_modified:
+            stats.status = 'not_modified'
+        try:
+            with stats.track_queries():
+                counts = self.save_result(result)
+        finally:
+            self.source_stats = None
+
+        stats.record_counts(counts)
+        if self.run_stats is not None:
+            self.run_stats.add(stats)
+        self.write_stats(stats.as_dict())
+        return counts
+
+    def save_result(self, result):
+        """
+        Save the entries of a fetched feed and report on them.
+
+        Args:
+            result: FeedResult from the fetcher
+
+        Returns:
+            dict: counts of fetched, created, changed, unchanged and skipped
+            entries, plus whether the source was not modified
+        """
+        source = result.source
+        counts = {'fetched': 0, 'created': 0, 'changed': 0, 'unchanged': 0, 'skipped': 0, 'not_modified': 0}
+        
+        self.stdout.write(f'\nFetching from: {source.name}')
+        self.stdout.write(f'  URL: {source.url}')
+        
+        if result.error:
+            self.stdout.write(self.style.ERROR(f'  ✗ {result.error}'))
+            self.record_failure(source)
+            return counts
+        
+        if result.not_modified:
+            # Nothing new to parse: just record that we checked
+            counts['not_modified'] = 1
+            self.stdout.write('  = Not modified since last fetch')
+            self.save_fetch_state(source, result)
+            return counts
+        
+        feed = result.feed
+        
+        try:
+            # Check if feed was parsed successfully
+            if feed.bozo and not feed.entries:
+                # Only error if there are NO entries (some feeds have minor bozo warnings)
+                self.stdout.write(
+                    self.style.ERROR(f'  ✗ Parse Error: {feed.get("bozo_exception", "Unknown error")}')
+                )
+                self.record_failure(source)
+                return counts
             
-            try:
-                # Fetch RSS feed with proper encoding and error handling
-                try:
-                    response = requests.get(
-                        source.url,
-                        timeout=30,
-                        headers={
-                            'User-Agent': 'TechPulse/1.0 (RSS Reader; +https://github.com/matandasoftware/tech-pulse)'
-                        }
-                    )
-                    response.raise_for_status()
-                    
-                    # Parse the feed (feedparser handles encoding detection)
-                    feed = feedparser.parse(response.content)
-                    
-                except requests.exceptions.Timeout:
-                    self.stdout.write(
-                        self.style.ERROR(f'  ✗ Timeout: Feed took too long to respond')
-                    )
-                    continue
-                    
-                except requests.exceptions.ConnectionError:
-                    self.stdout.write(
-                        self.style.ERROR(f'  ✗ Connection Error: Could not reach feed')
-                    )
-                    continue
-                    
-                except requests.exceptions.HTTPError as e:
-                    self.stdout.write(
-                        self.style.ERROR(f'  ✗ HTTP Error: {e.response.status_code}')
-                    )
-                    continue
-                    
-                except requests.exceptions.RequestException as e:
-                    self.stdout.write(
-                        self.style.ERROR(f'  ✗ Request Error: {str(e)}')
-                    )
-                    continue
-                
-                # Check if feed was parsed successfully
-                if feed.bozo and not feed.entries:
-                    # Only error if there are NO entries (some feeds have minor bozo warnings)
-                    self.stdout.write(
-                        self.style.ERROR(f'  ✗ Parse Error: {feed.get("bozo_exception", "Unknown error")}')
-                    )
-                    continue
-                
-                # Check if feed has entries
-                if not feed.entries:
-                    self.stdout.write(
-                        self.style.WARNING(f'  ⚠ No entries found in feed')
-                    )
-                    continue
-                
-                self.stdout.write(f'  Found {len(feed.entries)} entries')
-                
-                # Process each entry in the feed
-                entries_created = 0
-                entries_updated = 0
-                entries_skipped = 0
-                
+            # Check if feed has entries
+            if not feed.entries:
+                self.stdout.write(
+                    self.style.WARNING(f'  ⚠ No entries found in feed')
+                )
+                # An empty feed is a successful fetch that found nothing new
+                self.save_fetch_state(source, result)
+                return counts
+            
+            self.stdout.write(f'  Found {len(feed.entries)} entries')
+            
+            # Extract article data from each entry
+            articles_data = []
+            # Entries past the retention window would only be archived again
+            cutoff = retention_cutoff(source)
+            with self.stage('extract'):
                 for entry in feed.entries:
-                    total_fetched += 1
+                    counts['fetched'] += 1
                     
                     try:
-                        # Extract article data
                         article_data = self.extract_article_data(entry, source)
                         
                         # Skip if no URL (invalid entry)
                         if not article_data.get('url'):
-                            entries_skipped += 1
-                            total_skipped += 1
+                            counts['skipped'] += 1
                             continue
                         
-                        # Create or update article
-                        article, created = Article.objects.update_or_create(
-                            url=article_data['url'],
-                            defaults=article_data
-                        )
+                        if cutoff and article_data['published_at'] < cutoff:
+                            counts['skipped'] += 1
+                            continue
                         
-                        if created:
-                            entries_created += 1
-                            total_created += 1
-                            self.stdout.write(
-                                self.style.SUCCESS(f'  ✓ Created: {article.title[:60]}...')
-                            )
-                        else:
-                            entries_updated += 1
-                            total_updated += 1
-                            self.stdout.write(
-                                self.style.WARNING(f'  ↻ Updated: {article.title[:60]}...')
-                            )
+                        articles_data.append(article_data)
                     
                     except Exception as e:
-                        entries_skipped += 1
-                        total_skipped += 1
+                        counts['skipped'] += 1
                         self.stdout.write(
                             self.style.ERROR(f'  ✗ Error processing entry: {str(e)[:50]}')
                         )
                         continue
-                
-                # Print source summary
-                self.stdout.write(
-                    f'  Summary: {entries_created} created, {entries_updated} updated, {entries_skipped} skipped'
-                )
-                
-                # Update source last_fetched timestamp
-                source.last_fetched = timezone.now()
-                source.save()
-                
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'  ✗ Unexpected error: {str(e)}')
-                )
+            
+            # Create or update all articles of this source in one transaction
+            with self.stage('ingest'):
+                ingested = ingest_articles(articles_data)
+            
+            for article, status in ingested.rows:
+                if status == CREATED:
+                    self.stdout.write(
+                        self.style.SUCCESS(f'  ✓ Created: {article.title[:60]}...')
+                    )
+                elif status == CHANGED:
+                    self.stdout.write(
+                        self.style.WARNING(f'  ↻ Changed: {article.title[:60]}...')
+                    )
+            
+            counts['created'] += ingested.created
+            counts['changed'] += ingested.changed
+            counts['unchanged'] += ingested.unchanged
+            
+            # Print source summary
+            self.stdout.write(
+                f'  Summary: {counts["created"]} created, {counts["changed"]} changed, '
+                f'{counts["unchanged"]} unchanged, {counts["skipped"]} skipped'
+            )
+            
+            # Update source last_fetched timestamp and validators
+            self.save_fetch_state(source, result, created=counts['created'])
+            
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f'  ✗ Unexpected error: {str(e)}')
+            )
+            self.record_failure(source)
         
-        # Print overall summary
-        self.stdout.write('\n' + '='*70)
-        self.stdout.write(self.style.SUCCESS('Fetch complete!'))
-        self.stdout.write(f'  Total entries processed: {total_fetched}')
-        self.stdout.write(self.style.SUCCESS(f'  ✓ New articles created: {total_created}'))
-        self.stdout.write(self.style.WARNING(f'  ↻ Existing articles updated: {total_updated}'))
-        if total_skipped > 0:
-            self.stdout.write(self.style.ERROR(f'  ✗ Entries skipped: {total_skipped}'))
-        self.stdout.write('='*70)
+        return counts
+
+    def save_fetch_state(self, source, result, created=0):
+        """
+        Record a successful fetch on the source.
+
+        Validators are only stored once the feed has been processed, so
+        a failed run never causes the next one to skip the feed.
+
+        Args:
+            source: Source model instance
+            result: FeedResult from the fetcher
+            created: number of new articles the fetch produced
+        """
+        now = timezone.now()
+        source.last_fetched = now
+        source.etag = result.etag[:255]
+        source.last_modified = result.last_modified[:100]
+        source.content_hash = result.content_hash
+        source.consecutive_failures = 0
+        source.idle_fetches = 0 if created else source.idle_fetches + 1
+        source.next_fetch_at = next_fetch_time(source, now)
+        source.last_fetch_seconds = self.fetch_seconds()
+        with self.stage('save'):
+            source.save(update_fields=[
+                'last_fetched', 'etag', 'last_modified', 'content_hash',
+                'consecutive_failures', 'idle_fetches', 'next_fetch_at',
+                'last_fetch_seconds', 'updated_at',
+            ])
+
+    def record_failure(self, source):
+        """
+        Record a failed fetch on the source and back off its next fetch.
+
+        Args:
+            source: Source model instance
+        """
+        if self.source_stats is not None:
+            self.source_stats.status = 'error'
+        source.consecutive_failures += 1
+        source.next_fetch_at = next_fetch_time(source)
+        source.last_fetch_seconds = self.fetch_seconds()
+        with self.stage('save'):
+            source.save(update_fields=['consecutive_failures', 'next_fetch_at', 'last_fetch_seconds', 'updated_at'])
 
     def detect_category(self, title, content, summary):
         """
@@ -201,54 +393,12 @@ class Command(BaseCommand):
         Returns:
             Category object or None
         """
-        from articles.models import Category
-
-        # Combine all text for keyword matching (lowercase)
-        text = f"{title} {content} {summary}".lower()
-
-        # Define keyword mappings for categories (matching DB category names)
-        category_keywords = {
-            'Artificial Intelligence': ['artificial intelligence', 'machine learning', 'deep learning', 
-                                        'neural network', 'ai', 'gpt', 'chatgpt', 'llm', 'openai', 
-                                        'generative', 'cognitive computing', 'ml', 'ai model'],
-            'Startups': ['startup', 'startups', 'funding', 'venture capital', 'vc', 'seed round',
-                         'series a', 'series b', 'entrepreneur', 'entrepreneurship', 'founder',
-                         'unicorn', 'investment', 'investors'],
-            'Mobile': ['mobile', 'android', 'ios', 'swift', 'kotlin', 'flutter', 'react native', 
-                       'mobile app', 'smartphone', 'iphone', 'samsung', 'app store', 'play store'],
-            'Security': ['security', 'cybersecurity', 'hack', 'breach', 'vulnerability', 
-                         'encryption', 'malware', 'ransomware', 'firewall', 'privacy', 
-                         'data breach', 'cyber attack', 'phishing'],
-            'Business': ['business', 'corporate', 'economics', 'finance', 'strategy', 'merger',
-                         'acquisition', 'ceo', 'revenue', 'profit', 'market', 'commerce',
-                         'enterprise', 'management'],
-            'Science': ['science', 'scientific', 'research', 'space', 'physics', 'biology',
-                        'chemistry', 'astronomy', 'nasa', 'laboratory', 'study', 'experiment',
-                        'discovery', 'quantum'],
-            'Software': ['software', 'programming', 'developer', 'coding', 'code', 'framework',
-                         'library', 'api', 'web development', 'frontend', 'backend', 'javascript',
-                         'python', 'java', 'devops', 'ci/cd', 'github', 'open source'],
-            'Technology': ['technology', 'tech', 'innovation', 'digital', 'gadget', 'device',
-                          'electronics', 'hardware', 'computing', 'internet', 'web', 'online',
-                          'platform', 'service', 'product', 'launch', 'release', 'announcement'],
-        }
-        # Score each category based on keyword matches
-        scores = {}
-        for category_name, keywords in category_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text)
-            if score > 0:
-                scores[category_name] = score
-
-        # If we found matching keywords, return the highest scoring category
-        if scores:
-            best_category_name = max(scores, key=scores.get)
-            try:
-                return Category.objects.get(name=best_category_name)
-            except Category.DoesNotExist:
-                pass
+        # One compiled categorizer (and category cache) per run
+        if self.categorizer is None:
+            self.categorizer = get_categorizer()
 
-        # Return None if no category matches
-        return None
+        with self.stage('categorize'):
+            return self.categorizer.classify(f"{title} {content} {summary}")
 
     def extract_article_data(self, entry, source):
         """
@@ -266,8 +416,8 @@ class Command(BaseCommand):
         if not title:
             title = 'Untitled Article'
         
-        # Get URL (required)
-        url = entry.get('link', '').strip()
+        # Get URL (required), without tracking parameters or fragment
+        url = canonicalize_url(entry.get('link', ''))
         
         # Get content/summary
         content = ''
@@ -0,0 +1,114 @@
+"""
+Django management command to re-run categorization on stored articles.
+
+Usage:
+    python manage.py reclassify_articles
+    python manage.py reclassify_articles --source 1 --dry-run
+    python manage.py reclassify_articles --chunk-size 500
+
+This command:
+- Compiles the current category rules once
+- Streams existing articles in primary key order, one chunk at a time
+- Classifies each chunk with the compiled categorizer
+- Bulk updates only the articles whose category changed
+
+Run it after editing category rules to apply them to history.
+"""
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from articles.caching import invalidate_api_cache
+from articles.categorizer import get_categorizer
+from articles.counts import apply_count_deltas
+from articles.models import Category, Article
+
+
+class Command(BaseCommand):
+    """
+    Reclassify stored articles with the current category rules.
+    """
+    help = 'Re-run auto-categorization over existing articles'
+
+    def add_arguments(self, parser):
+        """
+        Add optional command-line arguments.
+        """
+        parser.add_argument(
+            '--source',
+            type=int,
+            help='Only reclassify articles from this source ID',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Articles loaded and updated per batch (default: 1000)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would change without writing',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Walk the articles table in chunks and update changed categories.
+        """
+        categorizer = get_categorizer()
+        chunk_size = max(1, options['chunk_size'])
+
+        articles = Article.objects.only('id', 'title', 'content', 'summary', 'category_id').order_by('pk')
+        if options['source']:
+            articles = articles.filter(source_id=options['source'])
+
+        self.stdout.write(self.style.SUCCESS('Reclassifying articles...'))
+
+        total_scanned = 0
+        total_changed = 0
+        last_pk = 0
+
+        while True:
+            # Keyset pagination: constant memory, and safe to write while iterating
+            chunk = list(articles.filter(pk__gt=last_pk)[:chunk_size])
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+
+            categories = categorizer.classify_many(
+                f"{article.title} {article.content} {article.summary}" for article in chunk
+            )
+
+            now = timezone.now()
+            changed = []
+            deltas = Counter()
+            for article, category in zip(chunk, categories):
+                category_id = category.pk if category else None
+                if article.category_id != category_id:
+                    deltas[article.category_id] -= 1
+                    deltas[category_id] += 1
+                    article.category = category
+                    article.updated_at = now
+                    changed.append(article)
+
+            if changed and not options['dry_run']:
+                with transaction.atomic():
+                    Article.objects.bulk_update(changed, ['category', 'updated_at'])
+                    apply_count_deltas(Category, deltas)
+                    invalidate_api_cache()
+
+            total_scanned += len(chunk)
+            total_changed += len(changed)
+            self.stdout.write(f'  Scanned {total_scanned} articles, {total_changed} changed')
+
+        # Print overall summary
+        self.stdout.write('\n' + '='*70)
+        self.stdout.write(self.style.SUCCESS('Reclassification complete!'))
+        self.stdout.write(f'  Articles scanned: {total_scanned}')
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'  ↻ Would change: {total_changed} (dry run, nothing saved)'))
+        else:
+            self.stdout.write(self.style.WARNING(f'  ↻ Categories changed: {total_changed}'))
+        self.stdout.write('='*70)
@@ -0,0 +1,37 @@
+"""
+Django management command to recompute stored article counts.
+
+Usage:
+    python manage.py recount_articles
+
+This command:
+- Recomputes Source.article_count and Category.article_count from the
+  articles table, one UPDATE per model
+- Repairs drift caused by articles created, moved or deleted outside
+  the fetch commands (admin, API, shell)
+
+Only needed when ARTICLE_COUNTS_DENORMALIZED is enabled, but harmless otherwise.
+"""
+from django.core.management.base import BaseCommand
+
+from articles.caching import invalidate_api_cache
+from articles.counts import recount_articles
+from articles.models import Source, Category
+
+
+class Command(BaseCommand):
+    """
+    Recompute denormalized article counts.
+    """
+    help = 'Recompute the stored article counts of sources and categories'
+
+    def handle(self, *args, **options):
+        """
+        Recount articles for every source and category.
+        """
+        sources = recount_articles(Source)
+        categories = recount_articles(Category)
+        invalidate_api_cache()
+        self.stdout.write(self.style.SUCCESS(
+            f'Recounted articles for {sources} sources and {categories} categories.'
+        ))
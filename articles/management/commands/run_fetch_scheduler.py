@@ -0,0 +1,165 @@
+"""
+Django management command that keeps sources fetched on their own schedule.
+
+Usage:
+    python manage.py run_fetch_scheduler
+    python manage.py run_fetch_scheduler --workers 8 --refresh 120
+    python manage.py run_fetch_scheduler --once
+
+This command:
+- Keeps a priority queue of active RSS sources ordered by their next due time
+  (``next_fetch_at``, or ``last_fetched + fetch_interval`` when never scheduled)
+- Dispatches due sources to a pool of download workers
+- Saves results on the main thread, exactly like ``fetch_articles``
+- Backs off sources that keep failing or rarely produce new articles
+- Persists ``next_fetch_at`` so a restart resumes where it left off
+- Reloads the source list periodically to pick up admin changes
+
+Run it as a long-lived process (systemd, supervisor, a Windows service)
+instead of scheduling ``fetch_articles`` on a fixed timer.
+"""
+import heapq
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.db import close_old_connections
+from django.utils import timezone
+
+from articles.categorizer import get_categorizer
+from articles.feeds import FeedFetcher
+from articles.management.commands.fetch_articles import Command as FetchArticlesCommand
+from articles.models import Source
+from articles.scheduling import due_time
+
+
+# Never sleep longer than this, so Ctrl+C and refreshes stay responsive
+MAX_SLEEP = 30
+
+
+class Command(FetchArticlesCommand):
+    """
+    Fetch each source when it is due, forever (or once with --once).
+    """
+    help = 'Run a scheduler that fetches each source according to its fetch_interval'
+
+    def add_arguments(self, parser):
+        """
+        Add optional command-line arguments.
+        """
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Number of feeds downloaded in parallel (default: 4)',
+        )
+        parser.add_argument(
+            '--per-host',
+            type=int,
+            default=2,
+            help='Maximum concurrent requests to the same host (default: 2)',
+        )
+        parser.add_argument(
+            '--refresh',
+            type=int,
+            default=300,
+            help='Seconds between reloads of the source list (default: 300)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Fetch the sources that are due now, then exit',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Main scheduler loop.
+        """
+        workers = max(1, options['workers'])
+        self.stdout.write(self.style.SUCCESS(f'Starting fetch scheduler ({workers} workers)...'))
+
+        self.queue = []
+        self.sources = {}
+        in_flight = {}
+        next_refresh = 0
+
+        fetcher = FeedFetcher(workers=workers, per_host=options['per_host'])
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fetch')
+
+        try:
+            while True:
+                close_old_connections()
+
+                if time.monotonic() >= next_refresh:
+                    self.load_sources(exclude=set(in_flight.values()))
+                    self.categorizer = get_categorizer()
+                    next_refresh = time.monotonic() + options['refresh']
+
+                # Hand every due source to a worker, as long as one is free
+                now = timezone.now()
+                while self.queue and self.queue[0][0] <= now and len(in_flight) < workers:
+                    due, source_id = heapq.heappop(self.queue)
+                    source = self.sources.get(source_id)
+                    if source is None or due != due_time(source):
+                        # Stale entry left behind by a reload or reschedule
+                        continue
+                    in_flight[executor.submit(fetcher.fetch, source)] = source_id
+
+                if options['once'] and not in_flight:
+                    if not self.queue or self.queue[0][0] > now:
+                        break
+
+                timeout = min(MAX_SLEEP, max(0, next_refresh - time.monotonic()))
+                if self.queue:
+                    timeout = min(timeout, max(0, (self.queue[0][0] - now).total_seconds()))
+
+                if not in_flight:
+                    time.sleep(timeout)
+                    continue
+
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    source_id = in_flight.pop(future)
+                    result = future.result()
+                    source = self.sources.get(source_id)
+                    if source is not None:
+                        # A reload during the fetch may have brought admin edits
+                        # (fetch_interval, ...): record the fetch on that instance
+                        result.source = source
+                    # Writes next_fetch_at (with back-off) on the source
+                    self.process_result(result)
+                    if source is not None:
+                        heapq.heappush(self.queue, (due_time(source), source_id))
+
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('\nStopping scheduler...'))
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            fetcher.close()
+
+        self.stdout.write(self.style.SUCCESS('Scheduler stopped.'))
+
+    def load_sources(self, exclude=()):
+        """
+        Rebuild the priority queue from the database.
+
+        Args:
+            exclude: IDs of sources currently being fetched; they are
+                re-queued when their fetch completes
+        """
+        sources = Source.objects.filter(is_active=True, source_type='RSS')
+        self.sources = {source.pk: source for source in sources}
+        self.queue = [
+            (due_time(source), source.pk)
+            for source in self.sources.values()
+            if source.pk not in exclude
+        ]
+        heapq.heapify(self.queue)
+
+        if self.queue:
+            next_due = timezone.localtime(self.queue[0][0])
+            self.stdout.write(
+                f'Loaded {len(self.sources)} sources, next due at {next_due:%Y-%m-%d %H:%M:%S}'
+            )
+        else:
+            self.stdout.write(self.style.WARNING('No active RSS sources found.'))
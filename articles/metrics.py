@@ -0,0 +1,281 @@
+"""
+Prometheus metrics for the Tech Pulse API and feed ingestion.
+
+This module exposes ``/metrics`` in the Prometheus text format:
+- Counter, Histogram, Gauge: Minimal thread-safe metric types
+- MetricsMiddleware: Request latency, DB queries and cache hits per view
+- ingest_gauges: Per-source ingest state, read from the Source table
+- metrics_view: Render everything for a scrape
+
+Request metrics live in the memory of each web process, like the
+default local-memory cache: with several worker processes every scrape
+sees one worker. Ingest gauges are written by ``fetch_articles`` to the
+sources table, so every process reports the same values. No client
+library or external service is needed.
+"""
+import threading
+import time
+from contextlib import ExitStack
+
+from django.db import connections
+from django.db.models import Count
+from django.http import HttpResponse
+
+from .counts import with_article_counts
+from .models import Article, Source
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+
+def escape_label(value):
+    """Escape a label value for the text exposition format."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{escape_label(value)}"' for name, value in pairs) + '}'
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """A named metric family with a fixed set of label names."""
+    kind = 'untyped'
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} {self.kind}']
+        with self.lock:
+            items = sorted(self.values.items())
+        for label_values, value in items:
+            lines.extend(self.render_sample(label_values, value))
+        return lines
+
+    def render_sample(self, label_values, value):
+        return [f'{self.name}{format_labels(self.labels, label_values)} {format_value(value)}']
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, label_values=(), amount=1):
+        with self.lock:
+            self.values[label_values] = self.values.get(label_values, 0) + amount
+
+
+class Gauge(Metric):
+    kind = 'gauge'
+
+    def set(self, label_values, value):
+        with self.lock:
+            self.values[label_values] = value
+
+
+class Histogram(Metric):
+    """
+    Cumulative histogram; each sample is stored as
+    ``[per-bucket counts..., sum, count]``.
+    """
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, label_values, value):
+        with self.lock:
+            sample = self.values.get(label_values)
+            if sample is None:
+                sample = self.values[label_values] = [0] * len(self.buckets) + [0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    sample[index] += 1
+                    break
+            sample[-2] += value
+            sample[-1] += 1
+
+    def render_sample(self, label_values, sample):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, sample):
+            cumulative += count
+            labels = format_labels(self.labels, label_values, [('le', format_value(float(bound)))])
+            lines.append(f'{self.name}_bucket{labels} {cumulative}')
+        labels = format_labels(self.labels, label_values, [('le', '+Inf')])
+        lines.append(f'{self.name}_bucket{labels} {sample[-1]}')
+        labels = format_labels(self.labels, label_values)
+        lines.append(f'{self.name}_sum{labels} {format_value(float(sample[-2]))}')
+        lines.append(f'{self.name}_count{labels} {sample[-1]}')
+        return lines
+
+
+VIEW_LABELS = ('view', 'action')
+
+REQUESTS = Counter(
+    'techpulse_http_requests_total',
+    'HTTP requests handled, by view, action, method and status code.',
+    VIEW_LABELS + ('method', 'status'),
+)
+REQUEST_LATENCY = Histogram(
+    'techpulse_http_request_duration_seconds',
+    'Time spent handling a request, middleware included.',
+    VIEW_LABELS,
+)
+REQUEST_QUERIES = Histogram(
+    'techpulse_http_request_db_queries',
+    'Database queries run per request.',
+    VIEW_LABELS,
+    buckets=QUERY_COUNT_BUCKETS,
+)
+REQUEST_QUERY_TIME = Histogram(
+    'techpulse_http_request_db_query_seconds',
+    'Time spent in database queries per request.',
+    VIEW_LABELS,
+)
+API_CACHE = Counter(
+    'techpulse_api_cache_requests_total',
+    'Cacheable API requests by result (hit or miss).',
+    VIEW_LABELS + ('result',),
+)
+
+REQUEST_METRICS = [REQUESTS, REQUEST_LATENCY, REQUEST_QUERIES, REQUEST_QUERY_TIME, API_CACHE]
+
+
+def view_labels(request):
+    """
+    Return ``(view, action)`` for the resolved request.
+
+    Viewset routes are labelled with the router basename and the
+    viewset action (``article``, ``list``); other views with their URL
+    name. Unresolved URLs share one label so 404 scans stay bounded.
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return ('unmatched', '')
+    func = match.func
+    actions = getattr(func, 'actions', None)
+    if actions is not None:
+        basename = func.initkwargs.get('basename') or func.cls.__name__
+        return (basename, actions.get(request.method.lower(), request.method.lower()))
+    return (match.view_name or func.__name__, '')
+
+
+class MetricsMiddleware:
+    """
+    Record latency, database queries and API cache hits for each request.
+
+    Add it near the top of ``MIDDLEWARE`` so the measured time covers
+    the other middleware as well.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = [0, 0.0]
+
+        def count_query(execute, sql, params, many, context):
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                queries[0] += 1
+                queries[1] += time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            # Reads may be routed to another alias (articles.routers)
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(count_query))
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        labels = view_labels(request)
+        REQUESTS.inc(labels + (request.method, str(response.status_code)))
+        REQUEST_LATENCY.observe(labels, elapsed)
+        REQUEST_QUERIES.observe(labels, queries[0])
+        REQUEST_QUERY_TIME.observe(labels, queries[1])
+
+        cache_hit = getattr(request, 'api_cache_hit', None)
+        if cache_hit is not None:
+            API_CACHE.inc(labels + ('hit' if cache_hit else 'miss',))
+        return response
+
+
+def ingest_gauges():
+    """
+    Build the per-source ingest gauges from the Source table.
+
+    ``fetch_articles`` keeps ``last_fetched`` (successful fetches only),
+    ``consecutive_failures`` and ``last_fetch_seconds`` current; article
+    counts follow ``ARTICLE_COUNTS_DENORMALIZED``. One query per scrape.
+
+    Returns:
+        list: Gauge metrics
+    """
+    labels = ('source_id', 'source')
+    articles = Gauge('techpulse_source_articles', 'Articles stored per source.', labels)
+    last_success = Gauge(
+        'techpulse_source_last_success_timestamp_seconds',
+        'Unix time of the last successful fetch of the source.',
+        labels,
+    )
+    failures = Gauge(
+        'techpulse_source_consecutive_failures',
+        'Failed fetches of the source in a row.',
+        labels,
+    )
+    duration = Gauge(
+        'techpulse_source_last_fetch_duration_seconds',
+        'How long the last fetch of the source took.',
+        labels,
+    )
+    active = Gauge('techpulse_source_active', 'Whether the source is being fetched (1) or not (0).', labels)
+
+    sources = with_article_counts(Source.objects.all()).values_list(
+        'pk', 'name', 'is_active', 'num_articles',
+        'last_fetched', 'consecutive_failures', 'last_fetch_seconds',
+    )
+    for pk, name, is_active, num_articles, last_fetched, consecutive_failures, last_fetch_seconds in sources:
+        label_values = (pk, name)
+        articles.set(label_values, num_articles)
+        failures.set(label_values, consecutive_failures)
+        active.set(label_values, int(is_active))
+        if last_fetched is not None:
+            last_success.set(label_values, last_fetched.timestamp())
+        if last_fetch_seconds is not None:
+            duration.set(label_values, last_fetch_seconds)
+
+    total = Gauge('techpulse_articles', 'Articles stored.')
+    total.set((), Article.objects.aggregate(total=Count('pk'))['total'])
+    return [articles, last_success, failures, duration, active, total]
+
+
+def render_metrics():
+    """Return every metric in the Prometheus text exposition format."""
+    lines = []
+    for metric in REQUEST_METRICS + ingest_gauges():
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_view(request):
+    """Serve ``/metrics`` for Prometheus to scrape."""
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)
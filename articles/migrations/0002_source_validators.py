@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='source',
+            name='content_hash',
+            field=models.CharField(blank=True, help_text='SHA-256 of the feed body from the last fetch', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='source',
+            name='etag',
+            field=models.CharField(blank=True, help_text='ETag returned by the feed on the last fetch', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='source',
+            name='last_modified',
+            field=models.CharField(blank=True, help_text='Last-Modified header returned by the feed on the last fetch', max_length=100),
+        ),
+    ]
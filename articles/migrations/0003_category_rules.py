@@ -0,0 +1,41 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0002_source_validators'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Generation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='Name of the cached data (e.g., category_rules)', max_length=50, unique=True)),
+                ('value', models.PositiveBigIntegerField(default=0, help_text='Current version')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CategoryRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pattern', models.CharField(help_text='Keyword (matched as whole words) or regular expression', max_length=200)),
+                ('match_type', models.CharField(choices=[('KEYWORD', 'Keyword'), ('REGEX', 'Regular Expression')], default='KEYWORD', help_text='How the pattern is matched against article text', max_length=20)),
+                ('weight', models.PositiveSmallIntegerField(default=1, help_text='Points added to the category when the rule matches')),
+                ('is_active', models.BooleanField(default=True, help_text='Whether this rule is used for categorization')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('category', models.ForeignKey(help_text='Category this rule votes for', on_delete=django.db.models.deletion.CASCADE, related_name='rules', to='articles.category')),
+            ],
+            options={
+                'verbose_name': 'Category Rule',
+                'verbose_name_plural': 'Category Rules',
+                'ordering': ['category__name', 'pattern'],
+            },
+        ),
+    ]
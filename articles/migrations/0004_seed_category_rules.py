@@ -0,0 +1,59 @@
+# Generated by Django 6.0.2 on 2026-10-17 07:10
+
+from django.db import migrations
+
+
+# The built-in keyword lists of articles.categorizer as of this migration
+CATEGORY_KEYWORDS = {
+    'Artificial Intelligence': ['artificial intelligence', 'machine learning', 'deep learning',
+                                'neural network', 'ai', 'gpt', 'chatgpt', 'llm', 'openai',
+                                'generative', 'cognitive computing', 'ml', 'ai model'],
+    'Startups': ['startup', 'startups', 'funding', 'venture capital', 'vc', 'seed round',
+                 'series a', 'series b', 'entrepreneur', 'entrepreneurship', 'founder',
+                 'unicorn', 'investment', 'investors'],
+    'Mobile': ['mobile', 'android', 'ios', 'swift', 'kotlin', 'flutter', 'react native',
+               'mobile app', 'smartphone', 'iphone', 'samsung', 'app store', 'play store'],
+    'Security': ['security', 'cybersecurity', 'hack', 'breach', 'vulnerability',
+                 'encryption', 'malware', 'ransomware', 'firewall', 'privacy',
+                 'data breach', 'cyber attack', 'phishing'],
+    'Business': ['business', 'corporate', 'economics', 'finance', 'strategy', 'merger',
+                 'acquisition', 'ceo', 'revenue', 'profit', 'market', 'commerce',
+                 'enterprise', 'management'],
+    'Science': ['science', 'scientific', 'research', 'space', 'physics', 'biology',
+                'chemistry', 'astronomy', 'nasa', 'laboratory', 'study', 'experiment',
+                'discovery', 'quantum'],
+    'Software': ['software', 'programming', 'developer', 'coding', 'code', 'framework',
+                 'library', 'api', 'web development', 'frontend', 'backend', 'javascript',
+                 'python', 'java', 'devops', 'ci/cd', 'github', 'open source'],
+    'Technology': ['technology', 'tech', 'innovation', 'digital', 'gadget', 'device',
+                   'electronics', 'hardware', 'computing', 'internet', 'web', 'online',
+                   'platform', 'service', 'product', 'launch', 'release', 'announcement'],
+}
+
+
+def seed_rules(apps, schema_editor):
+    """
+    Turn the built-in keyword lists into CategoryRule rows for the
+    categories that already exist, so they can be tuned in the admin.
+    """
+    Category = apps.get_model('articles', 'Category')
+    CategoryRule = apps.get_model('articles', 'CategoryRule')
+
+    categories = {category.name: category for category in Category.objects.all()}
+    CategoryRule.objects.bulk_create([
+        CategoryRule(category=categories[name], pattern=keyword, match_type='KEYWORD', weight=1)
+        for name, keywords in CATEGORY_KEYWORDS.items()
+        if name in categories
+        for keyword in keywords
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0003_category_rules'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_rules, migrations.RunPython.noop),
+    ]
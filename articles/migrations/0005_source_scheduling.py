@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0004_seed_category_rules'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='source',
+            name='consecutive_failures',
+            field=models.PositiveIntegerField(default=0, help_text='Failed fetches in a row (used for back-off)'),
+        ),
+        migrations.AddField(
+            model_name='source',
+            name='idle_fetches',
+            field=models.PositiveIntegerField(default=0, help_text='Successful fetches in a row without new articles (used for back-off)'),
+        ),
+        migrations.AddField(
+            model_name='source',
+            name='next_fetch_at',
+            field=models.DateTimeField(blank=True, db_index=True, help_text='When the scheduler will next fetch this source', null=True),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:58
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_counts(apps, schema_editor):
+    """Fill the new article_count columns from the articles table."""
+    Article = apps.get_model('articles', 'Article')
+    for model_name in ('source', 'category'):
+        model = apps.get_model('articles', model_name)
+        counts = (
+            Article.objects.filter(**{model_name: OuterRef('pk')})
+            .order_by()
+            .values(model_name)
+            .annotate(total=Count('id'))
+            .values('total')
+        )
+        model.objects.update(article_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0006_article_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='article_count',
+            field=models.PositiveIntegerField(default=0, help_text='Stored number of articles (kept current by fetches; see recount_articles)'),
+        ),
+        migrations.AddField(
+            model_name='source',
+            name='article_count',
+            field=models.PositiveIntegerField(default=0, help_text='Stored number of articles (kept current by fetches; see recount_articles)'),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 6.0.2 on 2026-10-17 08:05
+
+from django.db import migrations
+
+from ._fts5 import FTS_DROP, create_index, run, sqlite_has_fts5
+
+
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE articles_article ADD COLUMN search_document tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(author, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(content, '')), 'C')
+    ) STORED
+    """,
+    'CREATE INDEX articles_article_search_idx ON articles_article USING GIN (search_document)',
+]
+
+POSTGRES_REVERSE = [
+    'DROP INDEX IF EXISTS articles_article_search_idx',
+    'ALTER TABLE articles_article DROP COLUMN IF EXISTS search_document',
+]
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Create the full-text index for the current database backend.
+    Backends without one keep using DRF's icontains search.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite' and sqlite_has_fts5(schema_editor):
+        create_index(schema_editor)
+    elif vendor == 'postgresql':
+        run(schema_editor, POSTGRES_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        run(schema_editor, FTS_DROP)
+    elif vendor == 'postgresql':
+        run(schema_editor, POSTGRES_REVERSE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0007_article_counts'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.2 on 2026-10-17 07:10
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0008_article_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('article_id', models.BigIntegerField(help_text='ID of the deleted article')),
+                ('url', models.URLField(help_text='URL of the deleted article')),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now, help_text='When the article was deleted')),
+            ],
+            options={
+                'verbose_name': 'Article Tombstone',
+                'verbose_name_plural': 'Article Tombstones',
+                'ordering': ['deleted_at', 'id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['updated_at', 'id'], name='article_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='articletombstone',
+            index=models.Index(fields=['deleted_at', 'id'], name='tombstone_deleted_idx'),
+        ),
+    ]
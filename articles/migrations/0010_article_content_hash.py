@@ -0,0 +1,53 @@
+# Generated by Django 6.0.2 on 2026-10-17 07:11
+
+import hashlib
+
+from django.db import migrations, models
+
+from ._fts5 import restore_triggers
+
+
+# Copied from articles.ingest as of this migration, so later changes to
+# the fingerprint cannot change what it backfills
+FINGERPRINT_FIELDS = ['title', 'summary', 'content', 'author', 'image_url']
+
+def article_fingerprint(data):
+    digest = hashlib.sha256()
+    for name in FINGERPRINT_FIELDS:
+        digest.update((data.get(name) or '').encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def backfill_fingerprints(apps, schema_editor):
+    """Fingerprint stored articles so the next fetch can skip unchanged ones."""
+    Article = apps.get_model('articles', 'Article')
+    articles = Article.objects.only('id', *FINGERPRINT_FIELDS).order_by('pk')
+    last_pk = 0
+    while True:
+        chunk = list(articles.filter(pk__gt=last_pk)[:1000])
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+        for article in chunk:
+            article.content_hash = article_fingerprint(vars(article))
+        # bulk_update leaves updated_at alone
+        Article.objects.bulk_update(chunk, ['content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0009_article_changes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='Fingerprint of the feed content, to skip unchanged re-fetches', max_length=64),
+        ),
+        # Adding the column rebuilds articles_article on SQLite, dropping the search triggers
+        migrations.RunPython(restore_triggers, migrations.RunPython.noop),
+        migrations.RunPython(backfill_fingerprints, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-17 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0010_article_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='source',
+            name='last_fetch_seconds',
+            field=models.FloatField(blank=True, help_text='How long the last fetch took, download to save (successful or not)', null=True),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 6.0.2 on 2026-10-17 10:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from ._fts5 import restore_triggers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0011_source_last_fetch_seconds'),
+    ]
+
+    operations = [
+        # Unapplying rebuilds articles_article on SQLite (cluster_id is indexed),
+        # dropping the search triggers
+        migrations.RunPython(migrations.RunPython.noop, restore_triggers),
+        migrations.AddField(
+            model_name='article',
+            name='cluster_id',
+            field=models.BigIntegerField(blank=True, db_index=True, editable=False, help_text='ID of the earliest article telling the same story (empty for the first one)', null=True),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='simhash',
+            field=models.BigIntegerField(blank=True, editable=False, help_text='64-bit SimHash of title and summary (signed), for near-duplicate detection', null=True),
+        ),
+        migrations.CreateModel(
+            name='ArticleSimhashBand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('band', models.PositiveSmallIntegerField(help_text='Band number (0-3)')),
+                ('value', models.PositiveIntegerField(help_text='Bits of the SimHash in this band')),
+                ('article', models.ForeignKey(help_text='Article the band belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='simhash_bands', to='articles.article')),
+            ],
+            options={
+                'verbose_name': 'Article SimHash Band',
+                'verbose_name_plural': 'Article SimHash Bands',
+                'indexes': [models.Index(fields=['band', 'value'], name='simhash_band_idx')],
+            },
+        ),
+    ]
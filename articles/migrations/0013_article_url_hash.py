@@ -0,0 +1,92 @@
+# Generated by Django 6.0.2 on 2026-10-17 11:02
+
+import hashlib
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+
+import articles.canonical
+from django.db import migrations
+
+
+# Copied from articles.canonical as of this migration, so later changes
+# to the canonical form cannot change the hashes it backfills
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'gbraid', 'wbraid', 'msclkid', 'yclid', 'twclid',
+    'igshid', 'mc_cid', 'mc_eid', '_hsenc', '_hsmi', 'mkt_tok',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url):
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    netloc = parts.hostname
+    if ':' in netloc:
+        netloc = f'[{netloc}]'
+    if parts.username or parts.password:
+        netloc = f'{parts.netloc.rpartition("@")[0]}@{netloc}'
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc = f'{netloc}:{port}'
+
+    query = sorted(
+        param for param in parts.query.split('&')
+        if param and not is_tracking_param(unquote_plus(param.partition('=')[0]))
+    )
+    return urlunsplit((scheme, netloc, parts.path or '/', '&'.join(query), ''))
+
+
+def url_key(url):
+    canonical = canonicalize_url(url)
+    scheme, sep, rest = canonical.partition('://')
+    return rest if sep and scheme in DEFAULT_PORTS else canonical
+
+
+def url_hash(url):
+    digest = hashlib.blake2b(url_key(url).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def backfill_url_hashes(apps, schema_editor):
+    """Hash the URL of every stored article (the URLs themselves are left as they are)."""
+    Article = apps.get_model('articles', 'Article')
+    articles = Article.objects.only('id', 'url').order_by('pk')
+    last_pk = 0
+    while True:
+        chunk = list(articles.filter(pk__gt=last_pk)[:1000])
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+        for article in chunk:
+            article.url_hash = url_hash(article.url)
+        # bulk_update leaves updated_at alone
+        Article.objects.bulk_update(chunk, ['url_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0012_article_clusters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='url_hash',
+            field=articles.canonical.URLHashField(help_text='64-bit hash of the canonical URL (scheme ignored), used for lookups', null=True),
+        ),
+        migrations.RunPython(backfill_url_hashes, migrations.RunPython.noop),
+    ]
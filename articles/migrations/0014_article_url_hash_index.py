@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-17 11:02
+
+import articles.canonical
+from django.db import migrations, models
+
+from ._fts5 import restore_triggers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0013_article_url_hash'),
+    ]
+
+    # Changing url_hash rebuilds articles_article on SQLite either way,
+    # dropping the search triggers
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, restore_triggers),
+        migrations.AlterField(
+            model_name='article',
+            name='url_hash',
+            field=articles.canonical.URLHashField(help_text='64-bit hash of the canonical URL (scheme ignored), used for lookups'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['url_hash'], name='article_url_hash_idx'),
+        ),
+        migrations.RemoveConstraint(
+            model_name='article',
+            name='unique_source_url',
+        ),
+        migrations.RunPython(restore_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-17 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0014_article_url_hash_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='source',
+            name='retention_days',
+            field=models.PositiveIntegerField(blank=True, help_text='Archive articles older than this many days (empty: ARTICLE_RETENTION_DAYS)', null=True),
+        ),
+    ]
@@ -0,0 +1,146 @@
+# Generated by Django 6.0.2 on 2026-10-17 09:40
+
+from django.db import migrations
+
+import articles.compression
+
+from ._fts5 import FTS_DROP, create_index, run, sqlite_has_fts5
+
+
+CHUNK_SIZE = 1000
+
+# Contentless: the index never reads articles_article (whose content is
+# compressed); the triggers hand it decompressed text instead
+SQLITE_SEARCH = [
+    """
+    CREATE VIRTUAL TABLE articles_article_fts USING fts5(
+        title, summary, content, author,
+        content='',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER articles_article_fts_ai AFTER INSERT ON articles_article BEGIN
+        INSERT INTO articles_article_fts(rowid, title, summary, content, author)
+        VALUES (new.id, new.title, new.summary, tp_decompress(new.content), new.author);
+    END
+    """,
+    """
+    CREATE TRIGGER articles_article_fts_ad AFTER DELETE ON articles_article BEGIN
+        INSERT INTO articles_article_fts(articles_article_fts, rowid, title, summary, content, author)
+        VALUES ('delete', old.id, old.title, old.summary, tp_decompress(old.content), old.author);
+    END
+    """,
+    """
+    CREATE TRIGGER articles_article_fts_au AFTER UPDATE OF title, summary, content, author
+    ON articles_article BEGIN
+        INSERT INTO articles_article_fts(articles_article_fts, rowid, title, summary, content, author)
+        VALUES ('delete', old.id, old.title, old.summary, tp_decompress(old.content), old.author);
+        INSERT INTO articles_article_fts(rowid, title, summary, content, author)
+        VALUES (new.id, new.title, new.summary, tp_decompress(new.content), new.author);
+    END
+    """,
+    """
+    INSERT INTO articles_article_fts(rowid, title, summary, content, author)
+    SELECT id, title, summary, tp_decompress(content), author FROM articles_article
+    """,
+]
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        run(schema_editor, FTS_DROP)
+
+
+def create_search_index(apps, schema_editor):
+    """Index decompressed content (SQLite); PostgreSQL's tsvector column is unchanged."""
+    if schema_editor.connection.vendor == 'sqlite' and sqlite_has_fts5(schema_editor):
+        articles.compression.register_sqlite_functions(schema_editor.connection)
+        run(schema_editor, SQLITE_SEARCH)
+
+
+def create_plain_search_index(apps, schema_editor):
+    """The index as 0008_article_search created it, over plain text content."""
+    if schema_editor.connection.vendor == 'sqlite' and sqlite_has_fts5(schema_editor):
+        create_index(schema_editor)
+
+
+def compress_content(apps, schema_editor):
+    """Rewrite existing content compressed, one chunk per UPDATE."""
+    if not articles.compression.stores_compressed(schema_editor.connection):
+        return
+    Article = apps.get_model('articles', 'Article')
+    articles_with_content = Article.objects.only('id', 'content').order_by('pk')
+    last_pk = 0
+    while True:
+        chunk = list(articles_with_content.filter(pk__gt=last_pk)[:CHUNK_SIZE])
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+        # Rows read back as str are the ones still stored as plain text
+        plain = [article for article in chunk if isinstance(article.__dict__['content'], str)]
+        if plain:
+            Article.objects.bulk_update(plain, ['content'])
+
+
+def decompress_content(apps, schema_editor):
+    """Write content back as plain text, ahead of the column becoming TEXT again."""
+    if not articles.compression.stores_compressed(schema_editor.connection):
+        return
+    Article = apps.get_model('articles', 'Article')
+    articles_with_content = Article.objects.only('id', 'content').order_by('pk')
+    last_pk = 0
+    with schema_editor.connection.cursor() as cursor:
+        while True:
+            chunk = list(articles_with_content.filter(pk__gt=last_pk)[:CHUNK_SIZE])
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+            cursor.executemany(
+                'UPDATE articles_article SET content = %s WHERE id = %s',
+                [(article.content, article.pk) for article in chunk],
+            )
+
+
+def use_lz4_toast(apps, schema_editor):
+    """On PostgreSQL, compress large content with lz4 where the server supports it."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_settings WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)"
+        )
+        if cursor.fetchone():
+            cursor.execute('ALTER TABLE articles_article ALTER COLUMN content SET COMPRESSION lz4')
+
+
+def use_default_toast(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_settings WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)"
+        )
+        if cursor.fetchone():
+            cursor.execute('ALTER TABLE articles_article ALTER COLUMN content SET COMPRESSION default')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0015_source_retention'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_search_index, create_plain_search_index),
+        migrations.AlterField(
+            model_name='article',
+            name='content',
+            field=articles.compression.CompressedTextField(
+                blank=True, help_text='Full article content (if fetched), stored compressed'
+            ),
+        ),
+        migrations.RunPython(compress_content, decompress_content),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(use_lz4_toast, use_default_toast),
+    ]
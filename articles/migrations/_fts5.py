@@ -0,0 +1,79 @@
+"""
+Frozen SQL for the SQLite FTS5 index created by 0008_article_search.
+
+On SQLite, migrations that rebuild ``articles_article`` (adding,
+altering or removing some columns) drop the index's triggers along
+with the old table. They run ``restore_triggers`` after the rebuild.
+Like the migrations themselves, this must not change once released:
+the index as it is now is defined in ``articles.search``. The leading
+underscore keeps the migration loader from treating it as a migration.
+"""
+
+FTS_TABLE = """
+    CREATE VIRTUAL TABLE articles_article_fts USING fts5(
+        title, summary, content, author,
+        content='articles_article',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+"""
+
+FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS articles_article_fts_ai AFTER INSERT ON articles_article BEGIN
+        INSERT INTO articles_article_fts(rowid, title, summary, content, author)
+        VALUES (new.id, new.title, new.summary, new.content, new.author);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS articles_article_fts_ad AFTER DELETE ON articles_article BEGIN
+        INSERT INTO articles_article_fts(articles_article_fts, rowid, title, summary, content, author)
+        VALUES ('delete', old.id, old.title, old.summary, old.content, old.author);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS articles_article_fts_au AFTER UPDATE OF title, summary, content, author
+    ON articles_article BEGIN
+        INSERT INTO articles_article_fts(articles_article_fts, rowid, title, summary, content, author)
+        VALUES ('delete', old.id, old.title, old.summary, old.content, old.author);
+        INSERT INTO articles_article_fts(rowid, title, summary, content, author)
+        VALUES (new.id, new.title, new.summary, new.content, new.author);
+    END
+    """,
+]
+
+FTS_REBUILD = "INSERT INTO articles_article_fts(articles_article_fts) VALUES ('rebuild')"
+
+FTS_DROP = [
+    'DROP TRIGGER IF EXISTS articles_article_fts_au',
+    'DROP TRIGGER IF EXISTS articles_article_fts_ad',
+    'DROP TRIGGER IF EXISTS articles_article_fts_ai',
+    'DROP TABLE IF EXISTS articles_article_fts',
+]
+
+
+def sqlite_has_fts5(schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('PRAGMA compile_options')
+        return any(row[0] == 'ENABLE_FTS5' for row in cursor.fetchall())
+
+
+def run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_index(schema_editor):
+    """Create the FTS5 table and its triggers, and index every article."""
+    run(schema_editor, [FTS_TABLE, *FTS_TRIGGERS, FTS_REBUILD])
+
+
+def restore_triggers(apps, schema_editor):
+    """Recreate the triggers after a table rebuild and reindex (SQLite with the index only)."""
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_article_fts'")
+        if cursor.fetchone() is None:
+            return
+    run(schema_editor, [*FTS_TRIGGERS, FTS_REBUILD])
@@ -4,15 +4,26 @@ Django models for the Tech Pulse Articles Application.
 This module defines the core data models for news aggregation:
 - Source: News sources (RSS feeds, APIs, websites)
 - Category: Article categorization (Tech, Business, Science, etc.)
+- CategoryRule: Keyword/pattern rules used to auto-categorize articles
 - Article: Aggregated news articles from external sources
+- ArticleSimhashBand: Banded SimHash index for near-duplicate lookups
+- ArticleTombstone: Record of a deleted article, for incremental sync
+- Generation: Version counters used to invalidate in-memory caches
 
 Each model includes validation, custom methods, and relationships
 to support automated news aggregation and display.
 """
+import re
+
+from django.core.exceptions import ValidationError
 from django.db import models
-from django.utils.text import slugify
+from django.db.models import F
 from django.utils import timezone
 
+from .canonical import URLHashField
+from .compression import CompressedTextField
+from .slugs import unique_slug
+
 
 class Source(models.Model):
     """
@@ -57,6 +68,58 @@ class Source(models.Model):
         help_text='When we last fetched articles from this source'
     )
     
+    next_fetch_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text='When the scheduler will next fetch this source'
+    )
+    
+    consecutive_failures = models.PositiveIntegerField(
+        default=0,
+        help_text='Failed fetches in a row (used for back-off)'
+    )
+    
+    last_fetch_seconds = models.FloatField(
+        null=True,
+        blank=True,
+        help_text='How long the last fetch took, download to save (successful or not)'
+    )
+    
+    retention_days = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text='Archive articles older than this many days (empty: ARTICLE_RETENTION_DAYS)'
+    )
+    
+    idle_fetches = models.PositiveIntegerField(
+        default=0,
+        help_text='Successful fetches in a row without new articles (used for back-off)'
+    )
+    
+    article_count = models.PositiveIntegerField(
+        default=0,
+        help_text='Stored number of articles (kept current by fetches; see recount_articles)'
+    )
+    
+    etag = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text='ETag returned by the feed on the last fetch'
+    )
+    
+    last_modified = models.CharField(
+        max_length=100,
+        blank=True,
+        help_text='Last-Modified header returned by the feed on the last fetch'
+    )
+    
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text='SHA-256 of the feed body from the last fetch'
+    )
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -92,6 +155,11 @@ class Category(models.Model):
         help_text='Category description'
     )
     
+    article_count = models.PositiveIntegerField(
+        default=0,
+        help_text='Stored number of articles (kept current by fetches; see recount_articles)'
+    )
+    
     created_at = models.DateTimeField(auto_now_add=True)
     
     def save(self, *args, **kwargs):
@@ -100,13 +168,7 @@ class Category(models.Model):
         Ensures slug is unique.
         """
         if not self.slug:
-            self.slug = slugify(self.name)
-            # Ensure slug is unique
-            original_slug = self.slug
-            counter = 1
-            while Category.objects.filter(slug=self.slug).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
+            self.slug = unique_slug(Category, self.name, self.name)
         
         super().save(*args, **kwargs)
     
@@ -119,6 +181,66 @@ class Category(models.Model):
         ordering = ['name']
 
 
+class CategoryRule(models.Model):
+    """
+    A keyword or regular expression that votes for a category.
+    Rules are compiled into the categorizer used by fetch_articles
+    and reclassify_articles; editing them takes effect without a deploy.
+    """
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name='rules',
+        help_text='Category this rule votes for'
+    )
+    
+    pattern = models.CharField(
+        max_length=200,
+        help_text='Keyword (matched as whole words) or regular expression'
+    )
+    
+    match_type = models.CharField(
+        max_length=20,
+        choices=[
+            ('KEYWORD', 'Keyword'),
+            ('REGEX', 'Regular Expression'),
+        ],
+        default='KEYWORD',
+        help_text='How the pattern is matched against article text'
+    )
+    
+    weight = models.PositiveSmallIntegerField(
+        default=1,
+        help_text='Points added to the category when the rule matches'
+    )
+    
+    is_active = models.BooleanField(
+        default=True,
+        help_text='Whether this rule is used for categorization'
+    )
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def clean(self):
+        """
+        Validate that regular expression rules compile.
+        """
+        if self.match_type == 'REGEX':
+            try:
+                re.compile(self.pattern)
+            except re.error as e:
+                raise ValidationError({'pattern': f'Invalid regular expression: {e}'})
+    
+    def __str__(self):
+        return f"{self.pattern} → {self.category.name}"
+    
+    class Meta:
+        verbose_name = 'Category Rule'
+        verbose_name_plural = 'Category Rules'
+        ordering = ['category__name', 'pattern']
+
+
 class Article(models.Model):
     """
     Represents a news article aggregated from external sources.
@@ -141,9 +263,13 @@ class Article(models.Model):
         help_text='Original article URL'
     )
     
-    content = models.TextField(
+    url_hash = URLHashField(
+        help_text='64-bit hash of the canonical URL (scheme ignored), used for lookups'
+    )
+    
+    content = CompressedTextField(
         blank=True,
-        help_text='Full article content (if fetched)'
+        help_text='Full article content (if fetched), stored compressed'
     )
     
     summary = models.TextField(
@@ -190,19 +316,35 @@ class Article(models.Model):
     
     updated_at = models.DateTimeField(auto_now=True)
     
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        help_text='Fingerprint of the feed content, to skip unchanged re-fetches'
+    )
+    
+    simhash = models.BigIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text='64-bit SimHash of title and summary (signed), for near-duplicate detection'
+    )
+    
+    cluster_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text='ID of the earliest article telling the same story (empty for the first one)'
+    )
+    
     def save(self, *args, **kwargs):
         """
         Auto-generate slug from title if not provided.
         Ensures slug is unique.
         """
         if not self.slug:
-            self.slug = slugify(self.title)
-            # Ensure slug is unique
-            original_slug = self.slug
-            counter = 1
-            while Article.objects.filter(slug=self.slug).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
+            self.slug = unique_slug(Article, self.title, self.url)
         
         super().save(*args, **kwargs)
     
@@ -213,10 +355,117 @@ class Article(models.Model):
         verbose_name = 'Article'
         verbose_name_plural = 'Articles'
         ordering = ['-published_at']
-        # Prevent duplicate articles from same source
-        constraints = [
-            models.UniqueConstraint(
-                fields=['source', 'url'],
-                name='unique_source_url'
-            )
-        ]
\ No newline at end of file
+        # Serve the default newest-first listing (optionally filtered by
+        # category or source) straight from an index instead of sorting
+        indexes = [
+            models.Index(fields=['category', '-published_at'], name='article_category_pub_idx'),
+            models.Index(fields=['source', '-published_at'], name='article_source_pub_idx'),
+            models.Index(fields=['-published_at'], name='article_published_idx'),
+            models.Index(fields=['fetched_at'], name='article_fetched_idx'),
+            # Keyset scans of the changes feed
+            models.Index(fields=['updated_at', 'id'], name='article_updated_idx'),
+            # URL lookups probe this 8-byte key instead of the url index
+            models.Index(fields=['url_hash'], name='article_url_hash_idx'),
+        ]
+        # Duplicate URLs are prevented by the unique url column; a
+        # (source, url) constraint on top of it would only add an index
+
+
+class ArticleSimhashBand(models.Model):
+    """
+    One 16-bit band of an article's SimHash.
+    Articles whose fingerprints differ in at most three bits share at
+    least one of their four bands, so near-duplicate candidates are
+    found with indexed equality lookups instead of a table scan.
+    """
+    article = models.ForeignKey(
+        Article,
+        on_delete=models.CASCADE,
+        related_name='simhash_bands',
+        help_text='Article the band belongs to'
+    )
+    
+    band = models.PositiveSmallIntegerField(
+        help_text='Band number (0-3)'
+    )
+    
+    value = models.PositiveIntegerField(
+        help_text='Bits of the SimHash in this band'
+    )
+    
+    def __str__(self):
+        return f"Article {self.article_id} band {self.band}: {self.value:04x}"
+    
+    class Meta:
+        verbose_name = 'Article SimHash Band'
+        verbose_name_plural = 'Article SimHash Bands'
+        indexes = [
+            models.Index(fields=['band', 'value'], name='simhash_band_idx'),
+        ]
+
+
+class ArticleTombstone(models.Model):
+    """
+    Marks an article as deleted.
+    Lets API clients that mirror articles learn about deletions from
+    the changes feed instead of re-listing everything.
+    """
+    article_id = models.BigIntegerField(
+        help_text='ID of the deleted article'
+    )
+    
+    url = models.URLField(
+        help_text='URL of the deleted article'
+    )
+    
+    deleted_at = models.DateTimeField(
+        default=timezone.now,
+        help_text='When the article was deleted'
+    )
+    
+    def __str__(self):
+        return f"Article {self.article_id} deleted at {self.deleted_at}"
+    
+    class Meta:
+        verbose_name = 'Article Tombstone'
+        verbose_name_plural = 'Article Tombstones'
+        ordering = ['deleted_at', 'id']
+        indexes = [
+            models.Index(fields=['deleted_at', 'id'], name='tombstone_deleted_idx'),
+        ]
+
+
+class Generation(models.Model):
+    """
+    A named, monotonically increasing version counter.
+    Bumped whenever the data behind an in-memory cache changes, so every
+    process can tell with one cheap query whether its cache is stale.
+    """
+    key = models.CharField(
+        max_length=50,
+        unique=True,
+        help_text='Name of the cached data (e.g., category_rules)'
+    )
+    
+    value = models.PositiveBigIntegerField(
+        default=0,
+        help_text='Current version'
+    )
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    @classmethod
+    def current(cls, key):
+        """Return the current version of ``key`` (0 if never bumped)."""
+        return cls.objects.filter(key=key).values_list('value', flat=True).first() or 0
+    
+    @classmethod
+    def bump(cls, key):
+        """Increment the version of ``key``."""
+        bumped = cls.objects.filter(key=key).update(value=F('value') + 1, updated_at=timezone.now())
+        if not bumped:
+            generation, _ = cls.objects.get_or_create(key=key)
+            cls.objects.filter(pk=generation.pk).update(value=F('value') + 1, updated_at=timezone.now())
+    
+    def __str__(self):
+        return f"{self.key}: {self.value}"
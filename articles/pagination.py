@@ -0,0 +1,114 @@
+"""
+Pagination classes for the Tech Pulse Articles API.
+
+This module contains:
+- ArticlePagination: Page numbers by default, keyset cursors on request
+
+Page-number pagination runs a ``COUNT(*)`` over the filtered articles
+and an ``OFFSET`` scan that gets slower the deeper the page. Clients
+that pass ``?pagination=cursor`` (or follow a ``cursor`` link) instead
+get keyset pages over (``published_at``, ``id``): each page is a single
+index range scan with no count query, no matter how deep it is.
+"""
+from base64 import b64decode, b64encode
+from datetime import datetime
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class ArticlePagination(PageNumberPagination):
+    """
+    Page-number pagination with an opt-in keyset cursor mode.
+
+    Cursor pages are always ordered newest first (``-published_at``,
+    then ``id``), which matches the article indexes; ``?ordering=`` is
+    ignored in cursor mode. Cursor pages only link forward.
+    """
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    cursor_ordering = ('-published_at', 'id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    def use_cursor(self, request):
+        """Whether ``request`` asked for keyset pagination."""
+        return (
+            self.cursor_query_param in request.query_params
+            or request.query_params.get(self.mode_query_param) == 'cursor'
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.cursor_mode = self.use_cursor(request)
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        queryset = queryset.order_by(*self.cursor_ordering)
+
+        token = request.query_params.get(self.cursor_query_param)
+        if token:
+            published_at, pk = self.decode_cursor(token)
+            # Written as a range plus an exclusion (rather than an OR) so
+            # the database can seek straight into the index
+            queryset = queryset.filter(published_at__lte=published_at).exclude(
+                published_at=published_at, pk__lte=pk
+            )
+
+        # Fetch one extra row to know whether there is a next page
+        results = list(queryset[:page_size + 1])
+        self.has_next = len(results) > page_size
+        results = results[:page_size]
+        self.next_cursor = self.encode_cursor(results[-1]) if self.has_next else None
+        return results
+
+    def encode_cursor(self, article):
+        """Build the opaque cursor pointing just after ``article`` (an instance or ``values()`` row)."""
+        if isinstance(article, dict):
+            published_at, pk = article['published_at'], article['id']
+        else:
+            published_at, pk = article.published_at, article.pk
+        position = f'{published_at.isoformat()}|{pk}'
+        return b64encode(position.encode('ascii')).decode('ascii')
+
+    def decode_cursor(self, token):
+        """Return ``(published_at, pk)`` from a cursor, or raise NotFound."""
+        try:
+            published_at, pk = b64decode(token.encode('ascii')).decode('ascii').split('|')
+            return datetime.fromisoformat(published_at), int(pk)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.cursor_mode:
+            return super().get_next_link()
+        if not self.next_cursor:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_html_context(self):
+        if not self.cursor_mode:
+            return super().get_html_context()
+        return {
+            'previous_url': None,
+            'next_url': self.get_next_link(),
+        }
+
+    def to_html(self):
+        if self.cursor_mode:
+            self.template = 'rest_framework/pagination/previous_and_next.html'
+        return super().to_html()
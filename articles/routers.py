@@ -0,0 +1,76 @@
+"""
+Read/write database routing for the Tech Pulse Articles API.
+
+With SQLite in WAL mode, readers on their own connection never wait
+for a writer. This module sends API reads to such a connection:
+- ReadReplicaRouter: Routes reads made inside ``replica_reads()`` to the
+  ``ARTICLE_READ_DATABASE`` alias, everything else to ``default``
+- replica_reads: Context manager marking the reads of this thread/task
+- ReplicaReadMixin: Runs a viewset's GET/HEAD requests inside ``replica_reads()``
+
+Only reads made while serving safe API requests are routed. Writers
+such as ``fetch_articles`` read and write through ``default``, so they
+always see their own uncommitted rows. Routing is off unless
+``ARTICLE_READ_DATABASE`` names a configured alias.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+
+
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+def read_database():
+    """The alias API reads go to, or None when routing is off."""
+    alias = getattr(settings, 'ARTICLE_READ_DATABASE', None)
+    return alias if alias and alias in settings.DATABASES else None
+
+
+@contextmanager
+def replica_reads():
+    """Route the reads made inside the block to the read database."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+class ReadReplicaRouter:
+    """
+    Send reads inside ``replica_reads()`` to the read database.
+
+    Writes always go to ``default``, and only ``default`` is migrated:
+    the read database is another connection to the same file.
+    """
+
+    def db_for_read(self, model, **hints):
+        if _replica_reads.get():
+            return read_database()
+        return None
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
+
+
+class ReplicaReadMixin:
+    """
+    Serve GET and HEAD requests of a viewset from the read database.
+
+    List first among the bases, so cache and ETag lookups are routed too.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+        with replica_reads():
+            return super().dispatch(request, *args, **kwargs)
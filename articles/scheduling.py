@@ -0,0 +1,58 @@
+"""
+Fetch scheduling policy for the Tech Pulse Articles Application.
+
+This module decides when a source should be fetched next:
+- next_fetch_time: Next due time after a fetch, with adaptive back-off
+- due_time: When a source is due, for sources never scheduled before
+
+Sources are fetched every ``fetch_interval`` minutes. Feeds that keep
+failing back off exponentially, and feeds that keep producing nothing
+new back off more gently, both capped at ``MAX_INTERVAL``. A single
+success with new articles resets the interval.
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+
+# Every failure doubles the interval, up to 2**MAX_BACKOFF_STEPS
+MAX_BACKOFF_STEPS = 5
+
+# Every IDLE_FETCHES_PER_STEP fetches without new articles double it once
+IDLE_FETCHES_PER_STEP = 3
+
+# No source waits longer than this (unless its own interval is longer)
+MAX_INTERVAL = timedelta(hours=24)
+
+
+def next_fetch_time(source, now=None):
+    """
+    Compute when ``source`` should next be fetched.
+
+    Args:
+        source: Source with up to date ``consecutive_failures`` and ``idle_fetches``
+        now: reference time (defaults to the current time)
+
+    Returns:
+        datetime: next due time
+    """
+    now = now or timezone.now()
+    interval = timedelta(minutes=max(1, source.fetch_interval))
+    steps = min(
+        source.consecutive_failures + source.idle_fetches // IDLE_FETCHES_PER_STEP,
+        MAX_BACKOFF_STEPS,
+    )
+    return now + min(interval * 2 ** steps, max(MAX_INTERVAL, interval))
+
+
+def due_time(source):
+    """
+    Return when ``source`` is due, falling back to ``last_fetched``
+    plus its interval for sources not yet scheduled. Sources that were
+    never fetched are due since they were created (i.e. right away).
+    """
+    if source.next_fetch_at:
+        return source.next_fetch_at
+    if source.last_fetched:
+        return source.last_fetched + timedelta(minutes=max(1, source.fetch_interval))
+    return source.created_at
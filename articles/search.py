@@ -0,0 +1,160 @@
+"""
+Full-text search for the Tech Pulse Articles API.
+
+This module replaces ``icontains`` scans over title/summary/content/author
+with the database's own full-text index:
+- SQLite: an FTS5 table (``articles_article_fts``) kept in sync by triggers
+- PostgreSQL: a generated, GIN-indexed ``tsvector`` column (``search_document``)
+- Anything else (or a database migrated without FTS5): DRF's SearchFilter
+
+Both indexes are created by migration ``0008_article_search`` and are
+maintained by the database itself, so bulk inserts and updates from
+the fetch commands stay searchable without extra work. On SQLite the
+content is stored compressed, so the FTS5 table is contentless and the
+triggers pass it text decompressed with ``tp_decompress()`` (see
+``articles.compression``).
+"""
+from django.db import connections
+from rest_framework import filters
+
+from .compression import CompressedTextField, stores_compressed
+
+
+FTS_TABLE = 'articles_article_fts'
+
+# Keep the FTS5 table in step with articles_article. Django drops them
+# whenever a migration rebuilds that table, so ensure_search_triggers
+# puts them back after every migrate.
+FTS_TRIGGERS = {
+    'articles_article_fts_ai': """
+        CREATE TRIGGER IF NOT EXISTS articles_article_fts_ai AFTER INSERT ON articles_article BEGIN
+            INSERT INTO articles_article_fts(rowid, title, summary, content, author)
+            VALUES (new.id, new.title, new.summary, tp_decompress(new.content), new.author);
+        END
+    """,
+    'articles_article_fts_ad': """
+        CREATE TRIGGER IF NOT EXISTS articles_article_fts_ad AFTER DELETE ON articles_article BEGIN
+            INSERT INTO articles_article_fts(articles_article_fts, rowid, title, summary, content, author)
+            VALUES ('delete', old.id, old.title, old.summary, tp_decompress(old.content), old.author);
+        END
+    """,
+    'articles_article_fts_au': """
+        CREATE TRIGGER IF NOT EXISTS articles_article_fts_au AFTER UPDATE OF title, summary, content, author
+        ON articles_article BEGIN
+            INSERT INTO articles_article_fts(articles_article_fts, rowid, title, summary, content, author)
+            VALUES ('delete', old.id, old.title, old.summary, tp_decompress(old.content), old.author);
+            INSERT INTO articles_article_fts(rowid, title, summary, content, author)
+            VALUES (new.id, new.title, new.summary, tp_decompress(new.content), new.author);
+        END
+    """,
+}
+
+_fts_tables = {}
+
+
+def has_fts_table(connection):
+    """Whether the SQLite database behind ``connection`` has the FTS5 table."""
+    if connection.alias not in _fts_tables:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [FTS_TABLE],
+            )
+            _fts_tables[connection.alias] = cursor.fetchone() is not None
+    return _fts_tables[connection.alias]
+
+
+def ensure_search_triggers(connection):
+    """
+    Recreate missing FTS5 triggers on SQLite and reindex.
+
+    Returns:
+        bool: whether any trigger was missing
+    """
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger') AND name IN (%s, %s, %s, %s)",
+            [FTS_TABLE, *FTS_TRIGGERS],
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        missing = [name for name in FTS_TRIGGERS if name not in existing]
+        if FTS_TABLE not in existing or not missing:
+            return False
+        for name in missing:
+            cursor.execute(FTS_TRIGGERS[name])
+        # Rows written while the triggers were gone are not indexed yet
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('delete-all')")
+        cursor.execute(
+            f'INSERT INTO {FTS_TABLE}(rowid, title, summary, content, author) '
+            'SELECT id, title, summary, tp_decompress(content), author FROM articles_article'
+        )
+    return True
+
+
+def fts5_query(terms):
+    """
+    Build an FTS5 MATCH expression requiring every term.
+
+    Terms are quoted so user input can never be parsed as FTS5 syntax.
+    """
+    return ' '.join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    ``?search=`` backed by a full-text index, with ranked results.
+
+    Every search term must match (in any indexed field). Unless the
+    client asked for an explicit ``?ordering=``, results are ordered by
+    relevance. Place this backend after ``OrderingFilter`` so the rank
+    ordering is applied last.
+    """
+
+    def get_search_fields(self, view, request):
+        """Leave out compressed columns, which ``icontains`` cannot search."""
+        search_fields = super().get_search_fields(view, request)
+        queryset = getattr(view, 'queryset', None)
+        if not search_fields or queryset is None or not stores_compressed(connections[queryset.db]):
+            return search_fields
+        compressed = {
+            field.name for field in queryset.model._meta.concrete_fields
+            if isinstance(field, CompressedTextField)
+        }
+        return [name for name in search_fields if name.lstrip('^=@$') not in compressed]
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        connection = connections[queryset.db]
+
+        if connection.vendor == 'sqlite' and has_fts_table(connection):
+            queryset = queryset.extra(
+                tables=[FTS_TABLE],
+                where=[
+                    f'{FTS_TABLE}.rowid = articles_article.id',
+                    f'{FTS_TABLE} MATCH %s',
+                ],
+                params=[fts5_query(terms)],
+                # bm25() is lower for better matches
+                select={'search_rank': f'bm25({FTS_TABLE}, 10.0, 5.0, 1.0, 2.0)'},
+            )
+            ranking = 'search_rank'
+        elif connection.vendor == 'postgresql':
+            query = ' '.join(terms)
+            queryset = queryset.extra(
+                where=["search_document @@ plainto_tsquery('english', %s)"],
+                params=[query],
+                select={'search_rank': "ts_rank(search_document, plainto_tsquery('english', %s))"},
+                select_params=[query],
+            )
+            ranking = '-search_rank'
+        else:
+            return super().filter_queryset(request, queryset, view)
+
+        if request.query_params.get(filters.OrderingFilter.ordering_param):
+            return queryset
+        return queryset.order_by(ranking, '-published_at')
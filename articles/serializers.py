@@ -6,6 +6,8 @@ model instances to JSON for API responses:
 - SourceSerializer: Serializes Source objects with article counts
 - CategorySerializer: Serializes Category objects with article counts
 - ArticleSerializer: Serializes Article objects with related data
+- ArticleListSerializer: Compact article representation for lists
+- ArchiveQuerySerializer: Validates the query of the article archive endpoint
 
 Serializers handle data validation and nested relationships.
 """
@@ -13,6 +15,21 @@ from rest_framework import serializers
 from .models import Source, Category, Article
 
 
+class SparseFieldsMixin:
+    """
+    Let callers restrict the serialized fields.
+
+    Pass ``fields=[...]`` to keep only those fields; unknown names are
+    ignored. Without it, every declared field is serialized.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
 class SourceSerializer(serializers.ModelSerializer):
     """
     Serializer for Source model.
@@ -38,7 +55,9 @@ class SourceSerializer(serializers.ModelSerializer):
     
     def get_article_count(self, obj):
         """Return count of articles from this source"""
-        return obj.articles.count()
+        # Annotated by the viewset; fall back for single saved objects
+        count = getattr(obj, 'num_articles', None)
+        return obj.articles.count() if count is None else count
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -62,10 +81,12 @@ class CategorySerializer(serializers.ModelSerializer):
     
     def get_article_count(self, obj):
         """Return count of articles in this category"""
-        return obj.articles.count()
+        # Annotated by the viewset; fall back for single saved objects
+        count = getattr(obj, 'num_articles', None)
+        return obj.articles.count() if count is None else count
 
 
-class ArticleSerializer(serializers.ModelSerializer):
+class ArticleSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Article model.
     Includes related source and category names.
@@ -90,6 +111,30 @@ class ArticleSerializer(serializers.ModelSerializer):
             'category_name',
             'published_at',
             'fetched_at',
-            'updated_at'
+            'updated_at',
+            'cluster_id'
         ]
-        read_only_fields = ['slug', 'fetched_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['slug', 'fetched_at', 'updated_at', 'cluster_id']
+
+
+class ArticleListSerializer(ArticleSerializer):
+    """
+    Serializer for Article lists.
+    Same as ArticleSerializer without the full ``content`` text.
+    """
+
+    class Meta(ArticleSerializer.Meta):
+        fields = [name for name in ArticleSerializer.Meta.fields if name != 'content']
+
+
+class ArchiveQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of ``/api/articles/archive/``.
+    Sources and categories are plain IDs: archived articles may refer
+    to rows that no longer exist.
+    """
+    output = serializers.ChoiceField(choices=['ndjson', 'csv'], default='ndjson')
+    published_after = serializers.DateTimeField(required=False)
+    published_before = serializers.DateTimeField(required=False)
+    source = serializers.IntegerField(required=False)
+    category = serializers.IntegerField(required=False)
@@ -0,0 +1,102 @@
+"""
+Signal handlers for the Tech Pulse Articles Application.
+
+This module keeps in-memory caches honest across processes:
+- Category rule changes bump the ``category_rules`` generation, so
+  running categorizers recompile their rules on next use
+- Source, category and article changes bump the ``api`` generation, so
+  cached API responses are never served after a write
+- Source and category renames and deletes, and article deletes, bump
+  the ``catalog`` generation, which article ETags depend on
+- Article deletes leave an ``ArticleTombstone`` for the changes feed
+- After ``migrate``, full-text triggers dropped by a table rebuild are
+  recreated (SQLite)
+
+Inside ``batched_article_deletes()`` the per-article delete handlers are
+skipped; the caller writes the tombstones and bumps the generations once
+per batch instead (see archive.py).
+
+Handlers are connected in ``ArticlesConfig.ready()``.
+"""
+import threading
+from contextlib import contextmanager
+
+from django.db import connections
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from .caching import invalidate_api_cache
+from .categorizer import RULES_GENERATION
+from .conditional import CATALOG_GENERATION
+from .models import Source, Category, CategoryRule, Article, ArticleTombstone, Generation
+from .search import ensure_search_triggers
+
+
+_batch = threading.local()
+
+
+@contextmanager
+def batched_article_deletes():
+    """Skip the per-article delete handlers on this thread inside the block."""
+    _batch.active = True
+    try:
+        yield
+    finally:
+        _batch.active = False
+
+
+def in_batched_delete(sender):
+    """Whether a delete of ``sender`` is part of a batched article delete."""
+    return sender is Article and getattr(_batch, 'active', False)
+
+
+@receiver(post_save, sender=CategoryRule)
+@receiver(post_delete, sender=CategoryRule)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_rules(sender, **kwargs):
+    """Mark compiled category rules as stale."""
+    Generation.bump(RULES_GENERATION)
+
+
+@receiver(post_save, sender=Source)
+@receiver(post_delete, sender=Source)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def invalidate_api_responses(sender, **kwargs):
+    """Mark cached API responses as stale."""
+    if not in_batched_delete(sender):
+        invalidate_api_cache()
+
+
+@receiver(post_save, sender=Source)
+@receiver(post_save, sender=Category)
+def invalidate_catalog_on_save(sender, update_fields=None, **kwargs):
+    """Mark article responses as changed when a source or category may have been renamed."""
+    if update_fields is None or 'name' in update_fields:
+        Generation.bump(CATALOG_GENERATION)
+
+
+@receiver(post_delete, sender=Source)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Article)
+def invalidate_catalog_on_delete(sender, **kwargs):
+    """Mark article responses as changed when rows they include are removed."""
+    if not in_batched_delete(sender):
+        Generation.bump(CATALOG_GENERATION)
+
+
+@receiver(post_delete, sender=Article)
+def record_article_tombstone(sender, instance, **kwargs):
+    """Remember a deleted article for clients syncing with the changes feed."""
+    if not in_batched_delete(sender):
+        ArticleTombstone.objects.create(article_id=instance.pk, url=instance.url)
+
+
+@receiver(post_migrate)
+def restore_search_triggers(sender, using='default', **kwargs):
+    """Put back the FTS5 triggers if a migration rebuilt the articles table."""
+    if sender.name == 'articles':
+        ensure_search_triggers(connections[using])
@@ -0,0 +1,221 @@
+"""
+Near-duplicate detection for the Tech Pulse Articles Application.
+
+The same wire story is often published by several sources under
+different URLs. This module groups such articles into clusters:
+- simhash: 64-bit SimHash over word shingles of title and summary
+- article_simhash: The stored (signed) fingerprint of an article's data
+- index_articles: Write the banded lookup rows of saved articles
+- assign_clusters: Put new articles in the cluster of their closest match
+- collapse_clusters: Keep one article per cluster in a queryset
+
+Fingerprints within ``MAX_DISTANCE`` bits of each other are duplicates.
+Each fingerprint is split into ``BANDS`` bands stored in
+ArticleSimhashBand; by the pigeonhole principle two fingerprints that
+close share at least one band exactly, so candidates come from an
+indexed lookup rather than a comparison against every article.
+"""
+import hashlib
+import re
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.db.models import Exists, OuterRef, Q
+from django.db.models.functions import Coalesce
+
+from .models import ArticleSimhashBand
+
+
+BITS = 64
+BANDS = 4
+BAND_BITS = BITS // BANDS
+
+# Fingerprints differing in at most this many bits are duplicates
+# (must stay below BANDS for the band lookup to find every match)
+MAX_DISTANCE = 3
+
+# Words per shingle, and the fewest words worth fingerprinting: very
+# short texts ("Weekly roundup") would match unrelated articles
+SHINGLE_SIZE = 3
+MIN_WORDS = 6
+
+# Only articles published this close together are compared
+WINDOW = timedelta(days=3)
+
+WORD_RE = re.compile(r'\w+')
+
+
+def shingles(text):
+    """Return the overlapping word ``SHINGLE_SIZE``-grams of ``text``."""
+    words = WORD_RE.findall(text.lower())
+    if len(words) < MIN_WORDS:
+        return []
+    return [' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+
+
+def simhash(text):
+    """
+    Compute the SimHash of ``text``.
+
+    Args:
+        text: plain text
+
+    Returns:
+        int: unsigned 64-bit fingerprint, or None for texts too short to compare
+    """
+    features = shingles(text)
+    if not features:
+        return None
+
+    weights = [0] * BITS
+    for feature in features:
+        value = int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def to_signed(value):
+    """Map an unsigned 64-bit fingerprint onto a signed BigIntegerField value."""
+    return value - (1 << BITS) if value >= 1 << (BITS - 1) else value
+
+
+def to_unsigned(value):
+    """Inverse of ``to_signed``."""
+    return value + (1 << BITS) if value < 0 else value
+
+
+def article_simhash(data):
+    """
+    Return the stored SimHash of an article's title and summary.
+
+    Args:
+        data: mapping with ``title`` and ``summary`` (None counts as empty)
+
+    Returns:
+        int: signed fingerprint, or None
+    """
+    value = simhash(f"{data.get('title') or ''} {data.get('summary') or ''}")
+    return None if value is None else to_signed(value)
+
+
+def bands(fingerprint):
+    """Split a stored fingerprint into ``BANDS`` ``(band, value)`` pairs."""
+    value = to_unsigned(fingerprint)
+    mask = (1 << BAND_BITS) - 1
+    return [(band, value >> (band * BAND_BITS) & mask) for band in range(BANDS)]
+
+
+def distance(a, b):
+    """Number of differing bits between two stored fingerprints."""
+    return (to_unsigned(a) ^ to_unsigned(b)).bit_count()
+
+
+def index_articles(articles, replace=False):
+    """
+    Write the band rows of saved articles.
+
+    Args:
+        articles: saved Article instances (those without a fingerprint are skipped)
+        replace: delete the articles' existing band rows first
+    """
+    articles = list(articles)
+    if replace:
+        ArticleSimhashBand.objects.filter(article_id__in=[article.pk for article in articles]).delete()
+    ArticleSimhashBand.objects.bulk_create([
+        ArticleSimhashBand(article_id=article.pk, band=band, value=value)
+        for article in articles
+        if article.simhash is not None
+        for band, value in bands(article.simhash)
+    ])
+
+
+def find_candidates(articles):
+    """
+    Load the indexed articles sharing a band with any of ``articles``.
+
+    Returns:
+        dict: ``(band, value)`` -> list of ``(id, simhash, cluster key, published_at)``
+    """
+    wanted = {}
+    for article in articles:
+        for band, value in bands(article.simhash):
+            wanted.setdefault(band, set()).add(value)
+
+    published = [article.published_at for article in articles]
+    rows = ArticleSimhashBand.objects.filter(
+        reduce(or_, (Q(band=band, value__in=values) for band, values in wanted.items())),
+        article__published_at__range=(min(published) - WINDOW, max(published) + WINDOW),
+    ).values_list(
+        'band', 'value', 'article_id', 'article__simhash', 'article__cluster_id', 'article__published_at',
+    )
+
+    candidates = {}
+    for band, value, pk, fingerprint, cluster_id, published_at in rows:
+        candidates.setdefault((band, value), []).append((pk, fingerprint, cluster_id or pk, published_at))
+    return candidates
+
+
+def assign_clusters(articles):
+    """
+    Cluster newly saved articles with the indexed articles and each other.
+
+    Each article joins the cluster of its closest indexed match (ties go
+    to the earliest article); articles without a match start their own
+    cluster (``cluster_id`` stays empty). Articles are handled in
+    primary key order and indexed as they go, so duplicates within the
+    batch are grouped too.
+
+    Args:
+        articles: saved Article instances with ``simhash`` set, not yet indexed
+
+    Returns:
+        list: the articles whose ``cluster_id`` was set
+    """
+    articles = sorted((article for article in articles if article.simhash is not None), key=lambda a: a.pk)
+    if not articles:
+        return []
+
+    candidates = find_candidates(articles)
+    clustered = []
+
+    for article in articles:
+        best = None
+        for key in bands(article.simhash):
+            for pk, fingerprint, cluster_key, published_at in candidates.get(key, ()):
+                if pk == article.pk or abs(published_at - article.published_at) > WINDOW:
+                    continue
+                bits = distance(article.simhash, fingerprint)
+                if bits <= MAX_DISTANCE and (best is None or (bits, pk) < best[:2]):
+                    best = (bits, pk, cluster_key)
+
+        if best is not None:
+            article.cluster_id = best[2]
+            clustered.append(article)
+
+        entry = (article.pk, article.simhash, article.cluster_id or article.pk, article.published_at)
+        for key in bands(article.simhash):
+            candidates.setdefault(key, []).append(entry)
+
+    index_articles(articles)
+    return clustered
+
+
+def collapse_clusters(queryset):
+    """
+    Keep only the earliest article (lowest ``id``) of each cluster in ``queryset``.
+
+    Args:
+        queryset: filtered Article queryset
+
+    Returns:
+        QuerySet: ``queryset`` without the later members of each cluster
+    """
+    cluster = Coalesce(OuterRef('cluster_id'), OuterRef('pk'))
+    earlier = queryset.order_by().filter(
+        Q(pk=cluster) | Q(cluster_id=cluster),
+        pk__lt=OuterRef('pk'),
+    )
+    return queryset.exclude(Exists(earlier))
@@ -0,0 +1,86 @@
+"""
+Unique slug allocation for the Tech Pulse Articles Application.
+
+Slugs are derived from a title or name. When that slug is already
+taken, a short deterministic hash of a unique key (the article URL or
+the category name) is appended instead of probing ``-1``, ``-2``, ...
+one query at a time:
+
+- unique_slugs: Allocate slugs for a batch of objects with one query
+- unique_slug: Convenience wrapper for a single object (used by save())
+
+The cost is a single ``slug IN (...)`` lookup per batch, regardless of
+how many articles already share the same title.
+"""
+import hashlib
+
+from django.utils.text import slugify
+
+
+HASH_LENGTH = 8
+
+
+def _suffix(key):
+    """Short, stable hash of ``key`` used to disambiguate slugs."""
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+
+
+def unique_slugs(model, items):
+    """
+    Allocate unique slugs for a batch of objects of ``model``.
+
+    Args:
+        model: model class with a unique ``slug`` field
+        items: list of ``(text, key)`` pairs, where ``text`` is slugified
+            and ``key`` is a value unique to the object (e.g. its URL)
+
+    Returns:
+        list: one slug per item, in the same order
+    """
+    max_length = model._meta.get_field('slug').max_length
+    base_length = max_length - HASH_LENGTH - 1
+
+    candidates = []
+    for text, key in items:
+        base = slugify(text)[:base_length].strip('-') or model._meta.model_name
+        candidates.append((base, _suffix(key or text)))
+
+    lookup = {slug for base, digest in candidates for slug in (base, f"{base}-{digest}")}
+    taken = set(model.objects.filter(slug__in=lookup).values_list('slug', flat=True))
+
+    slugs = []
+    for base, digest in candidates:
+        hashed = f"{base}-{digest}"
+        if base not in taken:
+            slug = base
+        elif hashed not in taken:
+            slug = hashed
+        else:
+            # Same title and same key seen before: extremely rare, so a
+            # query per attempt here does not matter for the common path.
+            # The base is shortened to leave room for the counter.
+            counter = 1
+            while True:
+                suffix = f"-{digest}-{counter}"
+                slug = base[:max_length - len(suffix)].rstrip('-') + suffix
+                if slug not in taken and not model.objects.filter(slug=slug).exists():
+                    break
+                counter += 1
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+def unique_slug(model, text, key=''):
+    """
+    Allocate a single unique slug.
+
+    Args:
+        model: model class with a unique ``slug`` field
+        text: title or name to slugify
+        key: value unique to the object, used for the hash suffix
+
+    Returns:
+        str: unique slug
+    """
+    return unique_slugs(model, [(text, key)])[0]
@@ -7,16 +7,37 @@ This module contains API viewsets for external access:
 - ArticleViewSet: CRUD operations for articles with filtering
 
 All viewsets use Django REST Framework's ModelViewSet for
-automatic CRUD endpoint generation.
+automatic CRUD endpoint generation. List and detail responses are
+cached until the next write (see caching.py), and carry ETag and
+Last-Modified validators for conditional requests (see conditional.py).
+GET requests read from ARTICLE_READ_DATABASE when set (see routers.py).
 """
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, filters
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
+from rest_framework.renderers import BrowsableAPIRenderer
 from django_filters.rest_framework import DjangoFilterBackend
+from .archive import read_archive
+from .caching import API_GENERATION, CachedResponseMixin
+from .changes import ChangesToken, changes_since
+from .conditional import CATALOG_GENERATION, ConditionalResponseMixin
+from .counts import with_article_counts
+from .export import EXPORT_FORMATS, export_lines
+from .fastpath import ArticleRows, FastJSONRenderer, FastListMixin
+from .filters import ArticleFilter
 from .models import Source, Category, Article
-from .serializers import SourceSerializer, CategorySerializer, ArticleSerializer
+from .pagination import ArticlePagination
+from .routers import ReplicaReadMixin
+from .search import FullTextSearchFilter
+from .serializers import (
+    SourceSerializer, CategorySerializer, ArticleSerializer, ArticleListSerializer, ArchiveQuerySerializer,
+)
 
 
-class SourceViewSet(viewsets.ModelViewSet):
+class SourceViewSet(ReplicaReadMixin, CachedResponseMixin, ConditionalResponseMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing news sources.
     
@@ -34,9 +55,14 @@ class SourceViewSet(viewsets.ModelViewSet):
     search_fields = ['name', 'url']
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
+    conditional_generations = [API_GENERATION]
+    
+    def get_queryset(self):
+        """Count articles for the whole page in the list query itself."""
+        return with_article_counts(super().get_queryset())
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(ReplicaReadMixin, CachedResponseMixin, ConditionalResponseMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing article categories.
     
@@ -54,9 +80,16 @@ class CategoryViewSet(viewsets.ModelViewSet):
     search_fields = ['name', 'description']
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
+    conditional_generations = [API_GENERATION]
+    
+    def get_queryset(self):
+        """Count articles for the whole page in the list query itself."""
+        return with_article_counts(super().get_queryset())
 
 
-class ArticleViewSet(viewsets.ModelViewSet):
+class ArticleViewSet(
+    ReplicaReadMixin, CachedResponseMixin, ConditionalResponseMixin, FastListMixin, viewsets.ModelViewSet
+):
     """
     API endpoint for managing articles.
     
@@ -66,15 +99,163 @@ class ArticleViewSet(viewsets.ModelViewSet):
     - POST /api/articles/ - Create article (admin only)
     - PUT /api/articles/{id}/ - Update article (admin only)
     - DELETE /api/articles/{id}/ - Delete article (admin only)
+    - GET /api/articles/export/ - Stream all matching articles as NDJSON or CSV
+    - GET /api/articles/changes/ - Articles created, updated or deleted since a token
+    - GET /api/articles/archive/ - Stream archived articles by publication date
     
     Supports filtering by source, category, and date.
-    Supports searching by title, content, and author.
+    Supports ranked full-text search over title, summary, content, and author.
+    Supports ?pagination=cursor for constant-time keyset pages.
+    Lists omit ``content`` unless ?expand=content; ?fields=id,title,...
+    selects fields. Columns that are not serialized are never loaded.
+    Lists skip DRF serialization with ARTICLE_FAST_SERIALIZATION = True.
+    ?collapse=cluster shows one article per near-duplicate cluster, and
+    ?cluster=<id> lists a cluster's articles.
     """
     queryset = Article.objects.select_related('source', 'category').all()
     serializer_class = ArticleSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['source', 'category', 'published_at']
+    pagination_class = ArticlePagination
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    # Search runs last so relevance ordering wins over the default ordering
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, FullTextSearchFilter]
+    filterset_class = ArticleFilter
     search_fields = ['title', 'content', 'summary', 'author']
     ordering_fields = ['published_at', 'fetched_at', 'title']
-    ordering = ['-published_at']
\ No newline at end of file
+    ordering = ['-published_at']
+    conditional_generations = [CATALOG_GENERATION]
+    export_chunk_size = 2000
+    changes_page_size = 100
+    changes_max_page_size = 1000
+    # Needed by pagination cursors and select_related whatever is serialized
+    always_loaded_fields = {'id', 'published_at', 'source', 'category'}
+
+    def get_query_list(self, name):
+        """Return the comma-separated values of query parameter ``name``, or None."""
+        value = self.request.query_params.get(name)
+        if value is None:
+            return None
+        return [item.strip() for item in value.split(',') if item.strip()]
+
+    def get_requested_fields(self):
+        """Return the ?fields= selection for read requests, or None for all fields."""
+        if self.request is None or self.request.method not in ('GET', 'HEAD'):
+            return None
+        return self.get_query_list('fields')
+
+    def get_serializer_class(self):
+        """Use the compact serializer for lists unless content was asked for."""
+        if self.action == 'list':
+            wanted = (self.get_query_list('expand') or []) + (self.get_requested_fields() or [])
+            if 'content' not in wanted:
+                return ArticleListSerializer
+        return super().get_serializer_class()
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault('fields', self.get_requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        """Defer the columns the response will not include."""
+        queryset = super().get_queryset()
+        if self.action not in ('list', 'retrieve'):
+            return queryset
+
+        serializer_class = self.get_serializer_class()
+        names = self.get_requested_fields() or serializer_class.Meta.fields
+        declared = serializer_class._declared_fields
+        needed = {
+            declared[name].source.split('.')[0] if name in declared else name
+            for name in names
+        } | self.always_loaded_fields
+        deferred = [
+            field.name for field in Article._meta.concrete_fields
+            if field.name not in needed
+        ]
+        return queryset.defer(*deferred) if deferred else queryset
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Stream every article matching the filters, oldest first.
+
+        ``?output=ndjson`` (default) or ``?output=csv``. Rows are ordered
+        by ``id``; pass the last exported ``id`` as ``?since=`` to fetch
+        only newer articles next time. Supports ``?fields=``.
+        """
+        output = request.query_params.get('output', 'ndjson')
+        if output not in EXPORT_FORMATS:
+            raise ValidationError({'output': f'Choose one of: {", ".join(EXPORT_FORMATS)}.'})
+
+        queryset = DjangoFilterBackend().filter_queryset(request, self.get_queryset(), self)
+        rows = ArticleRows(self.get_serializer().fields)
+        records = rows.queryset(queryset).order_by('id').iterator(chunk_size=self.export_chunk_size)
+
+        response = StreamingHttpResponse(
+            export_lines(map(rows.to_representation, records), rows.field_names, output),
+            content_type=EXPORT_FORMATS[output],
+        )
+        response['Content-Disposition'] = f'attachment; filename="articles.{output}"'
+        return response
+
+    @action(detail=False, methods=['get'])
+    def changes(self, request):
+        """
+        Return articles created, updated or deleted since ``?since=``.
+
+        Without a token every article is returned (as ``created``), then
+        only later changes. Keep the returned ``next`` token and poll
+        with it; ``has_more`` means another page is ready now.
+        ``?limit=`` sets the page size. Supports ``?fields=``.
+        """
+        since = request.query_params.get('since')
+        try:
+            token = ChangesToken.decode(since) if since else ChangesToken.start()
+        except ValueError as exc:
+            raise ValidationError({'since': str(exc)})
+        try:
+            limit = int(request.query_params.get('limit', self.changes_page_size))
+        except ValueError:
+            raise ValidationError({'limit': 'A valid integer is required.'})
+        limit = max(1, min(limit, self.changes_max_page_size))
+
+        rows = ArticleRows(self.get_serializer().fields, extra_columns=('updated_at', 'fetched_at'))
+        changes, next_token, has_more = changes_since(token, rows, limit)
+        return Response({
+            'next': next_token.encode(),
+            'has_more': has_more,
+            'changes': changes,
+        })
+
+    @action(detail=False, methods=['get'])
+    def archive(self, request):
+        """
+        Stream articles moved out of the database by ``archive_articles``.
+
+        ``?published_after=`` (inclusive) and ``?published_before=``
+        (exclusive) select the range, and only the monthly segments
+        overlapping it are read. Also takes ``?source=``, ``?category=``
+        and ``?output=ndjson`` (default) or ``csv``. Articles are
+        ordered by month, oldest first.
+        """
+        query = ArchiveQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        output = params['output']
+
+        matches = read_archive(
+            start=params.get('published_after'),
+            end=params.get('published_before'),
+            source=params.get('source'),
+            category=params.get('category'),
+        )
+        if output == 'csv':
+            lines = export_lines((article for _, article in matches), ArticleSerializer.Meta.fields, output)
+        else:
+            # Segment lines are already NDJSON; pass them through untouched
+            lines = (line for line, _ in matches)
+
+        response = StreamingHttpResponse(lines, content_type=EXPORT_FORMATS[output])
+        response['Content-Disposition'] = f'attachment; filename="articles-archive.{output}"'
+        return response
+
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -45,6 +46,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'articles.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -77,13 +79,54 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
+# SQLite production profile. Every connection runs these pragmas: WAL lets
+# API readers proceed while fetch_articles writes, synchronous=NORMAL is
+# durable in WAL mode at a fraction of the fsyncs, and busy_timeout makes
+# a writer wait for another writer instead of failing with "database is
+# locked". IMMEDIATE transactions take the write lock up front, so they
+# wait for it too rather than failing when a read turns into a write.
+SQLITE_PRAGMAS = [
+    'PRAGMA journal_mode = WAL',
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA busy_timeout = 5000',
+    'PRAGMA mmap_size = 268435456',  # 256 MiB
+    'PRAGMA cache_size = -32000',  # 32 MiB
+]
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        'OPTIONS': {
+            'init_command': ';'.join(SQLITE_PRAGMAS),
+            'transaction_mode': 'IMMEDIATE',
+        },
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+    },
 }
 
+# Optional read routing, off unless TECHPULSE_READ_REPLICA=1 adds 'replica':
+# a second connection to the same file that can only read, for API reads
+# when ARTICLE_READ_DATABASE names it (articles.routers). Tests then run
+# against an on-disk database, so the concurrency tests see the same file
+# locking as production.
+READ_REPLICA = os.environ.get('TECHPULSE_READ_REPLICA') == '1'
+
+if READ_REPLICA:
+    DATABASES['default']['TEST'] = {'NAME': BASE_DIR / 'test_db.sqlite3'}
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': DATABASES['default']['NAME'],
+        'OPTIONS': {
+            'init_command': ';'.join(SQLITE_PRAGMAS[1:] + ['PRAGMA query_only = ON']),
+        },
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_ROUTERS = ['articles.routers.ReadReplicaRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -130,3 +173,53 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ],
 }
+
+
+# Tech Pulse
+
+# Read article counts for sources/categories from the stored article_count
+# columns instead of aggregating them per request. Keep them accurate with
+# `python manage.py recount_articles` if articles are edited outside fetches.
+ARTICLE_COUNTS_DENORMALIZED = False
+
+# Cached API responses are keyed on a generation counter stored in the
+# database, so a per-process local-memory cache never serves stale data
+# after a write. Point API_CACHE_ALIAS at a shared backend (file, Redis,
+# Memcached) to share cached responses between processes.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'tech-pulse',
+    },
+}
+API_CACHE_ALIAS = 'default'
+API_CACHE_TIMEOUT = 600  # seconds
+
+# Build article list responses from queryset.values() rows and encode them
+# with orjson (if installed) instead of running ArticleSerializer field by
+# field. The JSON is byte-identical either way.
+ARTICLE_FAST_SERIALIZATION = False
+
+# The changes feed (/api/articles/changes/) holds back rows changed in the
+# last few seconds, so writes still being committed are not skipped.
+ARTICLE_CHANGES_SETTLE_SECONDS = 5
+
+# archive_articles moves articles published more than ARTICLE_RETENTION_DAYS
+# ago (None: keep everything; Source.retention_days overrides it) out of the
+# database into gzipped JSON lines files, one per month, in this directory.
+# /api/articles/archive/ streams them back.
+ARTICLE_RETENTION_DAYS = None
+ARTICLE_ARCHIVE_DIR = BASE_DIR / 'archive'
+
+# Article.content is stored compressed (except on PostgreSQL, which
+# compresses large text itself): 'zlib', or 'zstd' with the zstandard
+# package installed. ARTICLE_CONTENT_DICTIONARY is an optional dictionary
+# file made by `manage.py compress_content --train`; keep older *.dict
+# files in the same directory until `compress_content` has rewritten the
+# rows that use them.
+ARTICLE_CONTENT_COMPRESSION = 'zlib'
+ARTICLE_CONTENT_DICTIONARY = None
+
+# Database alias that API GET requests read from (see READ_REPLICA above);
+# None reads from 'default'. Writes always go to 'default'.
+ARTICLE_READ_DATABASE = None
@@ -5,10 +5,13 @@ Main URL routing for Tech Pulse:
 - /admin/ - Django admin panel
 - /api/ - REST API endpoints (articles app)
 - /api-auth/ - DRF login/logout views
+- /metrics - Prometheus metrics (restrict access at the load balancer)
 """
 from django.contrib import admin
 from django.urls import path, include
 
+from articles.metrics import metrics_view
+
 urlpatterns = [
     # Django admin panel
     path('admin/', admin.site.urls),
@@ -18,4 +21,7 @@ urlpatterns = [
     
     # DRF browsable API authentication
     path('api-auth/', include('rest_framework.urls')),
+    
+    # Prometheus scrape endpoint
+    path('metrics', metrics_view, name='metrics'),
 ]
\ No newline at end of file